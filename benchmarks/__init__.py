@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+# Medições de desempenho do projeto. Os scripts rodam a partir da pasta raiz,
+# tanto como arquivo ("python benchmarks/bench_core.py") quanto como módulo
+# ("python -m benchmarks.bench_core"); os dados sintéticos ficam em `dados.py`.
@@ -0,0 +1,98 @@
+# benchmarks/bench_armazenamento.py
+"""
+Compara o `ArmazenamentoDuravel` (log + snapshot binário) com o jeito
+"ingênuo" de persistir: `json.dump` da lista inteira a cada alteração e
+`json.load` na abertura.
+
+Medimos:
+- abertura: `json.load` da lista x `carregar()` (snapshot via mmap + log vazio,
+  incluindo a montagem dos índices do `PontoStore`) x apenas mapear o snapshot
+  (`SnapshotMapeado`) x mapear e decodificar todos os registros em dicionários;
+- escrita: atualizações de status por segundo.
+
+Uso (na pasta raiz do projeto): "python benchmarks/bench_armazenamento.py [tamanho ...]"
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from armazenamento import ArmazenamentoDuravel, SnapshotMapeado
+from core import STATUS_VALIDOS
+from benchmarks.dados import gerar_pontos
+
+ESCRITAS_LOG = 20000
+ESCRITAS_JSON = 5  # cada uma regrava o arquivo inteiro, então poucas já bastam
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def medir(tamanho: int, pasta: str):
+    pontos = gerar_pontos(tamanho)
+    caminho_json = os.path.join(pasta, 'pontos.json')
+    aleatorio = random.Random(1)
+
+    # Escrita ingênua: a lista inteira é regravada a cada alteração.
+    inicio = time.perf_counter()
+    for _ in range(ESCRITAS_JSON):
+        indice = aleatorio.randrange(tamanho)
+        pontos[indice] = {**pontos[indice], 'status': 'resolvido'}
+        with open(caminho_json, 'w', encoding='utf-8') as arquivo:
+            json.dump(pontos, arquivo, ensure_ascii=False)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+    escrita_json = ESCRITAS_JSON / (time.perf_counter() - inicio)
+
+    def carregar_json():
+        with open(caminho_json, encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    abertura_json, _ = cronometrar(carregar_json)
+
+    # Armazenamento durável: snapshot inicial e depois só o log cresce.
+    diretorio = os.path.join(pasta, 'duravel')
+    armazenamento = ArmazenamentoDuravel(diretorio, lote_fsync=100)
+    armazenamento.compactar(pontos)
+    armazenamento.fechar()
+
+    armazenamento = ArmazenamentoDuravel(diretorio, lote_fsync=100)
+    abertura_mmap, store = cronometrar(armazenamento.carregar)
+    inicio = time.perf_counter()
+    for _ in range(ESCRITAS_LOG):
+        store.atualizar(aleatorio.randint(1, tamanho), status=aleatorio.choice(STATUS_VALIDOS))
+    armazenamento.sincronizar()
+    escrita_log = ESCRITAS_LOG / (time.perf_counter() - inicio)
+    armazenamento.compactar(store)
+    armazenamento.fechar()
+
+    def so_mapear():
+        with SnapshotMapeado(armazenamento.caminho_snapshot) as snapshot:
+            return snapshot[len(snapshot) - 1]
+    abertura_lazy, _ = cronometrar(so_mapear)
+
+    def decodificar_tudo():
+        with SnapshotMapeado(armazenamento.caminho_snapshot) as snapshot:
+            return list(snapshot)
+    decodificacao, _ = cronometrar(decodificar_tudo)
+
+    print(f"{tamanho:>9} | abertura json.load {abertura_json:8.3f}s | carregar() {abertura_mmap:8.3f}s"
+          f" | só mmap {abertura_lazy * 1000:7.3f}ms | mmap + decodificar tudo {decodificacao:8.3f}s")
+    print(f"{'':>9} | escrita json.dump {escrita_json:10.1f} op/s | log (fsync a cada 100) {escrita_log:10.0f} op/s")
+
+
+def main(tamanhos: list[int]):
+    with tempfile.TemporaryDirectory() as pasta:
+        for tamanho in tamanhos:
+            medir(tamanho, pasta)
+
+
+if __name__ == "__main__":
+    main([int(argumento) for argumento in sys.argv[1:]] or [10**5, 10**6])
@@ -0,0 +1,270 @@
+# benchmarks/bench_core.py
+"""
+Mede o tempo e o pico de memória de cada função do `src/core.py`, sobre os
+dados sintéticos de `benchmarks/dados.py`, numa lista comum e no
+`PontoStore` (que usa os índices e agregados por baixo).
+
+O resultado pode ser salvo em JSON, junto com o commit atual, e comparado
+com o de outro commit para achar regressões:
+
+    python benchmarks/bench_core.py --tamanhos 1000,100000 --saida antes.json
+    (muda o código)
+    python benchmarks/bench_core.py --tamanhos 1000,100000 --saida depois.json --comparar antes.json
+
+Com `--comparar`, o script termina com código 1 se alguma função ficou mais
+lenta que o `--limiar` (padrão: 25%). A comparação usa o menor tempo de cada
+função, que sofre bem menos com o ruído da máquina que a mediana, e desconta
+a diferença de velocidade da própria máquina entre as duas execuções (medida
+por uma `calibracao_ms` fixa, salva junto). As funções que tratam um ponto
+por vez (`validar_ponto`, `normalizar_bairro` ...) são medidas sobre uma
+amostra fixa de 1000 pontos, então o tempo delas é "por 1000 chamadas". O pico de memória
+é medido com `tracemalloc` em uma execução separada (o `tracemalloc` deixa
+tudo mais lento).
+
+Uso (na pasta raiz do projeto):
+    "python benchmarks/bench_core.py [--tamanhos 1000,10000,100000] [--colecoes lista,store]
+                                     [--saida arquivo.json] [--comparar anterior.json] [--limiar 1.25]"
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from core import (
+    Consulta,
+    validar_ponto,
+    normalizar_bairro,
+    filtrar_pontos_por_bairro,
+    filtrar_pontos_por_criticidade,
+    atualizar_status_pontos,
+    atualizar_status_em_lote,
+    atualizar_status_por_id,
+    buscar_ponto_por_id,
+    gerar_proximo_id,
+    gerar_relatorio_por_bairro,
+    iterar_pontos_por_bairro,
+    iterar_pontos_por_criticidade,
+    iterar_pontos_por_status,
+    classificar_nivel_criticidade,
+    chave_ordem_bairro,
+    listar_bairros,
+    inicios_de_palavra,
+    sugerir_bairros,
+    gerar_relatorio_por_bairro_e_status,
+    gerar_relatorio_por_bairro_e_nivel,
+    criar_filtro_por_status,
+    agrupar_bairros,
+    inserir_ponto,
+)
+from indices import PontoStore
+from benchmarks.dados import BAIRROS, EXPOENTE_ZIPF, gerar_pontos
+
+TAMANHO_AMOSTRA = 1000
+TEMPO_MINIMO = 0.2   # segundos medidos por função (no mínimo REPETICOES_MINIMAS execuções)
+REPETICOES_MINIMAS = 3
+REPETICOES_MAXIMAS = 1000
+
+COLECOES = {
+    'lista': lambda pontos: pontos,
+    'store': PontoStore,
+}
+
+
+def _contar(iterador) -> int:
+    return sum(1 for _ in iterador)
+
+
+# nome -> função que recebe `(pontos, amostra)` e faz a chamada medida.
+# `amostra` são os primeiros TAMANHO_AMOSTRA pontos, para as funções de um ponto por vez.
+CONSULTA_DESPACHO = Consulta().com_status('pendente').com_criticidade(8, 10).ordenar_por('criticidade', True).limitar(50)
+FILTRO_PENDENTES = criar_filtro_por_status('pendente')
+# Três grafias de cada bairro, nos dois formatos de contagem que o `agrupar_bairros` recebe.
+GRAFIAS = {grafia: 1 for bairro in BAIRROS for grafia in (bairro, bairro.upper(), normalizar_bairro(bairro))}
+GRAFIAS_E_STATUS = {grafia: {'pendente': 2, 'resolvido': 1} for grafia in GRAFIAS}
+# IDs acima de qualquer tamanho medido: o `PontoStore` recusaria um ID repetido entre as execuções.
+NOVOS_IDS = itertools.count(10 ** 9)
+CASOS = {
+    'validar_ponto': lambda pontos, amostra: [validar_ponto(ponto) for ponto in amostra],
+    'normalizar_bairro': lambda pontos, amostra: [normalizar_bairro(ponto['bairro']) for ponto in amostra],
+    'classificar_nivel_criticidade': lambda pontos, amostra: [classificar_nivel_criticidade(ponto['criticidade'])
+                                                              for ponto in amostra],
+    'chave_ordem_bairro': lambda pontos, amostra: [chave_ordem_bairro(ponto['bairro']) for ponto in amostra],
+    'inicios_de_palavra': lambda pontos, amostra: [inicios_de_palavra(normalizar_bairro(ponto['bairro']))
+                                                   for ponto in amostra],
+    'Consulta.executar': lambda pontos, amostra: CONSULTA_DESPACHO.executar(pontos),
+    'filtrar_pontos_por_bairro': lambda pontos, amostra: filtrar_pontos_por_bairro(pontos, 'vicente pinzon'),
+    'filtrar_pontos_por_criticidade': lambda pontos, amostra: filtrar_pontos_por_criticidade(pontos, 8, 10),
+    'criar_filtro_por_status': lambda pontos, amostra: FILTRO_PENDENTES(pontos),
+    'iterar_pontos_por_bairro': lambda pontos, amostra: _contar(iterar_pontos_por_bairro(pontos, 'Centro')),
+    'iterar_pontos_por_criticidade': lambda pontos, amostra: _contar(iterar_pontos_por_criticidade(pontos, 1, 3)),
+    'iterar_pontos_por_status': lambda pontos, amostra: _contar(iterar_pontos_por_status(pontos, 'resolvido')),
+    'atualizar_status_pontos': lambda pontos, amostra: atualizar_status_pontos(pontos, lambda ponto: ponto),
+    # As mudanças de status repetem o status que o ponto já tem, para todas as execuções medirem o mesmo trabalho.
+    'atualizar_status_em_lote': lambda pontos, amostra: atualizar_status_em_lote(
+        pontos, [(ponto['id'], ponto['status']) for ponto in amostra[:100]]),
+    'atualizar_status_por_id': lambda pontos, amostra: atualizar_status_por_id(pontos, amostra[-1]['id'],
+                                                                               amostra[-1]['status']),
+    'buscar_ponto_por_id': lambda pontos, amostra: buscar_ponto_por_id(pontos, len(pontos)),
+    'gerar_proximo_id': lambda pontos, amostra: gerar_proximo_id(pontos),
+    'gerar_relatorio_por_bairro': lambda pontos, amostra: gerar_relatorio_por_bairro(pontos),
+    'gerar_relatorio_por_bairro_e_status': lambda pontos, amostra: gerar_relatorio_por_bairro_e_status(pontos),
+    'gerar_relatorio_por_bairro_e_nivel': lambda pontos, amostra: gerar_relatorio_por_bairro_e_nivel(pontos),
+    'listar_bairros': lambda pontos, amostra: listar_bairros(pontos),
+    'sugerir_bairros': lambda pontos, amostra: sugerir_bairros(pontos, 'ja'),
+    'agrupar_bairros': lambda pontos, amostra: (agrupar_bairros(GRAFIAS), agrupar_bairros(GRAFIAS_E_STATUS)),
+    # Por último: no `PontoStore` cada execução cadastra um ponto a mais (na lista, cria uma lista nova).
+    'inserir_ponto': lambda pontos, amostra: inserir_ponto(pontos, {**amostra[0], 'id': next(NOVOS_IDS)}),
+}
+# Estas não dependem da coleção: medimos só uma vez, na lista.
+POR_PONTO = {'validar_ponto', 'normalizar_bairro', 'classificar_nivel_criticidade', 'chave_ordem_bairro',
+             'inicios_de_palavra', 'agrupar_bairros'}
+
+
+def cronometrar(chamada) -> dict:
+    """Executa `chamada` até somar TEMPO_MINIMO segundos; tempos em milissegundos."""
+    chamada()  # aquecimento (lru_cache, índices preguiçosos ...)
+    tempos, total = [], 0.0
+    while len(tempos) < REPETICOES_MINIMAS or (total < TEMPO_MINIMO and len(tempos) < REPETICOES_MAXIMAS):
+        inicio = time.perf_counter()
+        chamada()
+        duracao = time.perf_counter() - inicio
+        tempos.append(duracao * 1000)
+        total += duracao
+    return {'mediana_ms': statistics.median(tempos), 'minimo_ms': min(tempos), 'repeticoes': len(tempos)}
+
+
+def _carga_calibracao():
+    contagens = {}
+    for numero in range(200_000):
+        contagens[numero % 97] = contagens.get(numero % 97, 0) + 1
+    return contagens
+
+
+def calibracao_ms() -> float:
+    """Tempo de uma carga fixa (laço com dicionário), para descontar a velocidade da máquina na comparação."""
+    return cronometrar(_carga_calibracao)['minimo_ms']
+
+
+def pico_memoria_kb(chamada) -> float:
+    """Quanto a memória alocada subiu, no máximo, durante uma chamada."""
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        chamada()
+        return (tracemalloc.get_traced_memory()[1] - antes) / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def commit_atual() -> str:
+    """Hash curto do commit, com '-dirty' se há mudanças não commitadas."""
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconhecido'
+
+
+def medir(tamanhos: list[int], colecoes: list[str]) -> list[dict]:
+    resultados = []
+    for tamanho in tamanhos:
+        pontos = gerar_pontos(tamanho)
+        amostra = pontos[:TAMANHO_AMOSTRA]
+        for nome_colecao in colecoes:
+            colecao = COLECOES[nome_colecao](pontos)
+            for nome, caso in CASOS.items():
+                if nome in POR_PONTO and nome_colecao != 'lista':
+                    continue
+                chamada = lambda: caso(colecao, amostra)
+                resultado = {'funcao': nome, 'colecao': nome_colecao, 'tamanho': tamanho, **cronometrar(chamada),
+                             'pico_memoria_kb': pico_memoria_kb(chamada)}
+                resultados.append(resultado)
+                print(f"{tamanho:>9} {nome_colecao:<6} {nome:<38} {resultado['mediana_ms']:>10.3f} ms"
+                      f" {resultado['pico_memoria_kb']:>11.1f} KiB", flush=True)
+            del colecao
+    return resultados
+
+
+def _chave(resultado: dict) -> tuple:
+    return resultado['funcao'], resultado['colecao'], resultado['tamanho']
+
+
+def comparar(execucao: dict, anterior: dict, limiar: float) -> int:
+    """Mostra a razão entre os menores tempos (novo / anterior) e retorna quantas funções pioraram além do limiar."""
+    base = {_chave(resultado): resultado for resultado in anterior['resultados']}
+    # Se a máquina inteira está 10% mais lenta agora, todos os tempos são divididos por 1.1.
+    velocidade = execucao['calibracao_ms'] / anterior['calibracao_ms']
+    print(f"\nComparação com {anterior['commit']} (razão > {limiar:.2f} conta como regressão; "
+          f"máquina x{velocidade:.2f} em relação à execução anterior, já descontado):")
+    regressoes = 0
+    for resultado in execucao['resultados']:
+        antigo = base.get(_chave(resultado))
+        if antigo is None or not antigo['minimo_ms']:
+            continue
+        razao = resultado['minimo_ms'] / antigo['minimo_ms'] / velocidade
+        marca = ''
+        if razao > limiar:
+            regressoes += 1
+            marca = '  <- REGRESSÃO'
+        elif razao < 1 / limiar:
+            marca = '  (melhorou)'
+        print(f"{resultado['tamanho']:>9} {resultado['colecao']:<6} {resultado['funcao']:<38} "
+              f"{antigo['minimo_ms']:>10.3f} -> {resultado['minimo_ms']:>10.3f} ms  x{razao:.2f}{marca}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks das funções do src/core.py.")
+    parser.add_argument('--tamanhos', default='1000,10000,100000',
+                        help="quantidades de pontos, separadas por vírgula (até 10000000)")
+    parser.add_argument('--colecoes', default='lista,store', help="lista, store ou as duas")
+    parser.add_argument('--saida', help="arquivo JSON onde salvar os resultados")
+    parser.add_argument('--comparar', help="JSON de uma execução anterior, para comparar")
+    parser.add_argument('--limiar', type=float, default=1.25, help="razão de tempo que conta como regressão")
+    argumentos = parser.parse_args()
+
+    tamanhos = [int(tamanho) for tamanho in argumentos.tamanhos.split(',')]
+    colecoes = argumentos.colecoes.split(',')
+    for colecao in colecoes:
+        if colecao not in COLECOES:
+            parser.error(f"coleção desconhecida: '{colecao}'")
+
+    print(f"{'tamanho':>9} {'coleção':<6} {'função':<38} {'mediana':>13} {'pico de memória':>15}")
+    calibracao_inicio = calibracao_ms()
+    resultados = medir(tamanhos, colecoes)
+    execucao = {
+        # Calibramos antes e depois: a velocidade da máquina pode mudar durante a execução.
+        'calibracao_ms': min(calibracao_inicio, calibracao_ms()),
+        'commit': commit_atual(),
+        'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'expoente_zipf': EXPOENTE_ZIPF,
+        'bairros': len(BAIRROS),
+        'resultados': resultados,
+    }
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(execucao, arquivo, ensure_ascii=False, indent=2)
+        print(f"\nResultados salvos em {argumentos.saida} (commit {execucao['commit']}).")
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding='utf-8') as arquivo:
+            regressoes = comparar(execucao, json.load(arquivo), argumentos.limiar)
+        if regressoes:
+            print(f"\n{regressoes} regressão(ões) encontrada(s).")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
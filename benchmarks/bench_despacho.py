@@ -0,0 +1,59 @@
+# benchmarks/bench_despacho.py
+"""
+Compara a fila de despacho (`src/despacho.py`) com o jeito antigo de achar
+os próximos K pontos pendentes: filtrar por status e ordenar tudo.
+
+Uso (na pasta raiz do projeto): "python benchmarks/bench_despacho.py [quantidade]"
+"""
+import sys
+import time
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from core import criar_filtro_por_status, atualizar_status_por_id
+from indices import PontoStore
+from despacho import FilaDespacho
+from benchmarks.dados import gerar_pontos
+
+REPETICOES = 20
+
+
+def filtrar_e_ordenar(pontos, k: int) -> list[dict]:
+    pendentes = criar_filtro_por_status('pendente')(pontos)
+    return sorted(pendentes, key=lambda ponto: -ponto['criticidade'])[:k]
+
+
+def cronometrar(funcao) -> float:
+    """Tempo médio de uma chamada, em milissegundos."""
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        funcao()
+    return (time.perf_counter() - inicio) / REPETICOES * 1000
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pontos = gerar_pontos(quantidade)
+    store = PontoStore(pontos)
+
+    inicio = time.perf_counter()
+    fila = store.observar(FilaDespacho(store))
+    print(f"{quantidade} pontos ({len(fila)} pendentes); montar a fila: {time.perf_counter() - inicio:.2f} s")
+
+    # Algumas equipes despachadas, para que a fila tenha entradas inválidas.
+    for ponto in fila.top_k(1000):
+        atualizar_status_por_id(store, ponto['id'], 'em_atendimento')
+
+    print(f"{'k':>6} {'lista (ms)':>12} {'armazém (ms)':>13} {'fila (ms)':>10} {'fila/bairro (ms)':>17}")
+    for k in [1, 10, 100, 1000]:
+        assert fila.top_k(k) == filtrar_e_ordenar(store, k)
+        lista = cronometrar(lambda: filtrar_e_ordenar(pontos, k))
+        armazem = cronometrar(lambda: filtrar_e_ordenar(store, k))
+        top_k = cronometrar(lambda: fila.top_k(k))
+        por_bairro = cronometrar(lambda: fila.top_k(k, bairro='Pirambu'))
+        print(f"{k:>6} {lista:>12.2f} {armazem:>13.2f} {top_k:>10.3f} {por_bairro:>17.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_lote.py
+"""
+Mede o modo em lote do `main.py` (`src/lote.py`): quanto demora para abrir
+(o "arranque a frio", com um lote vazio) e quantos comandos por segundo ele
+executa, em texto e em JSON Lines.
+
+Cada medida roda "python main.py --lote" em um processo novo, como um script
+faria, e fica com a mediana de algumas repetições. A primeira linha mostra o
+tempo de um Python vazio, que nenhuma mudança no projeto consegue reduzir.
+
+Uso (na pasta raiz do projeto): "python benchmarks/bench_lote.py [comandos] [quantidade_pontos]"
+"""
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from core import STATUS_VALIDOS, NIVEIS_CRITICIDADE
+from benchmarks.dados import BAIRROS, gravar_jsonl
+
+REPETICOES = 7
+
+
+def gerar_comandos(caminho: str, quantidade: int, quantidade_pontos: int):
+    """Sobretudo mudanças de status, com consultas e relatórios no meio (como a rotina das equipes)."""
+    aleatorio = random.Random(7)
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for _ in range(quantidade):
+            sorteio = aleatorio.random()
+            if sorteio < 0.7:
+                comando = f"status {aleatorio.randint(1, quantidade_pontos)} {aleatorio.choice(STATUS_VALIDOS)}"
+            elif sorteio < 0.8:
+                comando = f'cadastrar "{aleatorio.choice(BAIRROS)}" {aleatorio.randint(1, 10)}'
+            elif sorteio < 0.9:
+                comando = f"criticidade {aleatorio.choice(list(NIVEIS_CRITICIDADE))}"
+            elif sorteio < 0.99:
+                comando = f'bairro "{aleatorio.choice(BAIRROS)}"'
+            else:
+                comando = "relatorio"
+            arquivo.write(comando + '\n')
+
+
+def cronometrar(argumentos: list[str], ambiente: dict, entrada: str = None) -> float:
+    """Mediana do tempo de parede de um processo, em milissegundos."""
+    tempos = []
+    for _ in range(REPETICOES):
+        with open(entrada or os.devnull, 'rb') as arquivo_entrada:
+            inicio = time.perf_counter()
+            subprocess.run(argumentos, stdin=arquivo_entrada, stdout=subprocess.DEVNULL, env=ambiente, check=False)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def main():
+    comandos = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    quantidade_pontos = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    ambiente = {**os.environ, 'DESCARTE_BACKEND': 'memoria'}
+    ambiente.pop('DESCARTE_DIR_DADOS', None)
+    ambiente.pop('DESCARTE_ARQUIVO', None)
+    python = sys.executable
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo_pontos = os.path.join(pasta, 'pontos.jsonl')
+        arquivo_comandos = os.path.join(pasta, 'comandos.txt')
+        gravar_jsonl(arquivo_pontos, quantidade_pontos)
+        gerar_comandos(arquivo_comandos, comandos, quantidade_pontos)
+
+        vazio = cronometrar([python, '-c', 'pass'], ambiente)
+        print(f"Python vazio:                      {vazio:8.1f} ms")
+        arranque = cronometrar([python, 'main.py', '--lote', '-'], ambiente)
+        print(f"Lote vazio (dados de exemplo):     {arranque:8.1f} ms  (+{arranque - vazio:.1f} ms do projeto)")
+        # Como script, o main.py é compilado a cada execução; com "-m" o Python reaproveita o .pyc.
+        como_modulo = cronometrar([python, '-m', 'main', '--lote', '-'], ambiente)
+        print(f"Lote vazio (python -m main):       {como_modulo:8.1f} ms")
+
+        ambiente['DESCARTE_ARQUIVO'] = arquivo_pontos
+        com_pontos = cronometrar([python, 'main.py', '--lote', '-'], ambiente)
+        print(f"Lote vazio ({quantidade_pontos} pontos do arquivo): {com_pontos:8.1f} ms")
+        for formato in ('texto', 'jsonl'):
+            tempo = cronometrar([python, 'main.py', '--lote', arquivo_comandos, '--formato', formato], ambiente)
+            vazao = comandos / ((tempo - com_pontos) / 1000) if tempo > com_pontos else float('inf')
+            print(f"{comandos} comandos ({formato:5}):          {tempo:8.1f} ms  (~{vazao:,.0f} comandos/s)")
+
+
+if __name__ == '__main__':
+    main()
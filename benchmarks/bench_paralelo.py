@@ -0,0 +1,69 @@
+# benchmarks/bench_paralelo.py
+"""
+Mede como `atualizar_status_pontos` e `gerar_relatorio_por_bairro` escalam
+com o número de processos (`src/paralelo.py`), comparando com a versão
+sequencial do `core.py`.
+
+O tempo inclui enviar os blocos para os processos e trazer o resultado de
+volta, que é o custo real de usar vários núcleos em Python.
+
+Uso (na pasta raiz do projeto): "python benchmarks/bench_paralelo.py [quantidade] [tamanho_bloco]"
+"""
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from core import atualizar_status_pontos, gerar_relatorio_por_bairro
+from paralelo import (
+    TAMANHO_BLOCO_PADRAO,
+    RegraReclassificacao,
+    atualizar_status_pontos_paralelo,
+    gerar_relatorio_por_bairro_paralelo
+)
+from benchmarks import dados
+
+
+def gerar_pontos(quantidade: int) -> list[dict]:
+    """Os pontos de `benchmarks/dados.py`, com a data de registro que a `RegraReclassificacao` consulta."""
+    aleatorio = random.Random(42)
+    return [{**ponto, 'data_registro': f'2024-{aleatorio.randint(1, 12):02d}-01'} for ponto in dados.gerar_pontos(quantidade)]
+
+
+def cronometrar(funcao) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tamanho_bloco = int(sys.argv[2]) if len(sys.argv) > 2 else TAMANHO_BLOCO_PADRAO
+    pontos = gerar_pontos(quantidade)
+    regra = RegraReclassificacao('resolvido', criticidade_abaixo_de=3, registrado_antes_de=date(2024, 7, 1))
+
+    sequencial_atualizacao = cronometrar(lambda: atualizar_status_pontos(pontos, regra))
+    sequencial_relatorio = cronometrar(lambda: gerar_relatorio_por_bairro(pontos))
+    print(f"{quantidade} pontos, blocos de {tamanho_bloco}, {os.cpu_count()} núcleo(s)")
+    print(f"{'processos':>10} {'atualização (s)':>16} {'aceleração':>11} {'relatório (s)':>14} {'aceleração':>11}")
+    print(f"{'sequencial':>10} {sequencial_atualizacao:>16.2f} {1:>10.2f}x {sequencial_relatorio:>14.2f} {1:>10.2f}x")
+
+    for processos in range(1, (os.cpu_count() or 1) + 1):
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            # Aquece o pool para não medir a criação dos processos.
+            list(executor.map(abs, range(processos)))
+            atualizacao = cronometrar(lambda: atualizar_status_pontos_paralelo(
+                pontos, regra, tamanho_bloco=tamanho_bloco, executor=executor))
+            relatorio = cronometrar(lambda: gerar_relatorio_por_bairro_paralelo(
+                pontos, tamanho_bloco=tamanho_bloco, executor=executor))
+        print(f"{processos:>10} {atualizacao:>16.2f} {sequencial_atualizacao / atualizacao:>10.2f}x "
+              f"{relatorio:>14.2f} {sequencial_relatorio / relatorio:>10.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# benchmarks/bench_persistente.py
+"""
+Compara a lista de dicionários com a `ColecaoPontos` persistente.
+
+Para cada tamanho medimos:
+- o tempo médio de uma atualização de status que devolve uma coleção nova;
+- a memória extra para guardar 100 versões (snapshots) seguidas.
+
+Uso (na pasta raiz do projeto): "python benchmarks/bench_persistente.py [tamanho ...]"
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from core import atualizar_status_por_id
+from persistente import ColecaoPontos
+from benchmarks.dados import gerar_pontos
+
+VERSOES = 100
+
+
+def medir_versoes(colecao, ids: list[int]):
+    """Faz uma atualização por ID guardando todas as versões; devolve (segundos por update, bytes extras)."""
+    tracemalloc.start()
+    inicio_memoria = tracemalloc.get_traced_memory()[0]
+    inicio = time.perf_counter()
+    versoes = [colecao]
+    for id_ponto in ids:
+        versoes.append(atualizar_status_por_id(versoes[-1], id_ponto, 'resolvido'))
+    duracao = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0] - inicio_memoria
+    tracemalloc.stop()
+    return duracao / len(ids), memoria
+
+
+def main(tamanhos: list[int]):
+    print(f"{'pontos':>10} | {'estrutura':<14} | {'update (ms)':>12} | {f'{VERSOES} versões (MiB)':>18}")
+    for tamanho in tamanhos:
+        pontos = gerar_pontos(tamanho)
+        ids = random.Random(7).sample(range(1, tamanho + 1), VERSOES)
+        for nome, colecao in [('lista', pontos), ('persistente', ColecaoPontos(pontos))]:
+            por_update, memoria = medir_versoes(colecao, ids)
+            print(f"{tamanho:>10} | {nome:<14} | {por_update * 1000:>12.4f} | {memoria / 2**20:>18.2f}")
+
+
+if __name__ == "__main__":
+    main([int(argumento) for argumento in sys.argv[1:]] or [10**5, 10**6])
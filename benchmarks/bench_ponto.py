@@ -0,0 +1,51 @@
+# benchmarks/bench_ponto.py
+"""
+Mede com `tracemalloc` quanta memória os pontos ocupam como dicionários e
+como `Ponto` compacto.
+
+Para simular dados lidos de um arquivo, cada registro recebe a sua própria
+cópia das strings de bairro e status (é o que acontece ao ler um CSV/JSON).
+
+Uso (na pasta raiz do projeto): "python benchmarks/bench_ponto.py [quantidade]"
+"""
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, './src')
+
+from core import STATUS_VALIDOS
+from ponto import Ponto
+
+BAIRROS = ['Pirambu', 'Barra do Ceará', 'Vicente Pinzón', 'Centro', 'Messejana', 'Aldeota']
+
+
+def copia(texto: str) -> str:
+    """Cria uma string nova com o mesmo conteúdo, como faria um leitor de arquivo."""
+    return texto.encode('utf-8').decode('utf-8')
+
+
+def medir(construir, quantidade: int) -> int:
+    aleatorio = random.Random(42)
+    tracemalloc.start()
+    pontos = [
+        construir(i, copia(aleatorio.choice(BAIRROS)), aleatorio.randint(1, 10), copia(aleatorio.choice(STATUS_VALIDOS)))
+        for i in range(1, quantidade + 1)
+    ]
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del pontos
+    return memoria
+
+
+def main(quantidade: int):
+    como_dict = medir(lambda i, b, c, s: {'id': i, 'bairro': b, 'criticidade': c, 'status': s}, quantidade)
+    como_ponto = medir(Ponto, quantidade)
+    print(f"{quantidade} pontos")
+    print(f"  dict : {como_dict / 2**20:8.1f} MiB ({como_dict / quantidade:6.1f} bytes/ponto)")
+    print(f"  Ponto: {como_ponto / 2**20:8.1f} MiB ({como_ponto / quantidade:6.1f} bytes/ponto)")
+    print(f"  economia: {1 - como_ponto / como_dict:.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
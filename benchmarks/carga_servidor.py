@@ -0,0 +1,118 @@
+# benchmarks/carga_servidor.py
+"""
+Gerador de carga para o servidor HTTP/JSON (`src/servidor.py`), todo local.
+
+Sobe "python main.py --servidor" em outro processo com pontos gerados (via
+DESCARTE_ARQUIVO; as demais variáveis, como DESCARTE_BACKEND, são repassadas),
+abre várias conexões persistentes e mede a vazão e a latência (p50/p99).
+A mistura de requisições imita os tablets: filtros por bairro, status e
+nível, consultas de um ponto, relatório e algumas mudanças de status (5%).
+
+Com `profundidade` > 1, cada conexão manda esse número de requisições de uma
+vez (pipelining) antes de ler as respostas.
+
+Uso (na pasta raiz do projeto):
+    "python benchmarks/carga_servidor.py [conexoes] [requisicoes_por_conexao] [profundidade] [quantidade_pontos]"
+"""
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote
+
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')  # para o pacote `benchmarks`, também quando rodado como arquivo
+
+from core import STATUS_VALIDOS
+from benchmarks.dados import BAIRROS, gravar_jsonl
+
+PORTA = 8799
+
+
+def sortear_requisicao(aleatorio: random.Random, quantidade_pontos: int) -> bytes:
+    sorteio = aleatorio.random()
+    corpo = b''
+    if sorteio < 0.05:
+        metodo, alvo = 'POST', f'/pontos/{aleatorio.randint(1, quantidade_pontos)}/status'
+        corpo = json.dumps({'status': aleatorio.choice(STATUS_VALIDOS)}).encode()
+    elif sorteio < 0.35:
+        metodo, alvo = 'GET', f'/pontos?bairro={quote(aleatorio.choice(BAIRROS))}&limite=50'
+    elif sorteio < 0.55:
+        metodo, alvo = 'GET', f'/pontos?status={aleatorio.choice(STATUS_VALIDOS)}&nivel=alto&limite=50'
+    elif sorteio < 0.85:
+        metodo, alvo = 'GET', f'/pontos/{aleatorio.randint(1, quantidade_pontos)}'
+    else:
+        metodo, alvo = 'GET', '/relatorio'
+    return f"{metodo} {alvo} HTTP/1.1\r\nHost: carga\r\nContent-Length: {len(corpo)}\r\n\r\n".encode() + corpo
+
+
+async def ler_resposta(leitor: asyncio.StreamReader) -> int:
+    status = int((await leitor.readline()).split()[1])
+    tamanho = 0
+    while (linha := await leitor.readline()) != b'\r\n':
+        nome, _, valor = linha.partition(b':')
+        if nome.lower() == b'content-length':
+            tamanho = int(valor)
+    await leitor.readexactly(tamanho)
+    return status
+
+
+async def cliente(numero: int, requisicoes: int, profundidade: int, quantidade_pontos: int,
+                  latencias: list, erros: list):
+    aleatorio = random.Random(numero)
+    leitor, escritor = await asyncio.open_connection('127.0.0.1', PORTA)
+    for _ in range(0, requisicoes, profundidade):
+        lote = [sortear_requisicao(aleatorio, quantidade_pontos) for _ in range(profundidade)]
+        inicio = time.perf_counter()
+        escritor.write(b''.join(lote))
+        await escritor.drain()
+        for _ in lote:
+            status = await ler_resposta(leitor)
+            latencias.append(time.perf_counter() - inicio)
+            if status >= 500:
+                erros.append(status)
+    escritor.close()
+
+
+async def gerar_carga(conexoes: int, requisicoes: int, profundidade: int, quantidade_pontos: int):
+    latencias, erros = [], []
+    inicio = time.perf_counter()
+    await asyncio.gather(*[
+        cliente(numero, requisicoes, profundidade, quantidade_pontos, latencias, erros) for numero in range(conexoes)
+    ])
+    return time.perf_counter() - inicio, latencias, erros
+
+
+def main():
+    conexoes = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    requisicoes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    profundidade = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    quantidade_pontos = int(sys.argv[4]) if len(sys.argv) > 4 else 100_000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, 'pontos.jsonl')
+        gravar_jsonl(arquivo, quantidade_pontos)
+        ambiente = {**os.environ, 'DESCARTE_ARQUIVO': arquivo, 'DESCARTE_SQLITE': os.path.join(pasta, 'carga.db')}
+        processo = subprocess.Popen([sys.executable, 'main.py', '--servidor', str(PORTA)], env=ambiente,
+                                    stdout=subprocess.PIPE, text=True)
+        try:
+            processo.stdout.readline()  # "Servidor em ..." indica que a porta já está aberta
+            duracao, latencias, erros = asyncio.run(gerar_carga(conexoes, requisicoes, profundidade, quantidade_pontos))
+        finally:
+            processo.terminate()
+            processo.wait()
+
+    percentis = statistics.quantiles(latencias, n=100)
+    print(f"{quantidade_pontos} pontos ({os.environ.get('DESCARTE_BACKEND', 'memoria')}), {conexoes} conexões, "
+          f"profundidade de pipelining {profundidade}")
+    print(f"  {len(latencias)} requisições em {duracao:.2f} s: {len(latencias) / duracao:.0f} req/s, {len(erros)} erros")
+    print(f"  latência p50: {percentis[49] * 1000:.2f} ms, p99: {percentis[98] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/dados.py
+"""
+Dados sintéticos para os benchmarks, iguais a cada execução (mesma semente,
+mesmos pontos), de 10^3 a 10^7 pontos.
+
+Nas ocorrências reais, poucos bairros concentram a maior parte dos pontos.
+Por isso os bairros são sorteados com pesos de Zipf: o k-ésimo bairro da
+lista `BAIRROS` aparece com peso 1/k^EXPOENTE_ZIPF (com 24 bairros e
+expoente 1.1, o Pirambu fica com ~30% dos pontos e o último com ~1%). Os
+status também têm pesos (metade dos pontos ainda pendente).
+
+Para os tamanhos grandes, `iterar_pontos` e `gravar_jsonl` geram os pontos
+aos poucos, sem montar a lista inteira na memória.
+"""
+import json
+import random
+from itertools import accumulate, islice
+
+BAIRROS = [
+    'Pirambu', 'Barra do Ceará', 'Vicente Pinzón', 'Centro', 'Messejana', 'Aldeota',
+    'Jangurussu', 'Bom Jardim', 'Granja Portugal', 'Mondubim', 'Quintino Cunha', 'Conjunto Ceará',
+    'Cristo Redentor', 'Jardim Iracema', 'Álvaro Weyne', 'Antônio Bezerra', 'Parangaba', 'Serrinha',
+    'Montese', 'Benfica', 'Fátima', 'Meireles', 'Cais do Porto', 'Praia de Iracema',
+]
+EXPOENTE_ZIPF = 1.1
+PESOS_STATUS = {'pendente': 0.5, 'em_atendimento': 0.15, 'resolvido': 0.35}
+TAMANHOS = [10 ** expoente for expoente in range(3, 8)]
+
+# Os sorteios são feitos em blocos (`random.choices` com `k`), bem mais rápido que ponto a ponto.
+_TAMANHO_BLOCO = 100_000
+
+
+def pesos_zipf(quantidade: int, expoente: float = EXPOENTE_ZIPF) -> list[float]:
+    """Pesos 1/k^expoente para k = 1..quantidade (sem normalizar)."""
+    return [1 / posicao ** expoente for posicao in range(1, quantidade + 1)]
+
+
+def iterar_pontos(quantidade: int, semente: int = 42, expoente: float = EXPOENTE_ZIPF):
+    """Gera `quantidade` pontos, com IDs de 1 a `quantidade`, um de cada vez."""
+    aleatorio = random.Random(semente)
+    acumulados_bairros = list(accumulate(pesos_zipf(len(BAIRROS), expoente)))
+    status, acumulados_status = list(PESOS_STATUS), list(accumulate(PESOS_STATUS.values()))
+    criticidades = range(1, 11)
+    for inicio in range(0, quantidade, _TAMANHO_BLOCO):
+        tamanho = min(_TAMANHO_BLOCO, quantidade - inicio)
+        bairros = aleatorio.choices(BAIRROS, cum_weights=acumulados_bairros, k=tamanho)
+        niveis = aleatorio.choices(criticidades, k=tamanho)
+        situacoes = aleatorio.choices(status, cum_weights=acumulados_status, k=tamanho)
+        for id_ponto, bairro, criticidade, situacao in zip(range(inicio + 1, inicio + tamanho + 1),
+                                                           bairros, niveis, situacoes):
+            yield {'id': id_ponto, 'bairro': bairro, 'criticidade': criticidade, 'status': situacao}
+
+
+def gerar_pontos(quantidade: int, semente: int = 42, expoente: float = EXPOENTE_ZIPF) -> list[dict]:
+    """Lista com `quantidade` pontos (veja `iterar_pontos`)."""
+    return list(iterar_pontos(quantidade, semente, expoente))
+
+
+def gravar_jsonl(caminho: str, quantidade: int, semente: int = 42):
+    """Grava os pontos num arquivo JSON Lines (para DESCARTE_ARQUIVO), sem guardá-los na memória."""
+    pontos = iterar_pontos(quantidade, semente)
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        while bloco := list(islice(pontos, _TAMANHO_BLOCO)):
+            arquivo.writelines(json.dumps(ponto, ensure_ascii=False) + '\n' for ponto in bloco)
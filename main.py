@@ -2,6 +2,7 @@
 # script para utilizar no terminal para realizar o teste "python main.py"
 # certifique-se que voce esteja dentro do diretorio raiz do projeto "programacao funcional" para executar o script
 
+import os
 import sys
 
 # Essa linha adiciona a pasta 'src' aos caminhos que o Python procura por módulos.
@@ -12,13 +13,23 @@ from core import (
     filtrar_pontos_por_bairro,
     filtrar_pontos_por_criticidade, 
     gerar_relatorio_por_bairro,
-    atualizar_status_pontos,
-    criar_filtro_por_status
+    gerar_relatorio_por_bairro_e_status,
+    atualizar_status_por_id,
+    buscar_ponto_por_id,
+    gerar_proximo_id,
+    inserir_ponto,
+    criar_filtro_por_status,
+    listar_bairros,
+    sugerir_bairros,
+    NIVEIS_CRITICIDADE,
+    STATUS_VALIDOS
 )
+from indices import PontoStore
+from cache import CacheConsultas
 
 # Para simular um banco de dados real, começamos com alguns dados de exemplo.
 # Em um sistema de verdade, isso viria de um arquivo ou de uma API ou de um DB.
-PONTOS_DE_DESCARTE = [
+PONTOS_DE_EXEMPLO = [
     {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
     {'id': 2, 'bairro': 'Barra do Ceará', 'criticidade': 9, 'status': 'pendente'},
     {'id': 3, 'bairro': 'Vicente Pinzón', 'criticidade': 5, 'status': 'pendente'},
@@ -27,6 +38,127 @@ PONTOS_DE_DESCARTE = [
     {'id': 6, 'bairro': 'Vicente Pinzón', 'criticidade': 2, 'status': 'resolvido'},
 ]
 
+# Onde os pontos ficam guardados, escolhido por variáveis de ambiente:
+# - DESCARTE_BACKEND: 'memoria' (padrão, um `PontoStore` com índices) ou 'sqlite'.
+# - DESCARTE_SQLITE: arquivo do banco quando o backend é 'sqlite'.
+# - DESCARTE_DIR_DADOS: no backend 'memoria', pasta onde os pontos são guardados
+#   (log de alterações + snapshot) para sobreviverem ao fechamento do programa.
+# - DESCARTE_ARQUIVO: arquivo .csv ou .jsonl com os pontos iniciais, no lugar dos de exemplo.
+# - DESCARTE_HOST: endereço em que o servidor (`python main.py --servidor`) escuta;
+#   use '0.0.0.0' para aceitar os tablets da rede.
+# - DESCARTE_INSTRUMENTAR: com '1', conta as chamadas e o tempo das funções do `core.py`
+#   e mostra o resumo ao sair (veja `src/instrumentacao.py`).
+# - DESCARTE_INSTRUMENTAR_ARQUIVO: se definido, o resumo também é salvo nesse arquivo JSON.
+# Os pontos iniciais só são usados quando o banco/pasta ainda está vazio.
+BACKEND_DADOS = os.environ.get('DESCARTE_BACKEND', 'memoria')
+CAMINHO_SQLITE = os.environ.get('DESCARTE_SQLITE', 'descarte.db')
+DIRETORIO_DADOS = os.environ.get('DESCARTE_DIR_DADOS')
+ARQUIVO_DE_PONTOS = os.environ.get('DESCARTE_ARQUIVO')
+HOST_SERVIDOR = os.environ.get('DESCARTE_HOST', '127.0.0.1')
+ARQUIVO_INSTRUMENTACAO = os.environ.get('DESCARTE_INSTRUMENTAR_ARQUIVO')
+
+# Preenchido por `abrir_pontos()` no início do `main()`.
+PONTOS_DE_DESCARTE = None
+
+# As opções 1, 3 e 6 costumam ser repetidas com os mesmos dados; o cache guarda
+# esses resultados até a próxima inserção ou atualização.
+CACHE_CONSULTAS = CacheConsultas(tamanho_maximo=64)
+
+# Fila de despacho da opção 7, criada no primeiro uso.
+FILA_DESPACHO = None
+
+
+def _ler_pontos_iniciais(invalidos: list):
+    """Os pontos de DESCARTE_ARQUIVO (lidos aos poucos, só se forem usados) ou os de exemplo."""
+    if not ARQUIVO_DE_PONTOS:
+        return PONTOS_DE_EXEMPLO
+    from ingestao import ler_pontos_csv, ler_pontos_jsonl
+    ler_pontos = ler_pontos_jsonl if ARQUIVO_DE_PONTOS.endswith('.jsonl') else ler_pontos_csv
+    # As linhas inválidas são guardadas em `invalidos` e puladas, em vez de interromper a abertura.
+    return ler_pontos(ARQUIVO_DE_PONTOS, invalidos)
+
+
+def abrir_pontos(lote_fsync: int = 1):
+    """
+    Monta a coleção de pontos de acordo com a configuração acima.
+
+    Retorna `(pontos, armazenamento)`, em que `armazenamento` é o que precisa
+    ser fechado ao sair (ou `None`). Os módulos de persistência só são
+    importados quando a configuração pede, para não atrasar a abertura.
+    `lote_fsync` é de quantas em quantas alterações o log em disco é
+    sincronizado (no uso interativo, cada alteração vai para o disco na hora).
+
+    Linhas inválidas do DESCARTE_ARQUIVO são puladas e listadas na saída de
+    erros; um arquivo que não abre ou com IDs repetidos encerra o programa
+    com uma mensagem.
+    """
+    if BACKEND_DADOS not in ('memoria', 'sqlite'):
+        raise SystemExit(f"❌ DESCARTE_BACKEND inválido: '{BACKEND_DADOS}'. Use 'memoria' ou 'sqlite'.")
+    invalidos = []
+    pontos_iniciais = _ler_pontos_iniciais(invalidos)
+    try:
+        pontos, armazenamento = _abrir_colecao(pontos_iniciais, lote_fsync)
+    except (OSError, ValueError) as erro:  # arquivo que não abre, IDs repetidos
+        origem = f" de '{ARQUIVO_DE_PONTOS}'" if ARQUIVO_DE_PONTOS else ""
+        raise SystemExit(f"❌ Não foi possível carregar os pontos{origem}: {erro}") from None
+    if invalidos:
+        linhas = [f"⚠️  {len(invalidos)} linha(s) inválida(s) de '{ARQUIVO_DE_PONTOS}' foram ignoradas:"]
+        linhas += [f"   linha {linha}: {' '.join(erros)}" for linha, erros in invalidos]
+        print('\n'.join(linhas), file=sys.stderr)
+    return pontos, armazenamento
+
+
+def _abrir_colecao(pontos_iniciais, lote_fsync: int):
+    if BACKEND_DADOS == 'sqlite':
+        from repositorio_sqlite import RepositorioSQLite
+        repositorio = RepositorioSQLite(CAMINHO_SQLITE)
+        if not len(repositorio):
+            # Uma única transação: com um ID repetido, nada é gravado.
+            repositorio.inserir_varios(pontos_iniciais)
+        return repositorio, repositorio
+
+    if DIRETORIO_DADOS:
+        from armazenamento import ArmazenamentoDuravel
+        armazenamento = ArmazenamentoDuravel(DIRETORIO_DADOS, lote_fsync=lote_fsync)
+        pontos = armazenamento.carregar()
+        if not len(pontos):
+            # Montamos tudo na memória antes, para que um ID repetido no arquivo
+            # não deixe metade dos pontos gravada no log.
+            for ponto in PontoStore(pontos_iniciais):
+                pontos.inserir(ponto)
+        return pontos, armazenamento
+
+    return PontoStore(pontos_iniciais), None
+
+
+def fechar_pontos(pontos, armazenamento):
+    """Fecha o armazenamento ao sair; se o log em disco tem alterações, elas viram antes um snapshot novo."""
+    if armazenamento is None:
+        return
+    compactar = getattr(armazenamento, 'compactar', None)
+    if compactar is not None:
+        compactar(pontos)
+    armazenamento.fechar()
+
+
+def obter_fila_despacho(pontos):
+    """
+    Retorna a fila de despacho dos pontos pendentes.
+
+    Numa coleção que avisa as mudanças (`observar`, como o `PontoStore`), a
+    fila é montada uma vez e acompanha os cadastros e atualizações. Nas
+    demais (o SQLite), montamos uma fila nova a cada uso.
+    """
+    global FILA_DESPACHO
+    # Importada só aqui: o modo em lote e o servidor não usam a fila.
+    from despacho import FilaDespacho
+    observar = getattr(pontos, 'observar', None)
+    if observar is None:
+        return FilaDespacho(pontos)
+    if FILA_DESPACHO is None:
+        FILA_DESPACHO = observar(FilaDespacho(pontos))
+    return FILA_DESPACHO
+
 # Detalhes visuais apenas para deixar a interface mais amigável
 STATUS_EMOJI = {
     'pendente': '🔴',
@@ -42,18 +174,17 @@ def format_status(status_text):
 # Fim dos detalhes visuais
 
 # Configurações centrais da nossa aplicação
-# Aqui definimos as "regras de negócio" da nossa interface.
-NIVEIS_CRITICIDADE = {
-    'baixo': (1, 3),
-    'medio': (4, 7),
-    'alto': (8, 10)
-}
+# As "regras de negócio" (NIVEIS_CRITICIDADE e STATUS_VALIDOS) ficam no `core.py`;
+# aqui ficam só os textos da interface.
 DESCRICOES_NIVEIS = {
     'baixo': "Nível Baixo (1-3): Pequeno acúmulo, baixo risco.",
     'medio': "Nível Médio (4-7): Acúmulo considerável, requer atenção da gestão.",
     'alto': "Nível Alto (8-10): Ponto crítico, risco à saúde pública, ação urgente."
 }
-STATUS_VALIDOS = ['pendente', 'em_atendimento', 'resolvido']
+
+
+# Um filtro (closure) pronto para cada status, usado pela opção 6.
+FILTROS_POR_STATUS = {status: criar_filtro_por_status(status) for status in STATUS_VALIDOS}
 
 
 def mostrar_menu():
@@ -65,7 +196,7 @@ def mostrar_menu():
     print("4. 🔄 Atualizar status de um ponto de descarte")
     print("5. ➕ Cadastrar novo ponto de descarte")
     print("6. 🔎 Filtros rápidos por status")
-    # A OPÇÃO 7 FOI REMOVIDA
+    print("7. 🚛 Próximos pontos para as equipes (mais críticos primeiro)")
     print("0. 🚪 Sair")
 
 # A função "main" é o ponto de partida do nosso programa interativo.
@@ -73,6 +204,7 @@ def main():
     """Controla o loop principal da aplicação, mostrando o menu e respondendo as escolhas."""
     # "global" nos permite modificar a lista PONTOS_DE_DESCARTE de dentro da função.
     global PONTOS_DE_DESCARTE
+    PONTOS_DE_DESCARTE, armazenamento = abrir_pontos()
 
     # O "while True" cria um loop infinito que só é quebrado quando o usuário digita '0'.
     while True:
@@ -85,17 +217,20 @@ def main():
             bairro_input = input(prompt).strip()
             
             if bairro_input.lower() == 'ver':
-                bairros_unicos = sorted(list({p['bairro'] for p in PONTOS_DE_DESCARTE}))
+                bairros_unicos = listar_bairros(PONTOS_DE_DESCARTE)
                 print("\n  -> Bairros com pontos de descarte registrados:")
                 for bairro in bairros_unicos:
                     print(f"     - {bairro}")
                 continue
             
             bairro_selecionado = bairro_input
-            pontos_encontrados = filtrar_pontos_por_bairro(PONTOS_DE_DESCARTE, bairro_selecionado)
+            pontos_encontrados = CACHE_CONSULTAS.chamar(filtrar_pontos_por_bairro, PONTOS_DE_DESCARTE, bairro_selecionado)
             
             if not pontos_encontrados:
                 print(f"  ❌ Nenhum ponto encontrado para '{bairro_selecionado}'.")
+                sugestoes = sugerir_bairros(PONTOS_DE_DESCARTE, bairro_selecionado)
+                if sugestoes:
+                    print(f"     Você quis dizer: {', '.join(sugestoes)}?")
             else:
                 print(f"  -> Pontos em '{bairro_selecionado}':")
                 for ponto in pontos_encontrados:
@@ -127,10 +262,15 @@ def main():
 
         # Opção 3: O usuário quer um resumo geral.
         elif escolha == '3':
-            relatorio = gerar_relatorio_por_bairro(PONTOS_DE_DESCARTE)
+            relatorio = CACHE_CONSULTAS.chamar(gerar_relatorio_por_bairro, PONTOS_DE_DESCARTE)
+            relatorio_status = CACHE_CONSULTAS.chamar(gerar_relatorio_por_bairro_e_status, PONTOS_DE_DESCARTE)
             print("  -> Relatório de Ocorrências por Bairro:")
             for bairro, contagem in relatorio.items():
-                print(f"     - {bairro}: {contagem} ponto(s) de descarte")
+                detalhes = ", ".join(
+                    f"{STATUS_EMOJI.get(status, '❓')} {quantidade}"
+                    for status, quantidade in relatorio_status[bairro].items()
+                )
+                print(f"     - {bairro}: {contagem} ponto(s) de descarte ({detalhes})")
         
         # Opção 4: O usuário quer atualizar o status de um ponto.
         elif escolha == '4':
@@ -155,7 +295,7 @@ def main():
                 
                 try:
                     id_ponto = int(id_input)
-                    if not any(p['id'] == id_ponto for p in PONTOS_DE_DESCARTE):
+                    if buscar_ponto_por_id(PONTOS_DE_DESCARTE, id_ponto) is None:
                         print(f"  ❌ Erro: Ponto com ID {id_ponto} não foi encontrado.")
                         break # Sai do loop interno e volta para o menu principal
                     
@@ -166,8 +306,9 @@ def main():
                         print("  ❌ Erro: Status inválido.")
                         break
                     
-                    # TESTE PRÁTICO: Função de Alta Ordem + Lambda
-                    PONTOS_DE_DESCARTE = atualizar_status_pontos(PONTOS_DE_DESCARTE,lambda ponto: {**ponto, 'status': novo_status} if ponto['id'] == id_ponto else ponto)
+                    # Atualização direcionada: só o ponto escolhido é tocado.
+                    # (Numa lista comum, o core usa a Função de Alta Ordem + Lambda por baixo.)
+                    PONTOS_DE_DESCARTE = atualizar_status_por_id(PONTOS_DE_DESCARTE, id_ponto, novo_status)
                     print(f"\n  ✅ Status do ponto ID {id_ponto} atualizado para '{novo_status}' com sucesso!")
                     break # Sai do loop interno com sucesso
 
@@ -193,11 +334,10 @@ def main():
                 print("  ❌ Erro: A criticidade deve ser um número.")
                 continue
             
-            max_id = max(p['id'] for p in PONTOS_DE_DESCARTE) if PONTOS_DE_DESCARTE else 0
-            novo_id = max_id + 1
+            novo_id = gerar_proximo_id(PONTOS_DE_DESCARTE)
             
             novo_ponto = {'id': novo_id,'bairro': novo_bairro,'criticidade': nova_criticidade,'status': 'pendente'}
-            PONTOS_DE_DESCARTE.append(novo_ponto)
+            PONTOS_DE_DESCARTE = inserir_ponto(PONTOS_DE_DESCARTE, novo_ponto)
             
             print("\n  ✅ Ponto cadastrado com sucesso!")
             print(f"     ID Gerado: {novo_ponto['id']}")
@@ -216,9 +356,11 @@ def main():
                 continue
             
             # TESTE PRÁTICO: Closure
-            filtro_por_status = criar_filtro_por_status(status_escolhido)
+            # Os filtros são criados uma vez só (em FILTROS_POR_STATUS), então o
+            # mesmo filtro é reconhecido pelo cache nas próximas vezes.
+            filtro_por_status = FILTROS_POR_STATUS[status_escolhido]
             
-            pontos_filtrados = filtro_por_status(PONTOS_DE_DESCARTE)
+            pontos_filtrados = CACHE_CONSULTAS.chamar(filtro_por_status, PONTOS_DE_DESCARTE)
 
             if not pontos_filtrados:
                 print(f"  -> Nenhum ponto encontrado com o status '{status_escolhido}'.")
@@ -227,8 +369,34 @@ def main():
                 for ponto in pontos_filtrados:
                     print(f"     - ID: {ponto['id']}, Bairro: {ponto['bairro']}, Criticidade: {ponto['criticidade']}")
         
+        # Opção 7: O usuário quer saber para onde mandar as equipes.
+        elif escolha == '7':
+            print("\n--- 🚛 Despacho de Equipes ---")
+            try:
+                quantidade_input = input("  - Quantos pontos deseja ver? (Enter para 5): ").strip()
+                quantidade = int(quantidade_input) if quantidade_input else 5
+            except ValueError:
+                print("  ❌ Erro: Digite um número.")
+                continue
+            bairro_escolhido = input("  - Bairro (Enter para todos): ").strip() or None
+
+            proximos = obter_fila_despacho(PONTOS_DE_DESCARTE).top_k(quantidade, bairro=bairro_escolhido)
+            if not proximos:
+                print("  -> Nenhum ponto pendente encontrado.")
+                continue
+            print("  -> Pontos pendentes mais críticos:")
+            for posicao, ponto in enumerate(proximos, start=1):
+                print(f"     {posicao}. ID: {ponto['id']}, Bairro: {ponto['bairro']}, Criticidade: {ponto['criticidade']}")
+
+            if input("  - Enviar uma equipe para o primeiro da lista? (s/N): ").lower().strip() == 's':
+                primeiro = proximos[0]
+                # A mudança de status tira o ponto da fila (a fila observa o armazém).
+                PONTOS_DE_DESCARTE = atualizar_status_por_id(PONTOS_DE_DESCARTE, primeiro['id'], 'em_atendimento')
+                print(f"\n  ✅ Equipe enviada para o ponto ID {primeiro['id']} ({primeiro['bairro']}).")
+
         # Opção 0: O usuário quer sair do programa.
         elif escolha == '0':
+            fechar_pontos(PONTOS_DE_DESCARTE, armazenamento)
             print("\nSaindo do sistema. Obrigado por usar! 👋")
             break
         
@@ -236,7 +404,86 @@ def main():
         else:
             print("  ❌ Opção inválida, por favor tente novamente.")
 
+def servir(porta: int):
+    """Em vez do menu, atende as mesmas opções por HTTP/JSON (`src/servidor.py`) até o Ctrl+C."""
+    import asyncio
+    from servidor import ServidorDescarte
+
+    # O log em disco não é sincronizado pelo próprio armazenamento: o servidor
+    # faz isso depois de cada escrita, numa thread, sem parar o loop de eventos.
+    pontos, armazenamento = abrir_pontos(lote_fsync=sys.maxsize)
+    servidor = ServidorDescarte(pontos, armazenamento=armazenamento)
+
+    async def rodar():
+        conexoes = await servidor.iniciar(HOST_SERVIDOR, porta)
+        # Só avisamos depois que a porta está aberta (o `carga_servidor.py` espera por esta linha).
+        print(f"Servidor em http://{HOST_SERVIDOR}:{porta} (Ctrl+C para parar)", flush=True)
+        async with conexoes:
+            await conexoes.serve_forever()
+
+    try:
+        asyncio.run(rodar())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fechar_pontos(servidor.pontos, armazenamento)
+
+def rodar_lote(origem: str, formato: str = 'texto') -> int:
+    """
+    Em vez do menu, executa os comandos de `origem` (um arquivo, ou '-' para a
+    entrada padrão) com o `src/lote.py`. Retorna quantos comandos deram erro.
+    """
+    from lote import ExecutorLote
+
+    # No lote, o log em disco é sincronizado a cada 1000 alterações (e no fechamento),
+    # não a cada uma como no menu.
+    pontos, armazenamento = abrir_pontos(lote_fsync=1000)
+    executor = ExecutorLote(pontos, cache=CACHE_CONSULTAS)
+    # Uma única saída com buffer grande: as respostas só vão para o terminal
+    # (ou arquivo) quando o buffer enche, em vez de um `print` por linha.
+    saida = open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=1 << 16, closefd=False)
+    entrada = sys.stdin if origem == '-' else open(origem, encoding='utf-8')
+    try:
+        return executor.executar_linhas(entrada, saida, formato)
+    finally:
+        saida.flush()
+        if entrada is not sys.stdin:
+            entrada.close()
+        fechar_pontos(executor.pontos, armazenamento)
+
+
+def mostrar_instrumentacao():
+    """Ao sair, mostra (na saída de erros, para não misturar com a do lote) o resumo da instrumentação."""
+    from instrumentacao import REGISTRO
+    sys.stderr.write("\n--- ⏱️  Instrumentação do core.py ---\n" + REGISTRO.relatorio())
+    if ARQUIVO_INSTRUMENTACAO:
+        import json
+        with open(ARQUIVO_INSTRUMENTACAO, 'w', encoding='utf-8') as arquivo:
+            json.dump(REGISTRO.estatisticas(), arquivo, ensure_ascii=False, indent=2)
+
+
+USO = "Uso: python main.py [--servidor [porta] | --lote <arquivo|-> [--formato texto|jsonl]]"
+
 # Esta linha garante que a função "main()"" só será chamada quando
 # executarmos o arquivo diretamente (com "python main.py").
+# Com "python main.py --servidor [porta]", sobe o servidor HTTP no lugar do menu;
+# com "python main.py --lote comandos.txt", executa os comandos do arquivo (veja `src/lote.py`).
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import instrumentacao
+    if instrumentacao.ATIVA:
+        import atexit
+        atexit.register(mostrar_instrumentacao)
+    argumentos = sys.argv[1:]
+    if argumentos[:1] == ['--servidor']:
+        servir(int(argumentos[1]) if len(argumentos) > 1 else 8080)
+    elif argumentos[:1] == ['--lote']:
+        if len(argumentos) not in (2, 4) or (len(argumentos) == 4 and argumentos[2] != '--formato'):
+            raise SystemExit(USO)
+        formato = argumentos[3] if len(argumentos) == 4 else 'texto'
+        if formato not in ('texto', 'jsonl'):
+            raise SystemExit(f"❌ Formato inválido: '{formato}'. Use 'texto' ou 'jsonl'.")
+        sys.exit(1 if rodar_lote(argumentos[1], formato) else 0)
+    elif argumentos:
+        raise SystemExit(USO)
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,128 @@
+# src/agregados.py
+"""
+Contagens materializadas para os relatórios.
+
+O `gerar_relatorio_por_bairro` do `core.py` recalcula tudo a cada chamada.
+Aqui as contagens ficam guardadas e são ajustadas em O(1) a cada inserção
+ou mudança de um ponto, então os relatórios saem sem percorrer os dados.
+"""
+from collections import Counter
+
+from core import (
+    classificar_nivel_criticidade,
+    gerar_relatorio_por_bairro,
+    gerar_relatorio_por_bairro_e_status,
+    gerar_relatorio_por_bairro_e_nivel
+)
+from bairros import IndiceBairros, OrdemDeChegada
+
+
+class AgregadosPontos:
+    """
+    Mantém as contagens por bairro, por bairro × status e por bairro × nível.
+
+    Funciona como "observador" de uma coleção: a coleção chama `ao_inserir`
+    e `ao_atualizar` a cada mudança (o `PontoStore` já faz isso sozinho).
+
+    As contagens são guardadas pela chave do bairro, então grafias do mesmo
+    bairro somam juntas. A chave e o nome exibido vêm de um `IndiceBairros`:
+    o do `PontoStore` (passado em `bairros`, e atualizado por ele) ou um
+    próprio, que os agregados mesmos mantêm.
+
+    Os relatórios saem na mesma ordem que os do `core.py` sobre os pontos:
+    cada bairro (e cada status ou nível dentro dele) na posição do seu ponto
+    mais antigo. Essa ordem vem das `OrdemDeChegada`, e não da ordem em que
+    as chaves entraram nos contadores, que muda quando um bairro fica sem
+    pontos e depois volta.
+    """
+
+    def __init__(self, pontos=(), bairros: IndiceBairros = None):
+        self._indice_proprio = bairros is None
+        self._bairros = IndiceBairros() if bairros is None else bairros
+        self._por_bairro = Counter()
+        self._por_bairro_e_status = {}
+        self._por_bairro_e_nivel = {}
+        self._ordem_status = OrdemDeChegada()  # grupos: (bairro, status)
+        self._ordem_nivel = OrdemDeChegada()   # grupos: (bairro, nível)
+        for ponto in pontos:
+            self.ao_inserir(ponto)
+
+    @staticmethod
+    def _somar(contagens: dict, bairro: str, chave, quantidade: int):
+        contagem = contagens.get(bairro)
+        if contagem is None:
+            contagem = contagens[bairro] = Counter()
+        contagem[chave] += quantidade
+        if quantidade < 0 and not contagem[chave]:
+            del contagem[chave]
+            if not contagem:
+                del contagens[bairro]
+
+    def _registrar(self, ponto: dict, quantidade: int):
+        bairro = self._bairros.chave(ponto['bairro'])
+        nivel = classificar_nivel_criticidade(ponto['criticidade'])
+        self._por_bairro[bairro] += quantidade
+        if quantidade < 0 and not self._por_bairro[bairro]:
+            del self._por_bairro[bairro]
+        self._somar(self._por_bairro_e_status, bairro, ponto['status'], quantidade)
+        self._somar(self._por_bairro_e_nivel, bairro, nivel, quantidade)
+        if quantidade > 0:
+            chegada = self._bairros.chegada(ponto['id'])
+            self._ordem_status.colocar(chegada, (bairro, ponto['status']))
+            self._ordem_nivel.colocar(chegada, (bairro, nivel))
+
+    def ao_inserir(self, ponto: dict):
+        if self._indice_proprio:
+            self._bairros.ao_inserir(ponto)
+        self._registrar(ponto, 1)
+
+    def ao_atualizar(self, antigo: dict, novo: dict):
+        self._registrar(antigo, -1)
+        if self._indice_proprio:
+            self._bairros.ao_atualizar(antigo, novo)
+        self._registrar(novo, 1)
+
+    # --- Relatórios ---
+
+    def _em_ordem(self, contagens: dict) -> list:
+        """As chaves dos bairros de `contagens`, na ordem do ponto mais antigo de cada um."""
+        return sorted(contagens, key=self._bairros.primeira_chegada)
+
+    def _cruzado(self, contagens: dict, ordem: OrdemDeChegada) -> dict:
+        nome = self._bairros.nome
+        return {
+            nome(bairro): dict(sorted(contagens[bairro].items(), key=lambda item: ordem.primeiro((bairro, item[0]))))
+            for bairro in self._em_ordem(contagens)
+        }
+
+    def relatorio_por_bairro(self) -> dict:
+        nome = self._bairros.nome
+        return {nome(bairro): self._por_bairro[bairro] for bairro in self._em_ordem(self._por_bairro)}
+
+    def relatorio_por_bairro_e_status(self) -> dict:
+        return self._cruzado(self._por_bairro_e_status, self._ordem_status)
+
+    def relatorio_por_bairro_e_nivel(self) -> dict:
+        return self._cruzado(self._por_bairro_e_nivel, self._ordem_nivel)
+
+    def verificar_consistencia(self, pontos) -> dict:
+        """
+        Compara as contagens guardadas com o cálculo do zero feito pelo `core.py`.
+
+        Retorna um dicionário `{relatorio: (materializado, recalculado)}` só com
+        os relatórios que divergiram; vazio quando está tudo certo. A ordem das
+        chaves também conta (o `!=` entre dicionários não olharia para ela).
+        """
+        pontos = list(pontos)  # garante que o core percorra os pontos em vez de usar atalhos
+        comparacoes = {
+            'por_bairro': (self.relatorio_por_bairro(), gerar_relatorio_por_bairro(pontos)),
+            'por_bairro_e_status': (self.relatorio_por_bairro_e_status(), gerar_relatorio_por_bairro_e_status(pontos)),
+            'por_bairro_e_nivel': (self.relatorio_por_bairro_e_nivel(), gerar_relatorio_por_bairro_e_nivel(pontos)),
+        }
+        return {nome: valores for nome, valores in comparacoes.items() if _itens(valores[0]) != _itens(valores[1])}
+
+
+def _itens(relatorio: dict) -> list:
+    """O relatório como listas de pares, para comparar também a ordem das chaves."""
+    return [(bairro, list(contagem.items()) if isinstance(contagem, dict) else contagem)
+            for bairro, contagem in relatorio.items()]
@@ -0,0 +1,274 @@
+# src/armazenamento.py
+"""
+Persistência dos pontos em disco: log de alterações + snapshot binário.
+
+Sem isso, tudo o que é cadastrado ou atualizado no `main.py` se perde ao
+sair. O armazenamento tem duas partes:
+
+- `alteracoes.log`: um arquivo em que só acrescentamos linhas (JSON Lines),
+  uma por inserção ou atualização. As escritas são agrupadas e o `fsync`
+  é feito a cada `lote_fsync` alterações (ou em `sincronizar()`).
+- `pontos.snap`: de tempos em tempos (`compactar`) o estado inteiro é
+  gravado em um arquivo binário de registros de tamanho fixo, e o log é
+  zerado. Isso acontece sozinho quando o log passa de `limite_log`
+  operações (ou do número de pontos, se for maior), para que ele não cresça
+  sem fim num processo que fica aberto por muito tempo ou que não fecha
+  direito. Na abertura, o snapshot é mapeado na memória com `mmap`, sem
+  interpretar texto registro a registro, e só o final do log é reaplicado.
+
+Formato do snapshot:
+
+    cabeçalho | tabela de bairros (JSON) | tabela de status (JSON) | registros
+
+Cada registro ocupa `_REGISTRO.size` bytes: id (int64), código do bairro
+(uint32), criticidade (int16) e código do status (uint8).
+"""
+import json
+import mmap
+import os
+import struct
+
+from indices import PontoStore
+
+_MAGICO = b'PDSNAP01'
+_CABECALHO = struct.Struct('<8sQII')  # mágico, quantidade, bytes da tabela de bairros, bytes da tabela de status
+_REGISTRO = struct.Struct('<qIhB')
+
+NOME_SNAPSHOT = 'pontos.snap'
+NOME_LOG = 'alteracoes.log'
+
+
+def gravar_snapshot(caminho: str, pontos):
+    """
+    Grava os pontos no formato binário de tamanho fixo.
+
+    O arquivo é escrito ao lado e depois trocado com `os.replace`, então um
+    snapshot pela metade nunca substitui o anterior.
+    """
+    bairros, status, registros = {}, {}, bytearray()
+    for ponto in pontos:
+        registros += _REGISTRO.pack(
+            ponto['id'],
+            bairros.setdefault(ponto['bairro'], len(bairros)),
+            ponto['criticidade'],
+            status.setdefault(ponto['status'], len(status)),
+        )
+    tabela_bairros = json.dumps(list(bairros), ensure_ascii=False).encode('utf-8')
+    tabela_status = json.dumps(list(status), ensure_ascii=False).encode('utf-8')
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(_CABECALHO.pack(_MAGICO, len(registros) // _REGISTRO.size, len(tabela_bairros), len(tabela_status)))
+        arquivo.write(tabela_bairros)
+        arquivo.write(tabela_status)
+        arquivo.write(registros)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+
+
+class SnapshotMapeado:
+    """
+    Leitura de um snapshot direto do disco via `mmap`.
+
+    Abrir custa só a leitura do cabeçalho e das tabelas de nomes: os
+    registros são decodificados quando alguém acessa (`snapshot[i]`) ou
+    percorre o snapshot.
+    """
+
+    def __init__(self, caminho: str):
+        self._arquivo = open(caminho, 'rb')
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, self._quantidade, tamanho_bairros, tamanho_status = _CABECALHO.unpack_from(self._mapa, 0)
+        if magico != _MAGICO:
+            self.fechar()
+            raise ValueError(f"{caminho} não é um snapshot de pontos.")
+        inicio = _CABECALHO.size
+        self.bairros = json.loads(self._mapa[inicio:inicio + tamanho_bairros].decode('utf-8'))
+        inicio += tamanho_bairros
+        self.status = json.loads(self._mapa[inicio:inicio + tamanho_status].decode('utf-8'))
+        self._inicio_registros = inicio + tamanho_status
+
+    def __len__(self):
+        return self._quantidade
+
+    def _para_ponto(self, registro) -> dict:
+        id_ponto, bairro, criticidade, status = registro
+        return {'id': id_ponto, 'bairro': self.bairros[bairro], 'criticidade': criticidade, 'status': self.status[status]}
+
+    def __getitem__(self, posicao: int) -> dict:
+        if posicao < 0:
+            posicao += self._quantidade
+        if not 0 <= posicao < self._quantidade:
+            raise IndexError("posição fora do snapshot")
+        return self._para_ponto(_REGISTRO.unpack_from(self._mapa, self._inicio_registros + posicao * _REGISTRO.size))
+
+    def __iter__(self):
+        fim = self._inicio_registros + self._quantidade * _REGISTRO.size
+        visao = memoryview(self._mapa)[self._inicio_registros:fim]
+        try:
+            bairros, status = self.bairros, self.status
+            for id_ponto, bairro, criticidade, codigo in _REGISTRO.iter_unpack(visao):
+                yield {'id': id_ponto, 'bairro': bairros[bairro], 'criticidade': criticidade, 'status': status[codigo]}
+        finally:
+            visao.release()
+
+    def fechar(self):
+        self._mapa.close()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+class ArmazenamentoDuravel:
+    """
+    Guarda os pontos de um `PontoStore` em um diretório.
+
+    Uso típico:
+
+        armazenamento = ArmazenamentoDuravel('dados')
+        pontos = armazenamento.carregar()   # snapshot + final do log
+        pontos.inserir({...})               # registrado no log automaticamente
+        armazenamento.compactar(pontos)     # novo snapshot, log zerado
+        armazenamento.fechar()
+
+    A compactação automática acontece em `sincronizar`, então o servidor,
+    que chama `sincronizar` numa thread, também compacta fora do loop.
+    """
+
+    def __init__(self, diretorio: str, lote_fsync: int = 100, limite_log: int = 10_000):
+        os.makedirs(diretorio, exist_ok=True)
+        self.caminho_snapshot = os.path.join(diretorio, NOME_SNAPSHOT)
+        self.caminho_log = os.path.join(diretorio, NOME_LOG)
+        self.lote_fsync = lote_fsync
+        self.limite_log = limite_log
+        self._log = None
+        self._nao_sincronizadas = 0
+        self._operacoes_no_log = 0  # operações no log desde o último snapshot
+        self._pontos = None         # o `PontoStore` devolvido por `carregar`
+
+    def _ler_log(self):
+        """
+        Gera pares `(fim, operacao)`, em que `fim` é a posição (em bytes) logo
+        depois da linha da operação.
+
+        Só a última linha pode estar estragada (queda no meio da escrita), e
+        ela é ignorada. Uma linha estragada seguida de outras quer dizer que o
+        log foi corrompido: aí levantamos `ValueError` em vez de descartar o resto.
+        """
+        if not os.path.exists(self.caminho_log):
+            return
+        fim, estragada = 0, None
+        with open(self.caminho_log, 'rb') as arquivo:
+            for numero, linha in enumerate(arquivo, start=1):
+                if estragada is not None:
+                    raise ValueError(f"{self.caminho_log}: a linha {estragada} está corrompida e não é a última do log.")
+                try:
+                    operacao = json.loads(linha) if linha.endswith(b'\n') else None
+                except ValueError:  # JSON inválido ou bytes que não são UTF-8
+                    operacao = None
+                if not isinstance(operacao, dict):
+                    estragada = numero
+                    continue
+                fim += len(linha)
+                yield fim, operacao
+
+    def carregar(self) -> PontoStore:
+        """
+        Monta um `PontoStore` com o snapshot e reaplica o log por cima.
+
+        Uma última linha incompleta no log é cortada antes de qualquer escrita
+        nova, para que a próxima operação não seja gravada colada nela.
+        Depois disso, o armazenamento passa a observar o `PontoStore` e
+        registra no log cada inserção e atualização.
+        """
+        pontos = PontoStore()
+        if os.path.exists(self.caminho_snapshot):
+            with SnapshotMapeado(self.caminho_snapshot) as snapshot:
+                for ponto in snapshot:
+                    pontos.inserir(ponto)
+        fim_valido = 0
+        self._operacoes_no_log = 0
+        for fim_valido, operacao in self._ler_log():
+            self._operacoes_no_log += 1
+            # O log pode repetir operações que já estão no snapshot (queda durante a
+            # compactação), então reaplicar precisa dar o mesmo resultado.
+            if operacao['op'] == 'inserir':
+                ponto = operacao['ponto']
+                if pontos.obter(ponto['id']) is None:
+                    pontos.inserir(ponto)
+                else:
+                    pontos.atualizar(ponto['id'], **ponto)
+            elif operacao['op'] == 'atualizar' and pontos.obter(operacao['id']) is not None:
+                pontos.atualizar(operacao['id'], **operacao['campos'])
+        if os.path.exists(self.caminho_log) and os.path.getsize(self.caminho_log) > fim_valido:
+            os.truncate(self.caminho_log, fim_valido)
+        pontos.observar(self)
+        self._pontos = pontos
+        return pontos
+
+    def _escrever(self, operacao: dict):
+        if self._log is None:
+            self._log = open(self.caminho_log, 'a', encoding='utf-8')
+        self._log.write(json.dumps(operacao, ensure_ascii=False) + '\n')
+        self._nao_sincronizadas += 1
+        self._operacoes_no_log += 1
+        if self._nao_sincronizadas >= self.lote_fsync:
+            self.sincronizar()
+
+    def ao_inserir(self, ponto):
+        self._escrever({'op': 'inserir', 'ponto': dict(ponto)})
+
+    def ao_atualizar(self, antigo, novo):
+        campos = {campo: valor for campo, valor in novo.items() if antigo.get(campo) != valor}
+        self._escrever({'op': 'atualizar', 'id': novo['id'], 'campos': campos})
+
+    def sincronizar(self):
+        """
+        Garante que tudo o que foi escrito no log chegou ao disco.
+
+        Se o log já passou do limite, compacta em vez disso (o snapshot novo
+        também vai para o disco).
+        """
+        if self._pontos is not None and self._operacoes_no_log >= max(self.limite_log, len(self._pontos)):
+            self.compactar(self._pontos)
+        else:
+            self._sincronizar_log()
+
+    def _sincronizar_log(self):
+        if self._log is not None and self._nao_sincronizadas:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+        self._nao_sincronizadas = 0
+
+    def compactar(self, pontos):
+        """
+        Grava um snapshot novo com o estado atual e zera o log.
+
+        Se o log está vazio e já existe um snapshot, não há nada de novo e
+        nada é gravado.
+        """
+        if not self._operacoes_no_log and os.path.exists(self.caminho_snapshot):
+            return
+        self._sincronizar_log()
+        gravar_snapshot(self.caminho_snapshot, pontos)
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self.caminho_log, 'w', encoding='utf-8')
+        os.fsync(self._log.fileno())
+        self._operacoes_no_log = 0
+
+    def fechar(self):
+        self._sincronizar_log()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
@@ -0,0 +1,209 @@
+# src/bairros.py
+"""
+Índice dos nomes de bairro: a lista ordenada dos bairros e o autocompletar.
+
+Antes, listar os bairros (o 'ver' da opção 1) montava e ordenava um
+conjunto com o bairro de todos os pontos a cada pedido. Aqui a lista de
+bairros distintos fica pronta e é ajustada a cada inserção ou mudança, e uma
+árvore de prefixos (trie) sobre as chaves de `normalizar_bairro` encontra
+os bairros que começam com o que foi digitado. A chave de cada grafia é
+calculada uma vez só e guardada aqui, e o `PontoStore` a reaproveita.
+
+A `OrdemDeChegada` guarda, para cada grupo de pontos (um bairro, um bairro
+com um status ...), qual ponto do grupo chegou primeiro: é o que decide a
+grafia exibida e a ordem dos relatórios nas versões de lista do `core.py`.
+"""
+import heapq
+from bisect import bisect_left, insort
+
+from core import inicios_de_palavra, normalizar_bairro
+
+
+class OrdemDeChegada:
+    """
+    O grupo atual de cada ponto e, para cada grupo, o ponto mais antigo dele.
+
+    Os pontos são identificados pela ordem de chegada (0, 1, 2 ...), que é a
+    ordem em que o `PontoStore` os percorre. Cada grupo tem um heap com as
+    chegadas dos seus pontos. Quando um ponto muda de grupo, a entrada antiga
+    não é procurada: ela fica no heap e só é descartada quando aparece no
+    topo ("remoção preguiçosa", como na `FilaDespacho`).
+    """
+
+    def __init__(self):
+        self._grupos = []  # chegada -> grupo atual do ponto
+        self._heaps = {}   # grupo -> heap de chegadas (algumas podem já não valer)
+        self._entradas = 0
+
+    def colocar(self, chegada: int, grupo):
+        """Põe o ponto `chegada` (novo ou não) no `grupo`."""
+        if chegada >= len(self._grupos):
+            self._grupos.extend([None] * (chegada + 1 - len(self._grupos)))
+        elif self._grupos[chegada] == grupo:
+            return
+        self._grupos[chegada] = grupo
+        heapq.heappush(self._heaps.setdefault(grupo, []), chegada)
+        self._entradas += 1
+        if self._entradas > 2 * len(self._grupos) + 64:
+            self._compactar()
+
+    def primeiro(self, grupo):
+        """A chegada do ponto mais antigo que está no `grupo` agora, ou `None` se ele estiver vazio."""
+        heap = self._heaps.get(grupo)
+        while heap and self._grupos[heap[0]] != grupo:
+            heapq.heappop(heap)
+            self._entradas -= 1
+        return heap[0] if heap else None
+
+    def _compactar(self):
+        """Reconstrói os heaps só com as entradas válidas, quando as inválidas já são maioria."""
+        self._heaps = {}
+        for chegada, grupo in enumerate(self._grupos):
+            if grupo is not None:
+                # As chegadas entram em ordem crescente: cada lista já é um heap.
+                self._heaps.setdefault(grupo, []).append(chegada)
+        self._entradas = sum(map(len, self._heaps.values()))
+
+
+class _NoTrie:
+    """Um nó da trie: um filho por próxima letra e as chaves de bairro que terminam aqui."""
+
+    __slots__ = ('filhos', 'chaves')
+
+    def __init__(self):
+        self.filhos = {}
+        self.chaves = set()
+
+
+class IndiceBairros:
+    """
+    Bairros distintos, ordenados, com busca por prefixo.
+
+    Funciona como observador de uma coleção (o `PontoStore` já registra um em
+    `bairros`). Tudo é guardado pela chave de `normalizar_bairro`, calculada
+    uma única vez para cada grafia: 'Vicente Pinzón' e 'vicente pinzon' são
+    um bairro só, exibido com a grafia do ponto mais antigo do bairro (a
+    mesma que a versão de lista do `core.py` escolhe, mesmo depois de pontos
+    mudarem de bairro). Cada chave entra na trie inteira e a partir de cada
+    palavra, então 'pinz' também encontra 'Vicente Pinzón'.
+    """
+
+    def __init__(self, pontos=()):
+        self._chaves = {}     # grafia -> chave (só das grafias presentes nos pontos)
+        self._grafias = {}    # chave -> {grafia: quantidade de pontos}, na ordem em que as grafias apareceram
+        self._ordenados = []  # chaves distintas, ordenadas
+        self._raiz = _NoTrie()
+        self._chegadas = {}          # id do ponto -> ordem de chegada
+        self._grafia_do_ponto = []   # ordem de chegada -> grafia atual do ponto
+        self._ordem = OrdemDeChegada()  # grupos: as chaves dos bairros
+        for ponto in pontos:
+            self.ao_inserir(ponto)
+
+    def __len__(self):
+        return len(self._ordenados)
+
+    def chave(self, bairro: str) -> str:
+        """
+        A chave de `normalizar_bairro` de um nome, sem recalcular a das grafias já cadastradas.
+
+        O `PontoStore` usa esta função para os seus índices e agregados.
+        """
+        chave = self._chaves.get(bairro)
+        return normalizar_bairro(bairro) if chave is None else chave
+
+    def chegada(self, id_ponto) -> int:
+        """A ordem de chegada de um ponto observado (0 para o primeiro)."""
+        return self._chegadas[id_ponto]
+
+    def primeira_chegada(self, chave: str):
+        """A ordem de chegada do ponto mais antigo do bairro (`None` se não houver pontos)."""
+        return self._ordem.primeiro(chave)
+
+    def nome(self, chave: str) -> str:
+        """O nome com que o bairro dessa chave é exibido: a grafia do seu ponto mais antigo."""
+        chegada = self._ordem.primeiro(chave)
+        if chegada is None:  # bairro incluído só pelo nome, com `adicionar`
+            return next(iter(self._grafias[chave]))
+        return self._grafia_do_ponto[chegada]
+
+    def adicionar(self, bairro: str):
+        chave = self._chaves.get(bairro)
+        if chave is None:
+            chave = self._chaves[bairro] = normalizar_bairro(bairro)
+        grafias = self._grafias.get(chave)
+        if grafias is not None:
+            grafias[bairro] = grafias.get(bairro, 0) + 1
+            return
+        self._grafias[chave] = {bairro: 1}
+        insort(self._ordenados, chave)
+        for caminho in inicios_de_palavra(chave):
+            no = self._raiz
+            for letra in caminho:
+                no = no.filhos.setdefault(letra, _NoTrie())
+            no.chaves.add(chave)
+
+    def remover(self, bairro: str):
+        chave = self._chaves[bairro]
+        grafias = self._grafias[chave]
+        grafias[bairro] -= 1
+        if grafias[bairro]:
+            return
+        del grafias[bairro]
+        del self._chaves[bairro]
+        if grafias:
+            return
+        del self._grafias[chave]
+        del self._ordenados[bisect_left(self._ordenados, chave)]
+        for caminho in inicios_de_palavra(chave):
+            visitados = [self._raiz]
+            for letra in caminho:
+                visitados.append(visitados[-1].filhos[letra])
+            visitados[-1].chaves.discard(chave)
+            # Tira os nós que ficaram vazios, para que a busca não percorra galhos sem bairros.
+            for pai, letra, no in zip(reversed(visitados[:-1]), reversed(caminho), reversed(visitados)):
+                if no.chaves or no.filhos:
+                    break
+                del pai.filhos[letra]
+
+    # --- Observador ---
+
+    def ao_inserir(self, ponto):
+        self.adicionar(ponto['bairro'])
+        chegada = self._chegadas[ponto['id']] = len(self._grafia_do_ponto)
+        self._grafia_do_ponto.append(ponto['bairro'])
+        self._ordem.colocar(chegada, self._chaves[ponto['bairro']])
+
+    def ao_atualizar(self, antigo, novo):
+        if antigo['bairro'] != novo['bairro']:
+            self.remover(antigo['bairro'])
+            self.adicionar(novo['bairro'])
+            chegada = self._chegadas[novo['id']]
+            self._grafia_do_ponto[chegada] = novo['bairro']
+            self._ordem.colocar(chegada, self._chaves[novo['bairro']])
+
+    # --- Consultas ---
+
+    def listar(self) -> list[str]:
+        return [self.nome(chave) for chave in self._ordenados]
+
+    def sugerir(self, prefixo: str, limite: int = 5) -> list[str]:
+        """
+        Bairros cujo nome (ou uma das palavras do nome) começa com `prefixo`.
+
+        Descer até o nó do prefixo custa O(len(prefixo)); depois só visitamos
+        galhos que levam a algum nome (os vazios são podados em `remover`).
+        """
+        chave = normalizar_bairro(prefixo)
+        if not chave:
+            return []
+        no = self._raiz
+        for letra in chave:
+            no = no.filhos.get(letra)
+            if no is None:
+                return []
+        encontrados, pendentes = set(), [no]
+        while pendentes:
+            no = pendentes.pop()
+            encontrados.update(no.chaves)
+            pendentes.extend(no.filhos.values())
+        return [self.nome(chave) for chave in sorted(encontrados)[:limite]]
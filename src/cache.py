@@ -0,0 +1,103 @@
+# src/cache.py
+"""
+Cache dos resultados de filtros e relatórios.
+
+A interface e os scripts de relatório repetem muito as mesmas chamadas (o
+mesmo bairro na opção 1, o relatório da opção 3 ...). Com o cache, uma
+chamada repetida sobre dados que não mudaram devolve o resultado guardado.
+
+Cada resultado é guardado com a "versão" da coleção no momento do cálculo
+(o atributo `versao`, que o `PontoStore` e o `RepositorioSQLite` aumentam a
+cada inserção ou atualização). Depois de qualquer escrita a versão muda, a
+chave deixa de bater e o resultado é calculado de novo: nunca devolvemos um
+resultado antigo. Coleções sem `versao` (uma lista comum, por exemplo) não
+são guardadas em cache, pois não temos como saber se mudaram.
+
+Os resultados guardados são compartilhados entre as chamadas, então quem
+recebe não deve modificá-los. O cache pode ser usado por várias threads
+(como faz o `servidor.py` com o SQLite): só o acesso ao dicionário é
+protegido por uma trava, o cálculo em si acontece fora dela.
+"""
+import threading
+from collections import OrderedDict
+
+from core import aplicar_consulta
+
+
+class CacheConsultas:
+    """
+    Cache LRU (descarta o usado há mais tempo) para as funções do `core.py`:
+
+        cache = CacheConsultas(tamanho_maximo=128)
+        pontos = cache.chamar(filtrar_pontos_por_bairro, PONTOS_DE_DESCARTE, 'Pirambu')
+        relatorio = cache.chamar(gerar_relatorio_por_bairro, PONTOS_DE_DESCARTE)
+
+    A chave é `(coleção, versão, função, argumentos)`, então os argumentos
+    precisam ser "hasheáveis"; se não forem, a função é só chamada.
+    """
+
+    def __init__(self, tamanho_maximo: int = 128):
+        if tamanho_maximo < 1:
+            raise ValueError("O cache precisa comportar pelo menos um resultado.")
+        self.tamanho_maximo = tamanho_maximo
+        self._entradas = OrderedDict()  # chave -> (coleção, resultado)
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+        self.sem_cache = 0
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def chamar(self, funcao, pontos, *argumentos):
+        """Retorna `funcao(pontos, *argumentos)`, reaproveitando o resultado se a coleção não mudou."""
+        versao = getattr(pontos, 'versao', None)
+        if versao is None:
+            self.sem_cache += 1
+            return funcao(pontos, *argumentos)
+        # Usamos `id(pontos)` na chave e guardamos a própria coleção junto com o
+        # resultado, para que o id não seja reaproveitado por outro objeto.
+        chave = (id(pontos), versao, funcao, argumentos)
+        with self._trava:
+            try:
+                entrada = self._entradas.get(chave)
+            except TypeError:
+                self.sem_cache += 1
+                entrada = chave = None
+            if entrada is not None:
+                self.acertos += 1
+                self._entradas.move_to_end(chave)
+                return entrada[1]
+            if chave is not None:
+                self.falhas += 1
+        resultado = funcao(pontos, *argumentos)
+        if chave is None:
+            return resultado
+        with self._trava:
+            self._entradas[chave] = (pontos, resultado)
+            if len(self._entradas) > self.tamanho_maximo:
+                self._entradas.popitem(last=False)
+                self.descartes += 1
+        return resultado
+
+    def executar(self, consulta, pontos):
+        """Executa uma `Consulta` do `core.py` pelo cache (consultas equivalentes compartilham o resultado)."""
+        return self.chamar(aplicar_consulta, pontos, consulta)
+
+    def limpar(self):
+        with self._trava:
+            self._entradas.clear()
+
+    def estatisticas(self) -> dict:
+        """Contadores de uso do cache, incluindo a taxa de acertos."""
+        consultas = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acertos': self.acertos / consultas if consultas else 0.0,
+            'descartes': self.descartes,
+            'sem_cache': self.sem_cache,
+            'entradas': len(self._entradas),
+        }
+
@@ -0,0 +1,212 @@
+# src/colunar.py
+"""
+Representação colunar (NumPy) dos pontos, para análises com milhões de registros.
+
+Em vez de um dicionário por ponto, cada campo vira um array:
+- `ids` e `criticidades` guardam os números diretamente;
+- `bairro` e `status` viram códigos inteiros que apontam para uma pequena
+  lista de categorias (cada nome de bairro é guardado uma única vez).
+
+Os filtros e relatórios são feitos com operações vetorizadas do NumPy, e os
+resultados voltam no formato de dicionário de sempre, então o `core.py` e o
+`main.py` funcionam com essa coleção sem mudanças.
+
+O NumPy é opcional: o resto do projeto funciona sem ele.
+"""
+try:
+    import numpy as np
+except ImportError:  # o NumPy não está instalado; só este módulo deixa de funcionar
+    np = None
+
+from core import agrupar_bairros, normalizar_bairro, NIVEIS_CRITICIDADE, STATUS_VALIDOS
+
+
+def _somente_leitura(array):
+    array.flags.writeable = False
+    return array
+
+
+class PontosColunares:
+    """
+    Coleção imutável de pontos guardada em colunas NumPy.
+
+    As operações de atualização devolvem uma coleção nova que compartilha
+    com a anterior todas as colunas que não mudaram (os arrays são marcados
+    como somente leitura para que ninguém os altere por engano).
+    """
+
+    def __init__(self, ids, criticidades, codigos_bairro, bairros, codigos_status, status):
+        if np is None:
+            raise ImportError("A representação colunar precisa do NumPy (pip install numpy).")
+        self.ids = _somente_leitura(np.asarray(ids, dtype=np.int64))
+        self.criticidades = _somente_leitura(np.asarray(criticidades, dtype=np.int16))
+        self.codigos_bairro = _somente_leitura(np.asarray(codigos_bairro, dtype=np.int32))
+        self.codigos_status = _somente_leitura(np.asarray(codigos_status, dtype=np.int8))
+        self.bairros = list(bairros)
+        self.status = list(status)
+        self._ordem_ids = None  # calculada só quando alguém busca por ID
+
+    @classmethod
+    def de_pontos(cls, pontos) -> 'PontosColunares':
+        """Converte uma coleção de dicionários para o formato colunar."""
+        if np is None:
+            raise ImportError("A representação colunar precisa do NumPy (pip install numpy).")
+        bairros, status = {}, {nome: codigo for codigo, nome in enumerate(STATUS_VALIDOS)}
+        ids, criticidades, codigos_bairro, codigos_status = [], [], [], []
+        for ponto in pontos:
+            ids.append(ponto['id'])
+            criticidades.append(ponto['criticidade'])
+            codigos_bairro.append(bairros.setdefault(ponto['bairro'], len(bairros)))
+            codigos_status.append(status.setdefault(ponto['status'], len(status)))
+        return cls(ids, criticidades, codigos_bairro, bairros, codigos_status, status)
+
+    def _copiar_com(self, **colunas) -> 'PontosColunares':
+        campos = {
+            'ids': self.ids, 'criticidades': self.criticidades,
+            'codigos_bairro': self.codigos_bairro, 'bairros': self.bairros,
+            'codigos_status': self.codigos_status, 'status': self.status,
+        }
+        campos.update(colunas)
+        nova = PontosColunares(**campos)
+        if colunas.keys() <= {'codigos_status', 'status'}:
+            nova._ordem_ids = self._ordem_ids  # os IDs são os mesmos
+        return nova
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.para_pontos())
+
+    def __repr__(self):
+        return f"PontosColunares({len(self)} pontos)"
+
+    def para_pontos(self, posicoes=None) -> list[dict]:
+        """
+        Volta para o formato de dicionário de sempre.
+
+        `posicoes` pode ser uma máscara booleana ou um array de posições; sem
+        ela, todos os pontos são convertidos.
+        """
+        if posicoes is None:
+            colunas = (self.ids, self.codigos_bairro, self.criticidades, self.codigos_status)
+        else:
+            colunas = (self.ids[posicoes], self.codigos_bairro[posicoes],
+                       self.criticidades[posicoes], self.codigos_status[posicoes])
+        bairros, status = self.bairros, self.status
+        return [
+            {'id': id_ponto, 'bairro': bairros[bairro], 'criticidade': criticidade, 'status': status[codigo]}
+            for id_ponto, bairro, criticidade, codigo in zip(*(coluna.tolist() for coluna in colunas))
+        ]
+
+    def _posicoes_dos_ids(self, ids) -> 'np.ndarray':
+        """Converte IDs em posições (-1 para IDs inexistentes) com busca binária vetorizada."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self):
+            return np.full(len(ids), -1)
+        if self._ordem_ids is None:
+            self._ordem_ids = np.argsort(self.ids, kind='stable')
+        ids_ordenados = self.ids[self._ordem_ids]
+        encontrados = np.searchsorted(ids_ordenados, ids).clip(max=len(self) - 1)
+        return np.where(ids_ordenados[encontrados] == ids, self._ordem_ids[encontrados], -1)
+
+    # --- Consultas usadas pelas funções do core.py ---
+
+    def obter(self, id_ponto: int):
+        posicao = self._posicoes_dos_ids([id_ponto])[0]
+        return None if posicao < 0 else self.para_pontos([posicao])[0]
+
+    def proximo_id(self) -> int:
+        return int(self.ids.max()) + 1 if len(self) else 1
+
+    def mascara_bairro(self, bairro: str):
+        chave = normalizar_bairro(bairro)
+        codigos = [codigo for codigo, nome in enumerate(self.bairros) if normalizar_bairro(nome) == chave]
+        return np.isin(self.codigos_bairro, codigos)
+
+    def mascara_criticidade(self, nivel_min: int, nivel_max: int):
+        return (self.criticidades >= nivel_min) & (self.criticidades <= nivel_max)
+
+    def mascara_status(self, status: str):
+        if status not in self.status:
+            return np.zeros(len(self), dtype=bool)
+        return self.codigos_status == self.status.index(status)
+
+    def buscar_por_bairro(self, bairro: str) -> list[dict]:
+        return self.para_pontos(self.mascara_bairro(bairro))
+
+    def buscar_por_criticidade(self, nivel_min: int, nivel_max: int) -> list[dict]:
+        return self.para_pontos(self.mascara_criticidade(nivel_min, nivel_max))
+
+    def buscar_por_status(self, status: str) -> list[dict]:
+        return self.para_pontos(self.mascara_status(status))
+
+    # --- Relatórios com bincount ---
+
+    def relatorio_por_bairro(self) -> dict:
+        # Os códigos dos bairros seguem a ordem em que cada grafia apareceu,
+        # então o relatório sai na mesma ordem do `Counter` do core; o
+        # `agrupar_bairros` junta as grafias do mesmo bairro, como lá.
+        contagens = np.bincount(self.codigos_bairro, minlength=len(self.bairros)).tolist()
+        return agrupar_bairros({bairro: contagem for bairro, contagem in zip(self.bairros, contagens) if contagem})
+
+    def _relatorio_cruzado(self, codigos, nomes) -> dict:
+        contagens = np.bincount(
+            self.codigos_bairro.astype(np.int64) * len(nomes) + codigos,
+            minlength=len(self.bairros) * len(nomes)
+        ).reshape(len(self.bairros), len(nomes)).tolist()
+        return agrupar_bairros({
+            bairro: {nome: quantidade for nome, quantidade in zip(nomes, linha) if quantidade}
+            for bairro, linha in zip(self.bairros, contagens) if any(linha)
+        })
+
+    def relatorio_por_bairro_e_status(self) -> dict:
+        return self._relatorio_cruzado(self.codigos_status, self.status)
+
+    def relatorio_por_bairro_e_nivel(self) -> dict:
+        niveis = list(NIVEIS_CRITICIDADE) + [None]  # None: fora de todas as faixas
+        codigos = np.full(len(self), len(niveis) - 1, dtype=np.int64)
+        for codigo, (nivel_min, nivel_max) in enumerate(NIVEIS_CRITICIDADE.values()):
+            codigos[self.mascara_criticidade(nivel_min, nivel_max)] = codigo
+        return self._relatorio_cruzado(codigos, niveis)
+
+    # --- Atualizações vetorizadas ---
+
+    def _codigo_status(self, status: str):
+        """Devolve `(codigo, lista_de_status)`, acrescentando o status se ele for novo."""
+        if status in self.status:
+            return self.status.index(status), self.status
+        return len(self.status), self.status + [status]
+
+    def atualizar_status(self, novos_status: dict) -> 'PontosColunares':
+        """
+        Aplica um dicionário `{id: novo_status}` e devolve a coleção nova.
+
+        É o caminho usado por `atualizar_status_em_lote` no `core.py`: os IDs
+        viram posições com uma busca binária vetorizada e a coluna de status é
+        copiada uma única vez. IDs inexistentes são ignorados.
+        """
+        if not novos_status:
+            return self
+        posicoes = self._posicoes_dos_ids(list(novos_status))
+        lista_status, codigos = list(self.status), []
+        for status in novos_status.values():
+            if status not in lista_status:
+                lista_status.append(status)
+            codigos.append(lista_status.index(status))
+        validas = posicoes >= 0
+        coluna = self.codigos_status.copy()
+        coluna[posicoes[validas]] = np.asarray(codigos, dtype=np.int8)[validas]
+        return self._copiar_com(codigos_status=coluna, status=lista_status)
+
+    def atualizar_status_onde(self, mascara, novo_status: str) -> 'PontosColunares':
+        """
+        Versão vetorizada de `atualizar_status_pontos` para regras do tipo
+        "todo ponto que satisfaz a condição recebe o status X".
+
+        Exemplo: `colecao.atualizar_status_onde(colecao.mascara_criticidade(1, 2), 'resolvido')`.
+        """
+        codigo, lista_status = self._codigo_status(novo_status)
+        coluna = self.codigos_status.copy()
+        coluna[np.asarray(mascara, dtype=bool)] = codigo
+        return self._copiar_com(codigos_status=coluna, status=lista_status)
@@ -11,10 +11,252 @@ from collections import Counter
 # Essa funcao "Counter", serve como ferramenta prática para contar quantas vezes
 # cada item aparece em uma lista.
 
+from functools import lru_cache
+from heapq import nlargest, nsmallest
+from itertools import islice
+import unicodedata
+
+from instrumentacao import instrumentar
+
+
+# Regras de negócio compartilhadas pela interface (`main.py`) e pelos demais módulos.
+# Antes ficavam no `main.py`; vieram para cá para que a lógica pura também possa usá-las.
+NIVEIS_CRITICIDADE = {
+    'baixo': (1, 3),
+    'medio': (4, 7),
+    'alto': (8, 10)
+}
+STATUS_VALIDOS = ['pendente', 'em_atendimento', 'resolvido']
+CRITICIDADE_MINIMA, CRITICIDADE_MAXIMA = 1, 10
+
+
+# As mesmas regras que o `main.py` aplica no cadastro, para quem recebe pontos prontos
+# (de um arquivo, por exemplo).
+@instrumentar
+def validar_ponto(ponto: dict) -> list[str]:
+    """
+    Confere se um ponto respeita as regras de negócio.
+
+    Retorna a lista de problemas encontrados; uma lista vazia quer dizer que
+    o ponto é válido.
+    """
+    erros = []
+    if not isinstance(ponto.get('id'), int) or isinstance(ponto.get('id'), bool):
+        erros.append("O ID deve ser um número inteiro.")
+    bairro = ponto.get('bairro')
+    if not isinstance(bairro, str) or not bairro.strip():
+        erros.append("O nome do bairro não pode ser vazio.")
+    criticidade = ponto.get('criticidade')
+    if not isinstance(criticidade, int) or isinstance(criticidade, bool):
+        erros.append("A criticidade deve ser um número.")
+    elif not CRITICIDADE_MINIMA <= criticidade <= CRITICIDADE_MAXIMA:
+        erros.append(f"A criticidade deve ser um número entre {CRITICIDADE_MINIMA} e {CRITICIDADE_MAXIMA}.")
+    if ponto.get('status') not in STATUS_VALIDOS:
+        erros.append(f"Status inválido. Use um de: {', '.join(STATUS_VALIDOS)}.")
+    return erros
+
+
+
+# Essa função define como comparamos nomes de bairro.
+# Fica separada para que o filtro, os relatórios e os índices do `indices.py` usem exatamente a mesma regra.
+# O `PontoStore` guarda a chave de cada grafia no seu `IndiceBairros` (`bairros.py`) e os
+# relatórios calculam uma chave por grafia distinta, não por ponto; o `lru_cache` fica para
+# os demais usos (o que o usuário digita, o filtro numa lista comum, a collation do SQLite).
+@lru_cache(maxsize=4096)
+def normalizar_bairro(bairro: str) -> str:
+    """
+    Retorna a "chave de comparação" de um bairro.
+
+    A regra ignora maiúsculas e minúsculas (`casefold`), acentos e espaços
+    repetidos, então 'Vicente Pinzón', 'vicente pinzon' e 'VICENTE  PINZON'
+    são o mesmo bairro. Os acentos saem separando cada letra da sua marca
+    (normalização Unicode NFKD) e descartando as marcas.
+    """
+    decomposto = unicodedata.normalize('NFKD', bairro.casefold())
+    sem_acentos = ''.join(caractere for caractere in decomposto if not unicodedata.combining(caractere))
+    return ' '.join(sem_acentos.split())
+
+
+# Consultas compostas: bairro, faixa de criticidade e status (mais ordenação e
+# limite) juntos em um único objeto, avaliados em uma só passada.
+# Os filtros abaixo (`filtrar_pontos_por_*`, `iterar_pontos_por_*` e o filtro
+# por status) são atalhos para consultas de um critério só.
+CAMPOS_ORDENAVEIS = ('id', 'bairro', 'criticidade', 'status')
+
+
+class Consulta:
+    """
+    Uma consulta sobre os pontos, montada aos poucos:
+
+        consulta = Consulta().do_bairro('Pirambu').com_status('pendente').ordenar_por('criticidade', decrescente=True).limitar(5)
+        pontos = consulta.executar(PONTOS_DE_DESCARTE)
+
+    Cada método devolve uma consulta nova (a original não muda), então uma
+    consulta pode ser guardada e reaproveitada, como o filtro da closure.
+
+    Como ela é executada depende da coleção:
+    - se a coleção tiver `executar_consulta` (ex.: o `RepositorioSQLite`), a
+      consulta inteira é entregue a ela;
+    - se tiver índices (`buscar_por_*`), começamos pelo índice do critério
+      mais seletivo, segundo os ganchos `contar_por_*` quando existem, e os
+      demais critérios são conferidos só nesses candidatos;
+    - numa lista comum, cada ponto é examinado uma única vez, sem listas
+      intermediárias.
+
+    A ordem do resultado é a ordem original dos pontos; com `ordenar_por`, os
+    empates mantêm essa ordem.
+    """
+
+    __slots__ = ('bairro', 'criticidade', 'status', 'ordenacao', 'limite')
+
+    def __init__(self, bairro: str = None, criticidade: tuple = None, status: str = None,
+                 ordenacao: tuple = None, limite: int = None):
+        self.bairro = bairro
+        self.criticidade = criticidade  # (nivel_min, nivel_max)
+        self.status = status
+        self.ordenacao = ordenacao      # (campo, decrescente)
+        self.limite = limite
+
+    def _com(self, **mudancas) -> 'Consulta':
+        return Consulta(**{**self._parametros(), **mudancas})
+
+    def _parametros(self) -> dict:
+        return {campo: getattr(self, campo) for campo in self.__slots__}
+
+    def do_bairro(self, bairro: str) -> 'Consulta':
+        return self._com(bairro=bairro)
+
+    def com_criticidade(self, nivel_min: int, nivel_max: int) -> 'Consulta':
+        return self._com(criticidade=(nivel_min, nivel_max))
+
+    def com_status(self, status: str) -> 'Consulta':
+        return self._com(status=status)
+
+    def ordenar_por(self, campo: str, decrescente: bool = False) -> 'Consulta':
+        if campo not in CAMPOS_ORDENAVEIS:
+            raise ValueError(f"Não é possível ordenar por '{campo}'. Use um de: {', '.join(CAMPOS_ORDENAVEIS)}.")
+        return self._com(ordenacao=(campo, decrescente))
+
+    def limitar(self, limite: int) -> 'Consulta':
+        if limite < 0:
+            raise ValueError("O limite não pode ser negativo.")
+        return self._com(limite=limite)
+
+    def chave(self) -> tuple:
+        """Identifica a consulta: duas consultas com a mesma chave dão o mesmo resultado."""
+        bairro = None if self.bairro is None else normalizar_bairro(self.bairro)
+        return (bairro, self.criticidade, self.status, self.ordenacao, self.limite)
+
+    def __eq__(self, outra):
+        return isinstance(outra, Consulta) and self.chave() == outra.chave()
+
+    def __hash__(self):
+        return hash(self.chave())
+
+    def __repr__(self):
+        parametros = ", ".join(f"{campo}={valor!r}" for campo, valor in self._parametros().items() if valor is not None)
+        return f"Consulta({parametros})"
+
+    def _criterios(self) -> dict:
+        """Os critérios usados, no formato `{campo: argumentos do gancho buscar_por_campo}`."""
+        criterios = {}
+        if self.bairro is not None:
+            criterios['bairro'] = (self.bairro,)
+        if self.status is not None:
+            criterios['status'] = (self.status,)
+        if self.criticidade is not None:
+            criterios['criticidade'] = self.criticidade
+        return criterios
+
+    def _filtrar(self, pontos, exceto: str = None):
+        """
+        Confere todos os critérios (menos o já resolvido pelo índice) em uma
+        única generator expression, sem chamar uma função por critério.
+        """
+        bairro = None if self.bairro is None or exceto == 'bairro' else normalizar_bairro(self.bairro)
+        status = None if exceto == 'status' else self.status
+        nivel_min, nivel_max = (None, None) if self.criticidade is None or exceto == 'criticidade' else self.criticidade
+        if bairro is None and status is None and nivel_min is None:
+            return pontos
+        return (
+            ponto for ponto in pontos
+            if (bairro is None or normalizar_bairro(ponto['bairro']) == bairro)
+            and (status is None or ponto['status'] == status)
+            and (nivel_min is None or nivel_min <= ponto['criticidade'] <= nivel_max)
+        )
+
+    def _planejar(self, pontos, preguicoso: bool = False):
+        """
+        Escolhe por onde começar: retorna `(campo do índice usado, candidatos)`,
+        ou `(None, pontos)` quando não há índice para nenhum critério.
+
+        Com `preguicoso`, usamos o gancho `iterar_por_*` quando existe, que não
+        monta a lista de candidatos (só vale se o resultado for consumido na hora).
+        """
+        indexados = {campo: argumentos for campo, argumentos in self._criterios().items()
+                     if getattr(pontos, f'buscar_por_{campo}', None) is not None}
+        if not indexados:
+            return None, pontos
+        contagens = {}
+        for campo, argumentos in indexados.items():
+            contar = getattr(pontos, f'contar_por_{campo}', None)
+            if contar is not None:
+                contagens[campo] = contar(*argumentos)
+        # Sem contagens, confiamos na ordem dos critérios: bairro costuma ser o mais seletivo.
+        campo = min(contagens, key=contagens.get) if contagens else next(iter(indexados))
+        buscar = getattr(pontos, f'iterar_por_{campo}', None) if preguicoso else None
+        if buscar is None:
+            buscar = getattr(pontos, f'buscar_por_{campo}')
+        return campo, buscar(*indexados[campo])
+
+    def iterar(self, pontos):
+        """Gera os pontos da consulta sob demanda (numa lista comum, nada é lido antes do primeiro `next`)."""
+        executar = getattr(pontos, 'executar_consulta', None)
+        if executar is not None:
+            return iter(executar(self))
+        return self._gerar(pontos)
+
+    def _gerar(self, pontos, preguicoso: bool = False):
+        campo, candidatos = self._planejar(pontos, preguicoso)
+        resultado = self._filtrar(candidatos, exceto=campo)
+        if self.ordenacao is not None:
+            campo_ordem, decrescente = self.ordenacao
+            chave = lambda ponto: ponto[campo_ordem]
+            if self.limite is None:
+                return iter(sorted(resultado, key=chave, reverse=decrescente))
+            # Com limite, um heap de `limite` itens basta; o desempate é o mesmo do `sorted`.
+            return iter((nlargest if decrescente else nsmallest)(self.limite, resultado, key=chave))
+        if self.limite is not None:
+            return islice(resultado, self.limite)
+        return iter(resultado)
+
+    @instrumentar
+    def executar(self, pontos) -> list[dict]:
+        """Retorna a lista de pontos que atendem à consulta."""
+        executar = getattr(pontos, 'executar_consulta', None)
+        if executar is not None:
+            return executar(self)
+        # Os ganchos preguiçosos só compensam quando paramos antes do fim (limite sem
+        # ordenação); para consumir tudo, montar a lista de candidatos de uma vez é mais barato.
+        return list(self._gerar(pontos, preguicoso=self.limite is not None and self.ordenacao is None))
+
+
+def aplicar_consulta(pontos, consulta: Consulta) -> list[dict]:
+    """
+    O mesmo que `consulta.executar(pontos)`, no formato `funcao(pontos, *argumentos)`
+    que o `CacheConsultas` e o servidor usam (a consulta entra na chave).
+    """
+    return consulta.executar(pontos)
+
+
+def pontos_para_dicts(pontos) -> list[dict]:
+    """Cópias dos pontos como dicionários comuns (para virar JSON); também converte o `Ponto` compacto do `ponto.py`."""
+    return [dict(ponto) for ponto in pontos]
 
 
 # Essa função cuida de encontrar todos os pontos de um bairro específico.
 # Ela atende ao Requisito Funcional RF01(O sistema deve ser capaz de filtrar e retornar todos os pontos de descarte de um bairro específico.)
+@instrumentar
 def filtrar_pontos_por_bairro(pontos: list[dict], bairro: str) -> list[dict]:
     """
     Filtra uma lista de pontos, retornando apenas os de um bairro.
@@ -24,12 +266,17 @@ def filtrar_pontos_por_bairro(pontos: list[dict], bairro: str) -> list[dict]:
 
     CONCEITO APLICADO: List Comprehension.
     Usamos uma list comprehension aqui porque é uma forma muito limpa e favoravel de usar no python para criar uma nova lista baseada em uma condição.
+
+    Se `pontos` for uma coleção indexada (como o `PontoStore`), usamos o
+    índice dela em vez de percorrer todos os pontos. O resultado é o mesmo.
+    Hoje o filtro é uma `Consulta` de um critério só, que faz exatamente isso.
     """
-    return [ponto for ponto in pontos if ponto['bairro'].lower() == bairro.lower()]
+    return Consulta(bairro=bairro).executar(pontos)
 
 
 # Aqui, filtramos os pontos pela sua faixa de criticidade.
 # Atende ao Requisito Funcional RF02(O sistema deve identificar e retornar uma lista de pontos de descarte com base em faixas de criticidade (níveis 'baixo', 'medio' e 'alto').
+@instrumentar
 def filtrar_pontos_por_criticidade(pontos: list[dict], nivel_min: int, nivel_max: int) -> list[dict]:
     """
     Retorna uma lista de pontos que estão dentro de uma faixa de criticidade.
@@ -39,12 +286,16 @@ def filtrar_pontos_por_criticidade(pontos: list[dict], nivel_min: int, nivel_max
 
     CONCEITO APLICADO: List Comprehension.
     Novamente, usemos aqui a list comprehension pois é ideal para utilizar nessa filtragem baseada em uma condição.
+
+    Assim como no filtro por bairro, uma coleção indexada responde pela faixa
+    usando o seu próprio índice ordenado (via `Consulta`).
     """
-    return [ponto for ponto in pontos if nivel_min <= ponto['criticidade'] <= nivel_max]
+    return Consulta(criticidade=(nivel_min, nivel_max)).executar(pontos)
 
 
 # Essa função é a nossa ferramenta para modificar os dados.
 # Atende ao Requisito Funcional RF03(O sistema deve permitir a atualização do status de um ponto de descarte específico).
+@instrumentar
 def atualizar_status_pontos(pontos: list[dict], funcao_atualizacao) -> list[dict]:
     """
     Aplica uma operação de atualização em cada ponto da lista.
@@ -58,19 +309,264 @@ def atualizar_status_pontos(pontos: list[dict], funcao_atualizacao) -> list[dict
     return list(map(funcao_atualizacao, pontos))
 
 
+# Versão "direcionada" da atualização: em vez de uma regra genérica, recebemos
+# exatamente quais pontos mudam e para qual status.
+# Também atende ao Requisito Funcional RF03, principalmente quando as equipes mandam várias mudanças de uma vez.
+@instrumentar
+def atualizar_status_em_lote(pontos, atualizacoes):
+    """
+    Aplica várias mudanças de status, dadas como pares `(id, novo_status)`, e
+    retorna a coleção com as mudanças. IDs que não existem são simplesmente
+    ignorados.
+
+    Numa lista comum, todas as mudanças são feitas em uma única passada e o
+    resultado é uma lista nova; os pontos que não mudaram são reaproveitados
+    (não são copiados) e a lista original não muda.
+
+    As outras coleções aplicam as mudanças buscando cada ponto pelo ID, sem
+    percorrer os demais, pelo gancho que oferecem:
+    - `atualizar_status` (coleções imutáveis, como a `ColecaoPontos` e a
+      `PontosColunares`): devolve uma coleção nova, e a original não muda;
+    - `atualizar_status_no_lugar` (coleções que mudam no lugar, como o
+      `PontoStore` e o `RepositorioSQLite`): a própria coleção é atualizada
+      e é ela mesma que retornamos.
+
+    Usando sempre o valor retornado (`pontos = atualizar_status_em_lote(pontos, ...)`),
+    o código funciona igual com qualquer uma delas.
+
+    CONCEITO APLICADO: Função de Alta Ordem + Lambda.
+    Para a lista, reaproveitamos o `atualizar_status_pontos`, passando uma
+    lambda que consulta o dicionário de mudanças.
+    """
+    novos_status = dict(atualizacoes)
+    atualizar = getattr(pontos, 'atualizar_status', None)
+    if atualizar is not None:
+        return atualizar(novos_status)
+    atualizar_no_lugar = getattr(pontos, 'atualizar_status_no_lugar', None)
+    if atualizar_no_lugar is not None:
+        atualizar_no_lugar(novos_status)
+        return pontos
+    return atualizar_status_pontos(
+        pontos,
+        lambda ponto: {**ponto, 'status': novos_status[ponto['id']]} if ponto['id'] in novos_status else ponto
+    )
+
+
+@instrumentar
+def atualizar_status_por_id(pontos, id_ponto: int, novo_status: str):
+    """Atalho para mudar o status de um único ponto (mesmo retorno de `atualizar_status_em_lote`)."""
+    return atualizar_status_em_lote(pontos, [(id_ponto, novo_status)])
+
+
+@instrumentar
+def buscar_ponto_por_id(pontos: list[dict], id_ponto: int):
+    """Retorna o ponto com esse ID, ou `None` se ele não existir."""
+    obter = getattr(pontos, 'obter', None)
+    if obter is not None:
+        return obter(id_ponto)
+    return next((ponto for ponto in pontos if ponto['id'] == id_ponto), None)
+
+
+# Atende ao Requisito Funcional RF05(ID gerado automaticamente no cadastro).
+@instrumentar
+def gerar_proximo_id(pontos: list[dict]) -> int:
+    """
+    Retorna o ID que deve ser usado no próximo cadastro.
+
+    Coleções que mantêm um contador (como o `PontoStore`) respondem na hora;
+    numa lista comum precisamos procurar o maior ID.
+    """
+    proximo_id = getattr(pontos, 'proximo_id', None)
+    if proximo_id is not None:
+        return proximo_id()
+    return max((ponto['id'] for ponto in pontos), default=0) + 1
+
+
+# Atende ao Requisito Funcional RF05 (cadastro de um ponto novo).
+@instrumentar
+def inserir_ponto(pontos, ponto: dict):
+    """
+    Cadastra `ponto` e retorna a coleção com ele, com o mesmo retorno de
+    `atualizar_status_em_lote`: use sempre o valor retornado.
+
+    Numa lista comum, o resultado é uma lista nova. Nas coleções com
+    `inserir`, as imutáveis (a `ColecaoPontos`) devolvem uma coleção nova e
+    as que mudam no lugar (o `PontoStore`, o `RepositorioSQLite`) devolvem o
+    próprio ponto; nesse caso, retornamos a própria coleção.
+    """
+    inserir = getattr(pontos, 'inserir', None)
+    if inserir is None:
+        return [*pontos, ponto]
+    resultado = inserir(ponto)
+    return pontos if resultado is None or resultado is ponto else resultado
+
+
 # Para o relatório, precisamos contar quantos pontos cada bairro tem.
 # Atende ao Requisito Funcional RF04(O sistema deve gerar um relatório resumido com a contagem de pontos por bairro).
+@instrumentar
 def gerar_relatorio_por_bairro(pontos: list[dict]) -> dict:
     """
     Cria um resumo com a contagem de pontos por bairro.
 
-    CONCEITO APLICADO: List Comprehension.
-    Primeiro, usamos uma list comprehension para pegar apenas a lista de nomes
-    de bairros. Depois disso, a ferramenta `Counter` faz o trabalho pesado de contar
-    as ocorrências de cada um eficientemente.
+    CONCEITO APLICADO: Generator Expression.
+    Usamos uma generator expression para ir pegando os nomes dos bairros um
+    a um, sem montar uma lista intermediária, e a ferramenta `Counter` faz o
+    trabalho pesado de contar as ocorrências de cada um eficientemente. Assim
+    o relatório funciona até sobre um arquivo lido aos poucos, usando memória
+    só para as contagens.
+
+    Grafias do mesmo bairro ('Vicente Pinzón' e 'vicente pinzon') são contadas
+    juntas, com o nome da primeira que aparece (veja `agrupar_bairros`).
+
+    Coleções que mantêm as contagens atualizadas (como o `PontoStore`)
+    devolvem o relatório pronto, sem percorrer os pontos.
+    """
+    relatorio = getattr(pontos, 'relatorio_por_bairro', None)
+    if relatorio is not None:
+        return relatorio()
+    return agrupar_bairros(Counter(ponto['bairro'] for ponto in pontos))
+
+
+def agrupar_bairros(contagens: dict) -> dict:
+    """
+    Junta as contagens de grafias diferentes do mesmo bairro, segundo `normalizar_bairro`.
+
+    `contagens` é `{grafia: quantidade}` ou `{grafia: {chave: quantidade}}`,
+    na ordem em que cada grafia apareceu. Cada bairro fica com o nome e a
+    posição da sua primeira grafia. A normalização roda uma vez por grafia,
+    não por ponto; os backends que contam por grafia (SQLite, colunar,
+    paralelo) usam esta mesma função para chegar ao resultado da lista.
+    """
+    nomes, agrupado = {}, {}
+    for grafia, valor in contagens.items():
+        nome = nomes.setdefault(normalizar_bairro(grafia), grafia)
+        if isinstance(valor, dict):
+            destino = agrupado.setdefault(nome, {})
+            for chave, quantidade in valor.items():
+                destino[chave] = destino.get(chave, 0) + quantidade
+        else:
+            agrupado[nome] = agrupado.get(nome, 0) + valor
+    return agrupado
+
+
+# Versões "preguiçosas" (lazy) dos filtros, para dados grandes demais para a memória.
+# Elas não montam listas: cada ponto é examinado só quando alguém pede o próximo.
+def iterar_pontos_por_bairro(pontos, bairro: str):
+    """
+    Gera, um de cada vez, os pontos de um bairro.
+
+    CONCEITO APLICADO: Generator Expression (avaliação preguiçosa).
+    Os filtros preguiçosos podem ser encadeados, por exemplo sobre os pontos
+    lidos de um arquivo pelo `ingestao.py`, sem carregar tudo na memória.
+    Para combinar vários critérios numa passada só, use uma `Consulta`.
     """
-    bairros = [ponto['bairro'] for ponto in pontos]
-    return dict(Counter(bairros))
+    return Consulta(bairro=bairro).iterar(pontos)
+
+
+def iterar_pontos_por_criticidade(pontos, nivel_min: int, nivel_max: int):
+    """Gera, um de cada vez, os pontos dentro de uma faixa de criticidade."""
+    return Consulta(criticidade=(nivel_min, nivel_max)).iterar(pontos)
+
+
+def iterar_pontos_por_status(pontos, status: str):
+    """Gera, um de cada vez, os pontos com um status."""
+    return Consulta(status=status).iterar(pontos)
+
+
+def classificar_nivel_criticidade(criticidade: int):
+    """Retorna o nome do nível ('baixo', 'medio', 'alto') de uma criticidade, ou `None`."""
+    for nivel, (nivel_min, nivel_max) in NIVEIS_CRITICIDADE.items():
+        if nivel_min <= criticidade <= nivel_max:
+            return nivel
+    return None
+
+
+def _contar_por_bairro_e(pontos: list[dict], campo: str, converter=None) -> dict:
+    """
+    Conta os pontos de cada bairro separando pelo valor de `campo` (passado
+    por `converter`, se houver).
+
+    O `Counter` conta os pares `(grafia do bairro, valor)` numa passada só, e
+    só depois agrupamos por bairro: o `converter` e a normalização do nome
+    rodam uma vez por par distinto, não uma vez por ponto. Como no
+    `agrupar_bairros`, cada bairro aparece com o nome da sua primeira grafia,
+    na ordem da primeira aparição.
+    """
+    nomes, contagens = {}, {}
+    for (grafia, valor), quantidade in Counter((ponto['bairro'], ponto[campo]) for ponto in pontos).items():
+        chave = valor if converter is None else converter(valor)
+        por_chave = contagens.setdefault(nomes.setdefault(normalizar_bairro(grafia), grafia), {})
+        por_chave[chave] = por_chave.get(chave, 0) + quantidade
+    return contagens
+
+
+def chave_ordem_bairro(bairro: str) -> tuple:
+    """Chave para ordenar nomes de bairro em ordem alfabética sem se confundir com acentos ('Álvaro' vem antes de 'Bela')."""
+    return (normalizar_bairro(bairro), bairro)
+
+
+@instrumentar
+def listar_bairros(pontos) -> list[str]:
+    """
+    Retorna os bairros distintos, em ordem alfabética (sem diferenciar
+    acentos e maiúsculas).
+
+    Grafias do mesmo bairro aparecem uma vez só, com o nome da primeira que
+    aparece nos pontos, como nos relatórios. Coleções que mantêm essa lista
+    atualizada (como o `PontoStore`, via `bairros.py`) respondem sem
+    percorrer os pontos.
+    """
+    listar = getattr(pontos, 'listar_bairros', None)
+    if listar is not None:
+        return listar()
+    nomes = {}
+    for grafia in dict.fromkeys(ponto['bairro'] for ponto in pontos):
+        nomes.setdefault(normalizar_bairro(grafia), grafia)
+    return [nomes[chave] for chave in sorted(nomes)]
+
+
+def inicios_de_palavra(chave: str) -> list[str]:
+    """'vicente pinzon' -> ['vicente pinzon', 'pinzon']: o nome a partir de cada palavra."""
+    palavras = chave.split(' ')
+    return [' '.join(palavras[posicao:]) for posicao in range(len(palavras))]
+
+
+@instrumentar
+def sugerir_bairros(pontos, prefixo: str, limite: int = 5) -> list[str]:
+    """
+    Sugere bairros cujo nome (ou uma das palavras do nome) começa com `prefixo`,
+    usando a mesma comparação de `normalizar_bairro`: 'pinz' sugere 'Vicente Pinzón'.
+    """
+    sugerir = getattr(pontos, 'sugerir_bairros', None)
+    if sugerir is not None:
+        return sugerir(prefixo, limite)
+    chave = normalizar_bairro(prefixo)
+    if not chave:
+        return []
+    sugestoes = (
+        bairro for bairro in listar_bairros(pontos)
+        if any(palavra.startswith(chave) for palavra in inicios_de_palavra(normalizar_bairro(bairro)))
+    )
+    return list(islice(sugestoes, limite))
+
+
+# Relatórios mais detalhados, que também atendem ao RF04.
+@instrumentar
+def gerar_relatorio_por_bairro_e_status(pontos: list[dict]) -> dict:
+    """Conta os pontos de cada bairro separados por status: `{bairro: {status: quantidade}}`."""
+    relatorio = getattr(pontos, 'relatorio_por_bairro_e_status', None)
+    if relatorio is not None:
+        return relatorio()
+    return _contar_por_bairro_e(pontos, 'status')
+
+
+@instrumentar
+def gerar_relatorio_por_bairro_e_nivel(pontos: list[dict]) -> dict:
+    """Conta os pontos de cada bairro separados por nível de criticidade: `{bairro: {nivel: quantidade}}`."""
+    relatorio = getattr(pontos, 'relatorio_por_bairro_e_nivel', None)
+    if relatorio is not None:
+        return relatorio()
+    return _contar_por_bairro_e(pontos, 'criticidade', classificar_nivel_criticidade)
 
 
 # Aqui é logica do filtros.
@@ -83,8 +579,11 @@ def criar_filtro_por_status(status: str):
     O fato interesante ocorre aqui, a função `filtrar` criada anteriormente "lembra" de qual
     `status` ela deve procurar, mesmo depois que a função `criar_filtro_por_status`
     terminou de rodar. Isso permite criar filtros personalizados e
-    reutilizáveis de forma muito pratica.
+    reutilizáveis de forma muito pratica. Aqui o que ela "lembra" é a
+    `Consulta` já montada para aquele status.
     """
+    consulta = Consulta(status=status)
+
     def filtrar(pontos: list[dict]) -> list[dict]:
-        return [ponto for ponto in pontos if ponto['status'] == status]
+        return consulta.executar(pontos)
     return filtrar
\ No newline at end of file
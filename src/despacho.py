@@ -0,0 +1,149 @@
+# src/despacho.py
+"""
+Fila de despacho das equipes: os pontos pendentes mais críticos primeiro.
+
+Sem ela, "os próximos K pontos pendentes" exigem filtrar por status e
+ordenar tudo a cada pedido. Aqui os pendentes ficam em um heap (`heapq`)
+ordenado por criticidade decrescente e, no empate, por ordem de chegada;
+há também um heap por bairro, para atender uma equipe de uma região.
+
+Quando um ponto deixa de estar pendente (ou muda de criticidade), a
+entrada antiga não é procurada dentro do heap: ela só é marcada como
+inválida e descartada quando aparecer no topo ("remoção preguiçosa").
+"""
+import heapq
+
+from core import normalizar_bairro
+
+STATUS_DESPACHAVEL = 'pendente'
+
+
+class FilaDespacho:
+    """
+    Heap dos pontos pendentes, do mais crítico para o menos crítico.
+
+    Funciona como observador de uma coleção (`PontoStore.observar`), então
+    cadastros (opção 5) e mudanças de status (opção 4) entram na fila sozinhos:
+
+        fila = PONTOS_DE_DESCARTE.observar(FilaDespacho(PONTOS_DE_DESCARTE))
+        fila.top_k(5)                    # os 5 mais críticos, sem tirar da fila
+        fila.top_k(5, bairro='Pirambu')
+        ponto = fila.proximo()           # o mais crítico, também sem tirar da fila
+        atualizar_status_por_id(PONTOS_DE_DESCARTE, ponto['id'], 'em_atendimento')  # agora sai da fila
+
+    A fila nunca tira um ponto sozinha: quem decide é a mudança de status na
+    coleção, então as duas não discordam sobre quem está pendente.
+
+    Cada entrada do heap é `(-criticidade, ordem de chegada, id)`. Uma entrada
+    só vale enquanto for a entrada atual do seu ponto em `_entradas`.
+    """
+
+    def __init__(self, pontos=()):
+        self._heap = []
+        self._por_bairro = {}  # bairro normalizado -> heap
+        self._entradas = {}    # id -> entrada válida atual
+        self._pontos = {}      # id -> ponto
+        self._chegadas = 0
+        self._nos_heaps_de_bairro = 0  # entradas (válidas ou não) somando todos os heaps por bairro
+        for ponto in pontos:
+            self.ao_inserir(ponto)
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _adicionar(self, ponto: dict):
+        entrada = (-ponto['criticidade'], self._chegadas, ponto['id'])
+        self._chegadas += 1
+        self._entradas[ponto['id']] = entrada
+        self._pontos[ponto['id']] = ponto
+        heapq.heappush(self._heap, entrada)
+        heapq.heappush(self._por_bairro.setdefault(normalizar_bairro(ponto['bairro']), []), entrada)
+        self._nos_heaps_de_bairro += 1
+        self._compactar_se_preciso()
+
+    def _remover(self, id_ponto: int):
+        # A entrada fica no heap, mas deixa de ser válida.
+        del self._entradas[id_ponto]
+        del self._pontos[id_ponto]
+        # Uma fila que só é esvaziada (sem cadastros) também precisa se livrar das inválidas.
+        self._compactar_se_preciso()
+
+    def _valida(self, entrada: tuple) -> bool:
+        return self._entradas.get(entrada[2]) is entrada
+
+    def _compactar_se_preciso(self):
+        validas = len(self._entradas)
+        if len(self._heap) > 2 * validas + 64 or self._nos_heaps_de_bairro > 2 * validas + 64:
+            self._compactar()
+
+    def _compactar(self):
+        """Reconstrói os heaps só com as entradas válidas, quando as inválidas já são maioria."""
+        self._heap = list(self._entradas.values())
+        heapq.heapify(self._heap)
+        self._por_bairro = {}
+        for entrada in self._heap:
+            bairro = normalizar_bairro(self._pontos[entrada[2]]['bairro'])
+            self._por_bairro.setdefault(bairro, []).append(entrada)
+        for heap in self._por_bairro.values():
+            heapq.heapify(heap)
+        self._nos_heaps_de_bairro = len(self._heap)
+
+    # --- Observador ---
+
+    def ao_inserir(self, ponto):
+        if ponto['status'] == STATUS_DESPACHAVEL:
+            self._adicionar(ponto)
+
+    def ao_atualizar(self, antigo, novo):
+        pendente = novo['status'] == STATUS_DESPACHAVEL
+        if novo['id'] in self._entradas:
+            if (pendente and antigo['criticidade'] == novo['criticidade']
+                    and normalizar_bairro(antigo['bairro']) == normalizar_bairro(novo['bairro'])):
+                self._pontos[novo['id']] = novo  # mesma posição na fila
+                return
+            self._remover(novo['id'])
+        if pendente:
+            self._adicionar(novo)
+
+    # --- Consultas ---
+
+    def _heap_de(self, bairro: str = None) -> list:
+        """Retorna o heap pedido já sem entradas inválidas no topo."""
+        heap = self._heap if bairro is None else self._por_bairro.get(normalizar_bairro(bairro), [])
+        while heap and not self._valida(heap[0]):
+            heapq.heappop(heap)
+            if bairro is not None:
+                self._nos_heaps_de_bairro -= 1
+        return heap
+
+    def top_k(self, k: int, bairro: str = None) -> list[dict]:
+        """
+        Os `k` pontos pendentes mais críticos (opcionalmente de um bairro), sem tirá-los da fila.
+
+        O heap é uma árvore guardada em lista (filhos de `i` em `2i+1` e `2i+2`).
+        Percorremos essa árvore a partir da raiz com um segundo heap, pequeno,
+        das "fronteiras": cada passo custa O(log k), então o total é O(k log k),
+        sem ordenar nem copiar o heap principal.
+        """
+        heap = self._heap_de(bairro)
+        resultado = []
+        fronteira = [(heap[0], 0)] if heap and k > 0 else []
+        while fronteira and len(resultado) < k:
+            entrada, posicao = heapq.heappop(fronteira)
+            if self._valida(entrada):
+                resultado.append(self._pontos[entrada[2]])
+            for filho in (2 * posicao + 1, 2 * posicao + 2):
+                if filho < len(heap):
+                    heapq.heappush(fronteira, (heap[filho], filho))
+        return resultado
+
+    def proximo(self, bairro: str = None):
+        """
+        Retorna o ponto pendente mais crítico (ou `None` se não houver), sem tirá-lo da fila.
+
+        Para despachar, mude o status do ponto na coleção (por exemplo com
+        `atualizar_status_por_id(pontos, ponto['id'], 'em_atendimento')`): a
+        fila observa a coleção e o ponto sai dela nesse momento.
+        """
+        heap = self._heap_de(bairro)
+        return self._pontos[heap[0][2]] if heap else None
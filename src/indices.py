@@ -0,0 +1,243 @@
+# src/indices.py
+"""
+Aqui fica o "armazém" indexado dos pontos de descarte.
+
+As funções do `core.py` funcionam com qualquer lista, mas para isso precisam
+percorrer todos os pontos a cada consulta. O `PontoStore` guarda os mesmos
+dicionários e mantém índices que são atualizados a cada inserção ou
+atualização, então as consultas mais comuns não precisam varrer tudo.
+"""
+from bisect import bisect_left, bisect_right, insort
+# "bisect" faz buscas binárias em listas ordenadas. Usamos para o índice de criticidade.
+
+from heapq import merge
+# "merge" junta várias sequências já ordenadas em uma só, sem precisar ordenar tudo de novo.
+
+from itertools import chain
+
+from agregados import AgregadosPontos
+from bairros import IndiceBairros
+
+
+class PontoStore:
+    """
+    Coleção de pontos com índices por id, bairro, status e criticidade.
+
+    - id: dicionário `id -> ordem de inserção`, busca em O(1).
+    - bairro e status: dicionários (hash) que levam a chave ao "balde" de
+      pontos daquela chave, então a busca custa O(1) + o tamanho do resultado.
+    - criticidade: além dos baldes, guardamos a lista ordenada dos valores
+      distintos, assim uma faixa é encontrada com `bisect` em O(log n).
+
+    Os resultados saem sempre na ordem de inserção, exatamente como sairiam
+    das versões com list comprehension do `core.py`. Os dicionários dos
+    pontos nunca são modificados: uma atualização cria um dicionário novo.
+
+    Outros componentes podem acompanhar as mudanças com `observar`. O próprio
+    armazém usa isso para manter as contagens dos relatórios (`agregados`) e
+    a lista de nomes de bairro com o autocompletar (`bairros`).
+    `versao` aumenta a cada inserção ou atualização; o `cache.py` usa esse
+    número para saber se um resultado guardado ainda vale.
+    """
+
+    def __init__(self, pontos=()):
+        self._pontos = {}        # ordem de inserção -> ponto
+        self._ordem_por_id = {}  # id -> ordem de inserção
+        self._indices = {'bairro': {}, 'status': {}, 'criticidade': {}}
+        self._criticidades = []  # valores distintos de criticidade, ordenados
+        self._desordenados = set()  # baldes (campo, chave) que precisam ser reordenados
+        self._proxima_ordem = 0
+        self._maior_id = 0
+        self._observadores = []
+        self.versao = 0
+        # O índice de bairros vem primeiro: ele guarda a chave de cada grafia, que
+        # os índices e os agregados reaproveitam em vez de normalizar de novo.
+        self.bairros = IndiceBairros()
+        self.observar(self.bairros)
+        self.agregados = AgregadosPontos(bairros=self.bairros)
+        self.observar(self.agregados)
+        for ponto in pontos:
+            self.inserir(ponto)
+
+    def __len__(self):
+        return len(self._pontos)
+
+    def __iter__(self):
+        return iter(self._pontos.values())
+
+    def __repr__(self):
+        return f"PontoStore({list(self)!r})"
+
+    def observar(self, observador):
+        """
+        Registra um observador, que passa a receber `ao_inserir(ponto)` e
+        `ao_atualizar(antigo, novo)` a cada mudança feita daqui em diante.
+        """
+        self._observadores.append(observador)
+        return observador
+
+    def _chaves(self, ponto: dict) -> dict:
+        """Calcula a chave de cada índice para um ponto."""
+        return {
+            'bairro': self.bairros.chave(ponto['bairro']),
+            'status': ponto['status'],
+            'criticidade': ponto['criticidade'],
+        }
+
+    def _adicionar_ao_indice(self, campo: str, chave, ordem: int, ponto: dict):
+        indice = self._indices[campo]
+        balde = indice.get(chave)
+        if balde is None:
+            balde = indice[chave] = {}
+            if campo == 'criticidade':
+                insort(self._criticidades, chave)
+        elif ordem < next(reversed(balde)):
+            # Um ponto antigo mudou de balde e entrou "no fim da fila".
+            # Marcamos o balde para reordenar só quando alguém consultar.
+            self._desordenados.add((campo, chave))
+        balde[ordem] = ponto
+
+    def _remover_do_indice(self, campo: str, chave, ordem: int):
+        indice = self._indices[campo]
+        balde = indice[chave]
+        del balde[ordem]
+        if not balde:
+            del indice[chave]
+            self._desordenados.discard((campo, chave))
+            if campo == 'criticidade':
+                del self._criticidades[bisect_left(self._criticidades, chave)]
+
+    def _balde(self, campo: str, chave) -> dict:
+        """Retorna o balde de uma chave já na ordem de inserção."""
+        balde = self._indices[campo].get(chave)
+        if balde is None:
+            return {}
+        if (campo, chave) in self._desordenados:
+            balde = self._indices[campo][chave] = dict(sorted(balde.items()))
+            self._desordenados.discard((campo, chave))
+        return balde
+
+    def inserir(self, ponto: dict) -> dict:
+        """Adiciona um ponto novo e atualiza todos os índices."""
+        if ponto['id'] in self._ordem_por_id:
+            raise ValueError(f"Já existe um ponto com ID {ponto['id']}.")
+        ordem = self._proxima_ordem
+        self._proxima_ordem += 1
+        self._pontos[ordem] = ponto
+        self._ordem_por_id[ponto['id']] = ordem
+        self._maior_id = max(self._maior_id, ponto['id'])
+        for campo, chave in self._chaves(ponto).items():
+            self._adicionar_ao_indice(campo, chave, ordem, ponto)
+        self.versao += 1
+        for observador in self._observadores:
+            observador.ao_inserir(ponto)
+        return ponto
+
+    def atualizar(self, id_ponto: int, **campos) -> dict:
+        """
+        Substitui o ponto `id_ponto` por uma cópia com os `campos` alterados.
+
+        Só os índices cujas chaves mudaram são mexidos. Levanta `KeyError` se
+        o ponto não existir.
+        """
+        ordem = self._ordem_por_id[id_ponto]
+        antigo = self._pontos[ordem]
+        novo = {**antigo, **campos}
+        if novo['id'] != id_ponto:
+            raise ValueError("O ID de um ponto não pode ser alterado.")
+        self._pontos[ordem] = novo
+        chaves_antigas, chaves_novas = self._chaves(antigo), self._chaves(novo)
+        for campo, chave in chaves_novas.items():
+            if chave == chaves_antigas[campo]:
+                self._indices[campo][chave][ordem] = novo
+            else:
+                self._remover_do_indice(campo, chaves_antigas[campo], ordem)
+                self._adicionar_ao_indice(campo, chave, ordem, novo)
+        self.versao += 1
+        for observador in self._observadores:
+            observador.ao_atualizar(antigo, novo)
+        return novo
+
+    def atualizar_status_no_lugar(self, novos_status: dict):
+        """
+        Aplica um dicionário `{id: novo_status}` no próprio armazém, buscando
+        cada ponto pelo ID.
+
+        Custa O(k) para k mudanças, independente do tamanho da coleção. IDs
+        inexistentes são ignorados, como na versão de lista do `core.py`.
+        Diferente da lista, nenhuma coleção nova é criada (copiar os índices
+        custaria O(n)); é o caminho usado por `atualizar_status_em_lote`.
+        """
+        for id_ponto, status in novos_status.items():
+            if id_ponto in self._ordem_por_id:
+                self.atualizar(id_ponto, status=status)
+
+    def proximo_id(self) -> int:
+        """Retorna o próximo ID livre usando o contador mantido nas inserções."""
+        return self._maior_id + 1
+
+    def obter(self, id_ponto: int):
+        """Retorna o ponto com esse ID, ou `None` se ele não existir."""
+        ordem = self._ordem_por_id.get(id_ponto)
+        return None if ordem is None else self._pontos[ordem]
+
+    def buscar_por_bairro(self, bairro: str) -> list[dict]:
+        return list(self.iterar_por_bairro(bairro))
+
+    def buscar_por_status(self, status: str) -> list[dict]:
+        return list(self.iterar_por_status(status))
+
+    def buscar_por_criticidade(self, nivel_min: int, nivel_max: int) -> list[dict]:
+        # Juntar as ordens de todos os baldes e ordenar de uma vez (o `sorted` aproveita
+        # os trechos já ordenados) sai bem mais barato que intercalar ponto a ponto.
+        ordens = sorted(chain.from_iterable(self._baldes_de_criticidade(nivel_min, nivel_max)))
+        return list(map(self._pontos.__getitem__, ordens))
+
+    # Versões preguiçosas das buscas: a `Consulta` do `core.py` as usa quando
+    # consome o resultado na hora, então um `limitar(k)` para depois de k pontos
+    # em vez de montar o balde inteiro. Não modifique o armazém enquanto percorre.
+
+    def iterar_por_bairro(self, bairro: str):
+        return iter(self._balde('bairro', self.bairros.chave(bairro)).values())
+
+    def iterar_por_status(self, status: str):
+        return iter(self._balde('status', status).values())
+
+    def iterar_por_criticidade(self, nivel_min: int, nivel_max: int):
+        # Cada balde já está na ordem de inserção, então basta intercalar as ordens.
+        return map(self._pontos.__getitem__, merge(*self._baldes_de_criticidade(nivel_min, nivel_max)))
+
+    def _baldes_de_criticidade(self, nivel_min: int, nivel_max: int) -> list[dict]:
+        """Os baldes (`ordem -> ponto`) das criticidades dentro da faixa."""
+        inicio = bisect_left(self._criticidades, nivel_min)
+        fim = bisect_right(self._criticidades, nivel_max)
+        return [self._balde('criticidade', valor) for valor in self._criticidades[inicio:fim]]
+
+    # Tamanhos dos baldes, sem montar o resultado: é o que a `Consulta` do
+    # `core.py` usa para decidir por qual índice começar.
+
+    def contar_por_bairro(self, bairro: str) -> int:
+        return len(self._indices['bairro'].get(self.bairros.chave(bairro), ()))
+
+    def contar_por_status(self, status: str) -> int:
+        return len(self._indices['status'].get(status, ()))
+
+    def contar_por_criticidade(self, nivel_min: int, nivel_max: int) -> int:
+        inicio = bisect_left(self._criticidades, nivel_min)
+        fim = bisect_right(self._criticidades, nivel_max)
+        return sum(len(self._indices['criticidade'][valor]) for valor in self._criticidades[inicio:fim])
+
+    def listar_bairros(self) -> list[str]:
+        return self.bairros.listar()
+
+    def sugerir_bairros(self, prefixo: str, limite: int = 5) -> list[str]:
+        return self.bairros.sugerir(prefixo, limite)
+
+    def relatorio_por_bairro(self) -> dict:
+        return self.agregados.relatorio_por_bairro()
+
+    def relatorio_por_bairro_e_status(self) -> dict:
+        return self.agregados.relatorio_por_bairro_e_status()
+
+    def relatorio_por_bairro_e_nivel(self) -> dict:
+        return self.agregados.relatorio_por_bairro_e_nivel()
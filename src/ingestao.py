@@ -0,0 +1,111 @@
+# src/ingestao.py
+"""
+Leitura "em fluxo" (streaming) de pontos a partir de arquivos CSV e JSON Lines.
+
+Os leitores são geradores: cada linha só é lida, convertida e validada
+quando alguém pede o próximo ponto. Combinados com os filtros preguiçosos do
+`core.py` (`iterar_pontos_por_*`) e com o `gerar_relatorio_por_bairro`, dá
+para processar arquivos maiores que a memória usando memória constante:
+
+    pontos = ler_pontos_csv('pontos.csv')
+    pendentes = iterar_pontos_por_status(pontos, 'pendente')
+    relatorio = gerar_relatorio_por_bairro(iterar_pontos_por_criticidade(pendentes, 8, 10))
+
+Cada registro passa pelas mesmas regras do cadastro do `main.py`
+(`validar_ponto` no `core.py`).
+"""
+import csv
+import json
+from contextlib import contextmanager
+
+from core import validar_ponto
+
+
+@contextmanager
+def _abrir(origem):
+    """Aceita tanto um caminho de arquivo quanto um arquivo já aberto."""
+    if hasattr(origem, 'read'):
+        yield origem
+    else:
+        with open(origem, encoding='utf-8', newline='') as arquivo:
+            yield arquivo
+
+
+def _converter_inteiro(valor):
+    """Converte textos como '7' em inteiros; outros valores passam como estão (e a validação reclama)."""
+    if isinstance(valor, str):
+        try:
+            return int(valor.strip())
+        except ValueError:
+            return valor
+    return valor
+
+
+def _normalizar_registro(registro: dict) -> dict:
+    """Monta o ponto no formato de sempre a partir de um registro lido do arquivo."""
+    bairro = registro.get('bairro')
+    status = registro.get('status')
+    return {
+        'id': _converter_inteiro(registro.get('id')),
+        'bairro': bairro.strip() if isinstance(bairro, str) else bairro,
+        'criticidade': _converter_inteiro(registro.get('criticidade')),
+        # Como no cadastro do main.py, um ponto sem status começa como 'pendente'.
+        'status': status.strip().lower() if isinstance(status, str) and status.strip() else 'pendente',
+    }
+
+
+def _validar(registros, invalidos):
+    """
+    Recebe pares `(numero_da_linha, registro)` e gera só os pontos válidos.
+
+    Se `invalidos` for uma lista, cada linha ruim é guardada nela como
+    `(numero_da_linha, erros)` e a leitura continua; caso contrário, a
+    primeira linha ruim levanta `ValueError`.
+    """
+    for linha, registro in registros:
+        if isinstance(registro, dict):
+            ponto = _normalizar_registro(registro)
+            erros = validar_ponto(ponto)
+        else:
+            erros = [registro]  # mensagem de um erro de leitura
+        if not erros:
+            yield ponto
+        elif invalidos is not None:
+            invalidos.append((linha, erros))
+        else:
+            raise ValueError(f"Linha {linha}: {' '.join(erros)}")
+
+
+def ler_pontos_csv(origem, invalidos: list = None):
+    """
+    Lê pontos de um CSV com cabeçalho `id,bairro,criticidade,status`, um de cada vez.
+
+    A coluna `status` é opcional. Veja `_validar` para o uso de `invalidos`.
+    """
+    with _abrir(origem) as arquivo:
+        leitor = csv.DictReader(arquivo)
+        # `line_num` é a linha do arquivo em que o registro termina: um campo entre
+        # aspas pode ocupar várias linhas, então contar os registros não serve.
+        yield from _validar(((leitor.line_num, registro) for registro in leitor), invalidos)
+
+
+def _registros_jsonl(arquivo):
+    for numero, linha in enumerate(arquivo, start=1):
+        if not linha.strip():
+            continue
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as erro:
+            yield numero, f"JSON inválido ({erro.msg})."
+            continue
+        yield numero, registro if isinstance(registro, dict) else "Cada linha deve ser um objeto JSON."
+
+
+def ler_pontos_jsonl(origem, invalidos: list = None):
+    """
+    Lê pontos de um arquivo JSON Lines (um objeto JSON por linha), um de cada vez.
+
+    Linhas em branco são puladas. Veja `_validar` para o uso de `invalidos`.
+    """
+    with _abrir(origem) as arquivo:
+        yield from _validar(_registros_jsonl(arquivo), invalidos)
@@ -0,0 +1,127 @@
+# src/instrumentacao.py
+"""
+Instrumentação opcional das funções mais usadas do `core.py`.
+
+Com a variável de ambiente DESCARTE_INSTRUMENTAR=1, cada função marcada com
+`@instrumentar` passa a contar as chamadas e o tempo de cada uma, num
+histograma em escala log2 (a faixa 10, por exemplo, junta as chamadas que
+levaram de 512 a 1023 ns). Ao sair, o `main.py` mostra o resumo:
+
+    DESCARTE_INSTRUMENTAR=1 python main.py --lote comandos.txt
+
+Sem a variável, `instrumentar` devolve a própria função, sem nenhum
+envoltório: o custo no uso normal é zero. O tempo medido inclui as funções
+chamadas por dentro (`filtrar_pontos_por_bairro` inclui o da
+`Consulta.executar` que ele usa).
+"""
+import os
+import threading
+import time
+from functools import wraps
+
+ATIVA = os.environ.get('DESCARTE_INSTRUMENTAR', '') not in ('', '0')
+
+# Faixas do histograma: a faixa `f` guarda as durações `d` (em ns) com `d.bit_length() == f`,
+# ou seja, 2**(f-1) <= d < 2**f. 64 faixas cobrem qualquer duração possível.
+FAIXAS = 64
+
+
+class EstatisticaFuncao:
+    """Contagem de chamadas, tempo total e histograma das durações de uma função."""
+
+    __slots__ = ('chamadas', 'total_ns', 'histograma')
+
+    def __init__(self):
+        self.chamadas = 0
+        self.total_ns = 0
+        self.histograma = [0] * FAIXAS
+
+    def registrar(self, duracao_ns: int):
+        self.chamadas += 1
+        self.total_ns += duracao_ns
+        self.histograma[min(duracao_ns.bit_length(), FAIXAS - 1)] += 1
+
+    def percentil_ns(self, fracao: float) -> int:
+        """Limite superior (em ns) da faixa em que cai o percentil pedido (0.5 = mediana)."""
+        alvo = fracao * self.chamadas
+        acumulado = 0
+        for faixa, quantidade in enumerate(self.histograma):
+            acumulado += quantidade
+            if quantidade and acumulado >= alvo:
+                return 2 ** faixa
+        return 0
+
+    def para_dict(self) -> dict:
+        return {
+            'chamadas': self.chamadas,
+            'total_ms': self.total_ns / 1e6,
+            'media_us': self.total_ns / self.chamadas / 1e3 if self.chamadas else 0.0,
+            'p50_ate_us': self.percentil_ns(0.5) / 1e3,
+            'p99_ate_us': self.percentil_ns(0.99) / 1e3,
+            # Só as faixas usadas: {limite superior em ns: quantidade}.
+            'histograma_ns': {2 ** faixa: quantidade for faixa, quantidade in enumerate(self.histograma) if quantidade},
+        }
+
+
+class RegistroInstrumentacao:
+    """As estatísticas de todas as funções instrumentadas, por nome (`modulo.funcao`)."""
+
+    def __init__(self):
+        self._funcoes = {}
+        # O servidor chama o `core.py` de várias threads (backend SQLite).
+        self._trava = threading.Lock()
+
+    def registrar(self, nome: str, duracao_ns: int):
+        with self._trava:
+            estatistica = self._funcoes.get(nome)
+            if estatistica is None:
+                estatistica = self._funcoes[nome] = EstatisticaFuncao()
+            estatistica.registrar(duracao_ns)
+
+    def limpar(self):
+        with self._trava:
+            self._funcoes.clear()
+
+    def estatisticas(self) -> dict:
+        """`{nome: estatísticas}`, das funções que mais tempo tomaram para as que menos tomaram."""
+        with self._trava:
+            funcoes = sorted(self._funcoes.items(), key=lambda item: -item[1].total_ns)
+            return {nome: estatistica.para_dict() for nome, estatistica in funcoes}
+
+    def relatorio(self) -> str:
+        """O resumo em texto, uma linha por função."""
+        linhas = [f"{'função':<48} {'chamadas':>9} {'total ms':>10} {'média µs':>10} {'p50 ≤ µs':>10} {'p99 ≤ µs':>10}"]
+        for nome, dados in self.estatisticas().items():
+            linhas.append(
+                f"{nome:<48} {dados['chamadas']:>9} {dados['total_ms']:>10.2f} {dados['media_us']:>10.1f} "
+                f"{dados['p50_ate_us']:>10.1f} {dados['p99_ate_us']:>10.1f}"
+            )
+        return '\n'.join(linhas) + '\n'
+
+
+# O registro usado pelo `@instrumentar` quando a instrumentação está ligada.
+REGISTRO = RegistroInstrumentacao()
+
+
+def instrumentar(funcao, registro: RegistroInstrumentacao = None):
+    """
+    Decorador que registra as chamadas e a duração de `funcao`.
+
+    Sem `registro`, só instrumenta quando DESCARTE_INSTRUMENTAR está ligada
+    (e então usa o `REGISTRO`); com um `registro` explícito, sempre instrumenta.
+    """
+    if registro is None:
+        if not ATIVA:
+            return funcao
+        registro = REGISTRO
+    nome = f"{funcao.__module__}.{funcao.__qualname__}"
+    relogio = time.perf_counter_ns
+
+    @wraps(funcao)
+    def instrumentada(*args, **kwargs):
+        inicio = relogio()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            registro.registrar(nome, relogio() - inicio)
+    return instrumentada
@@ -0,0 +1,286 @@
+# src/lote.py
+"""
+Modo em lote: as opções 1 a 6 do menu lidas de um arquivo de comandos.
+
+O menu do `main.py` é bom para uma pessoa, mas não para um script que faz
+milhares de operações (importar um arquivo, mudar status, tirar relatórios).
+Aqui cada linha é um comando, separado em palavras como no terminal
+(`shlex`, então nomes com espaço vão entre aspas), e `#` começa um comentário:
+
+    importar pontos.csv              # cadastra os pontos de um .csv ou .jsonl (tudo ou nada)
+    bairro "Barra do Ceará"          # opção 1
+    bairros                          # o 'ver' da opção 1
+    criticidade alto                 # opção 2
+    relatorio                        # opção 3
+    status 12 resolvido              # opção 4
+    cadastrar "Vicente Pinzón" 7     # opção 5
+    filtrar pendente                 # opção 6
+
+As respostas vão todas para um único arquivo de saída, escritas de uma vez
+por comando (sem um `print` por linha), em texto ou em JSON Lines (um objeto
+por comando, com a `linha`, o `comando` e o `resultado` ou o `erro`). Um
+comando com erro não interrompe o lote.
+
+Uso: `python main.py --lote comandos.txt` (ou `-` para ler da entrada padrão).
+"""
+from core import (
+    filtrar_pontos_por_bairro,
+    filtrar_pontos_por_criticidade,
+    gerar_relatorio_por_bairro,
+    gerar_relatorio_por_bairro_e_status,
+    atualizar_status_por_id,
+    buscar_ponto_por_id,
+    gerar_proximo_id,
+    inserir_ponto,
+    criar_filtro_por_status,
+    listar_bairros,
+    pontos_para_dicts,
+    validar_ponto,
+    NIVEIS_CRITICIDADE,
+    STATUS_VALIDOS,
+)
+
+FORMATOS = ('texto', 'jsonl')
+
+# Se a linha não tem nenhum destes caracteres, um `split()` comum dá o mesmo
+# resultado que o `shlex.split`, que é bem mais lento.
+_CARACTERES_SHLEX = frozenset('"\'\\#')
+
+
+class ErroComando(Exception):
+    """Comando desconhecido ou com argumentos inválidos; vira uma resposta de erro no lote."""
+
+
+def separar_comando(linha: str) -> list[str]:
+    """Separa a linha em palavras como o terminal faz; comentários e linhas vazias dão `[]`."""
+    if _CARACTERES_SHLEX.isdisjoint(linha):
+        return linha.split()
+    import shlex  # importa o `re`; só as linhas com aspas ou comentários pagam por isso
+    try:
+        return shlex.split(linha, comments=True)
+    except ValueError as erro:  # aspas sem fechar
+        raise ErroComando(f"Linha mal formada ({erro}).") from erro
+
+
+def _ler_id(texto: str) -> int:
+    try:
+        return int(texto)
+    except ValueError:
+        raise ErroComando(f"O ID deve ser um número, não '{texto}'.") from None
+
+
+def _id_repetido(pontos, novos: list[dict]):
+    """O primeiro ID de `novos` que já está em `pontos` ou que se repete entre os novos (`None` se não houver)."""
+    obter = getattr(pontos, 'obter', None)
+    existentes = set() if obter is not None else {ponto['id'] for ponto in pontos}
+    vistos = set()
+    for ponto in novos:
+        id_ponto = ponto['id']
+        if id_ponto in vistos or id_ponto in existentes or (obter is not None and obter(id_ponto) is not None):
+            return id_ponto
+        vistos.add(id_ponto)
+    return None
+
+
+class ExecutorLote:
+    """
+    Executa comandos do lote sobre uma coleção de pontos.
+
+        executor = ExecutorLote(pontos, cache=CACHE_CONSULTAS)
+        erros = executor.executar_linhas(open('comandos.txt'), sys.stdout, formato='jsonl')
+
+    Como no menu, a coleção pode ser trocada por uma nova numa mudança de
+    status ou num cadastro (listas comuns, `ColecaoPontos`); a atual fica
+    sempre em `executor.pontos`.
+    """
+
+    def __init__(self, pontos, cache=None):
+        self.pontos = pontos
+        self.cache = cache
+        self._filtros_por_status = {status: criar_filtro_por_status(status) for status in STATUS_VALIDOS}
+
+    def _ler(self, funcao, *argumentos):
+        if self.cache is None:
+            return funcao(self.pontos, *argumentos)
+        return self.cache.chamar(funcao, self.pontos, *argumentos)
+
+    # --- Comandos (cada um devolve um resultado que pode virar JSON) ---
+
+    def _bairro(self, *palavras):
+        if not palavras:
+            raise ErroComando("Informe o nome do bairro.")
+        return pontos_para_dicts(self._ler(filtrar_pontos_por_bairro, ' '.join(palavras)))
+
+    def _bairros(self):
+        return listar_bairros(self.pontos)
+
+    def _criticidade(self, nivel):
+        faixa = NIVEIS_CRITICIDADE.get(nivel.lower())
+        if faixa is None:
+            raise ErroComando(f"Nível inválido. Use um de: {', '.join(NIVEIS_CRITICIDADE)}.")
+        return pontos_para_dicts(filtrar_pontos_por_criticidade(self.pontos, *faixa))
+
+    def _relatorio(self):
+        return {
+            'por_bairro': self._ler(gerar_relatorio_por_bairro),
+            'por_bairro_e_status': self._ler(gerar_relatorio_por_bairro_e_status),
+        }
+
+    def _status(self, id_texto, novo_status):
+        id_ponto, novo_status = _ler_id(id_texto), novo_status.lower()
+        if novo_status not in STATUS_VALIDOS:
+            raise ErroComando(f"Status inválido. Use um de: {', '.join(STATUS_VALIDOS)}.")
+        if buscar_ponto_por_id(self.pontos, id_ponto) is None:
+            raise ErroComando(f"Ponto com ID {id_ponto} não foi encontrado.")
+        self.pontos = atualizar_status_por_id(self.pontos, id_ponto, novo_status)
+        return dict(buscar_ponto_por_id(self.pontos, id_ponto))
+
+    def _cadastrar(self, *argumentos):
+        # O bairro pode vir sem aspas: a última palavra é a criticidade, o resto é o bairro.
+        if len(argumentos) < 2:
+            raise ErroComando("Use: cadastrar <bairro> <criticidade>.")
+        try:
+            criticidade = int(argumentos[-1])
+        except ValueError:
+            raise ErroComando("A criticidade deve ser um número.") from None
+        novo_ponto = {'id': gerar_proximo_id(self.pontos), 'bairro': ' '.join(argumentos[:-1]).strip(),
+                      'criticidade': criticidade, 'status': 'pendente'}
+        erros = validar_ponto(novo_ponto)
+        if erros:
+            raise ErroComando(" ".join(erros))
+        self.pontos = inserir_ponto(self.pontos, novo_ponto)
+        return novo_ponto
+
+    def _filtrar(self, status):
+        filtro = self._filtros_por_status.get(status.lower())
+        if filtro is None:
+            raise ErroComando(f"Status inválido. Use um de: {', '.join(STATUS_VALIDOS)}.")
+        return pontos_para_dicts(self._ler(filtro))
+
+    def _importar(self, caminho):
+        # Só quem importa arquivos paga pela importação do `csv`/`json`.
+        from ingestao import ler_pontos_csv, ler_pontos_jsonl
+        ler_pontos = ler_pontos_jsonl if caminho.endswith('.jsonl') else ler_pontos_csv
+        invalidos = []
+        try:
+            novos = list(ler_pontos(caminho, invalidos))
+        except OSError as erro:
+            raise ErroComando(f"Não foi possível ler '{caminho}' ({erro.strerror}).") from None
+        inserir_varios = getattr(self.pontos, 'inserir_varios', None)
+        if inserir_varios is not None:
+            # Uma transação só (SQLite): com um ID repetido, nada é gravado.
+            try:
+                inserir_varios(novos)
+            except ValueError as erro:
+                raise ErroComando(f"{erro} Nada foi importado.") from None
+        else:
+            # Os pontos entram um a um (e vão para o log em disco, se houver), então
+            # os IDs são conferidos antes, para que a importação seja tudo ou nada.
+            repetido = _id_repetido(self.pontos, novos)
+            if repetido is not None:
+                raise ErroComando(f"Já existe um ponto com ID {repetido}. Nada foi importado.")
+            if not hasattr(self.pontos, 'inserir'):
+                self.pontos = [*self.pontos, *novos]  # lista comum: uma lista nova, como no `inserir_ponto`
+            else:
+                for ponto in novos:
+                    self.pontos = inserir_ponto(self.pontos, ponto)
+        return {'importados': len(novos), 'invalidos': [[linha, erros] for linha, erros in invalidos]}
+
+    # comando -> (método, quantidade de argumentos; `None` quando o método confere sozinho)
+    COMANDOS = {
+        'bairro': (_bairro, None),
+        'bairros': (_bairros, 0),
+        'criticidade': (_criticidade, 1),
+        'relatorio': (_relatorio, 0),
+        'status': (_status, 2),
+        'cadastrar': (_cadastrar, None),
+        'filtrar': (_filtrar, 1),
+        'importar': (_importar, 1),
+    }
+
+    def executar(self, comando: str, *argumentos):
+        """Executa um comando e devolve o resultado; problemas levantam `ErroComando`."""
+        metodo, quantidade = self.COMANDOS.get(comando.lower(), (None, None))
+        if metodo is None:
+            raise ErroComando(f"Comando desconhecido: '{comando}'. Use um de: {', '.join(self.COMANDOS)}.")
+        if quantidade is not None and len(argumentos) != quantidade:
+            raise ErroComando(f"O comando '{comando}' recebe {quantidade} argumento(s), não {len(argumentos)}.")
+        return metodo(self, *argumentos)
+
+    def executar_linhas(self, linhas, saida, formato: str = 'texto') -> int:
+        """
+        Executa cada linha de `linhas` e escreve as respostas em `saida`.
+
+        Retorna quantos comandos deram erro. Um erro inesperado da coleção
+        (do SQLite, por exemplo) também vira uma resposta de erro daquela
+        linha, sem interromper o lote. Quem chama decide o tamanho do buffer
+        de `saida` e quando esvaziá-lo.
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato inválido: '{formato}'. Use um de: {', '.join(FORMATOS)}.")
+        escrever = _escritor_jsonl(saida) if formato == 'jsonl' else _escritor_texto(saida)
+        erros = 0
+        for numero, linha in enumerate(linhas, start=1):
+            palavras = []
+            try:
+                palavras = separar_comando(linha)
+                if not palavras:
+                    continue
+                resultado = self.executar(*palavras)
+            except ErroComando as erro:
+                erros += 1
+                escrever(numero, linha, palavras, erro=str(erro))
+            except Exception as erro:
+                erros += 1
+                escrever(numero, linha, palavras, erro=f"Erro interno: {erro}")
+            else:
+                escrever(numero, linha, palavras, resultado=resultado)
+        return erros
+
+
+def _escritor_jsonl(saida):
+    import json  # só o formato JSON Lines precisa dele
+    codificar = json.JSONEncoder(ensure_ascii=False).encode
+
+    def escrever(numero, linha, palavras, resultado=None, erro=None):
+        registro = {'linha': numero, 'comando': palavras[0] if palavras else None}
+        if erro is None:
+            registro['resultado'] = resultado
+        else:
+            registro['erro'] = erro
+        saida.write(codificar(registro) + '\n')
+    return escrever
+
+
+def _linhas_de_pontos(pontos) -> list[str]:
+    return [f"{p['id']}\t{p['bairro']}\t{p['criticidade']}\t{p['status']}" for p in pontos]
+
+
+def _linhas_de_relatorio(relatorio) -> list[str]:
+    por_status = relatorio['por_bairro_e_status']
+    return [
+        f"{bairro}\t{total}\t" + ' '.join(f"{status}={quantidade}" for status, quantidade in por_status[bairro].items())
+        for bairro, total in relatorio['por_bairro'].items()
+    ]
+
+
+# Como cada comando aparece no formato texto: uma linha por ponto, separada por tabulações.
+_FORMATOS_TEXTO = {
+    'bairros': list,
+    'relatorio': _linhas_de_relatorio,
+    'status': lambda ponto: _linhas_de_pontos([ponto]),
+    'cadastrar': lambda ponto: _linhas_de_pontos([ponto]),
+    'importar': lambda resumo: [f"importados={resumo['importados']} invalidos={len(resumo['invalidos'])}"]
+                               + [f"linha {linha}: {' '.join(erros)}" for linha, erros in resumo['invalidos']],
+}
+
+
+def _escritor_texto(saida):
+    def escrever(numero, linha, palavras, resultado=None, erro=None):
+        cabecalho = f"# {linha.strip()}"
+        if erro is not None:
+            saida.write(f"{cabecalho}\nERRO (linha {numero}): {erro}\n")
+            return
+        linhas = _FORMATOS_TEXTO.get(palavras[0].lower(), _linhas_de_pontos)(resultado)
+        saida.write('\n'.join([cabecalho, *linhas]) + '\n')
+    return escrever
@@ -0,0 +1,108 @@
+# src/paralelo.py
+"""
+Execução em vários processos para os trabalhos em massa (ex.: rotinas noturnas).
+
+A lista de pontos é dividida em blocos, e cada bloco é processado por um
+processo diferente com `concurrent.futures.ProcessPoolExecutor`, usando as
+mesmas funções puras do `core.py`:
+
+- `atualizar_status_pontos_paralelo`: aplica a função de atualização em
+  todos os blocos e junta o resultado na ordem original;
+- `gerar_relatorio_por_bairro_paralelo`: conta cada bloco separadamente e
+  soma os `Counter` parciais.
+
+Como os blocos viajam entre processos, a função de atualização precisa poder
+ser "picklada": uma função definida no nível do módulo ou um objeto como a
+`RegraReclassificacao` (uma lambda não serve).
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import date
+from functools import partial
+from itertools import chain, islice
+
+from core import agrupar_bairros, atualizar_status_pontos, gerar_relatorio_por_bairro
+
+TAMANHO_BLOCO_PADRAO = 50_000
+
+
+def dividir_em_blocos(pontos, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+    """Gera listas com até `tamanho_bloco` pontos, na ordem original."""
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco deve ser pelo menos 1.")
+    iterador = iter(pontos)
+    while bloco := list(islice(iterador, tamanho_bloco)):
+        yield bloco
+
+
+def _executor(processos, executor):
+    """Usa o executor recebido (sem fechá-lo) ou cria um só para esta chamada."""
+    return nullcontext(executor) if executor is not None else ProcessPoolExecutor(max_workers=processos)
+
+
+def atualizar_status_pontos_paralelo(pontos, funcao_atualizacao, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                                     processos: int = None, executor=None) -> list[dict]:
+    """
+    Versão em vários processos de `atualizar_status_pontos`.
+
+    O resultado é exatamente o da versão sequencial, na mesma ordem.
+    `processos` é o número de processos (padrão: um por núcleo) e `executor`
+    permite reaproveitar um `ProcessPoolExecutor` já aberto.
+    """
+    tarefa = partial(atualizar_status_pontos, funcao_atualizacao=funcao_atualizacao)
+    with _executor(processos, executor) as pool:
+        return list(chain.from_iterable(pool.map(tarefa, dividir_em_blocos(pontos, tamanho_bloco))))
+
+
+def gerar_relatorio_por_bairro_paralelo(pontos, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                                        processos: int = None, executor=None) -> dict:
+    """
+    Versão em vários processos de `gerar_relatorio_por_bairro`.
+
+    Os blocos são somados na ordem original, então os bairros aparecem na
+    mesma ordem (e com os mesmos nomes) do relatório sequencial. Cada bloco
+    escolhe o nome de um bairro pela sua primeira grafia, então no fim
+    juntamos de novo as grafias de blocos diferentes.
+    """
+    total = Counter()
+    with _executor(processos, executor) as pool:
+        for parcial in pool.map(gerar_relatorio_por_bairro, dividir_em_blocos(pontos, tamanho_bloco)):
+            total.update(parcial)
+    return agrupar_bairros(total)
+
+
+class RegraReclassificacao:
+    """
+    Regra de reclassificação para as rotinas noturnas, que pode ser enviada
+    para outros processos.
+
+    Um ponto com `status_atual` e criticidade abaixo de `criticidade_abaixo_de`
+    passa para `novo_status`. Se `registrado_antes_de` (uma `date`) for
+    informado, só são afetados os pontos com o campo opcional
+    `data_registro` (texto no formato 'AAAA-MM-DD') anterior a essa data.
+
+        regra = RegraReclassificacao('resolvido', criticidade_abaixo_de=3,
+                                     registrado_antes_de=date.today() - timedelta(days=30))
+        pontos = atualizar_status_pontos_paralelo(pontos, regra)
+    """
+
+    def __init__(self, novo_status: str, criticidade_abaixo_de: int, status_atual: str = 'pendente',
+                 registrado_antes_de: date = None):
+        self.novo_status = novo_status
+        self.criticidade_abaixo_de = criticidade_abaixo_de
+        self.status_atual = status_atual
+        self.registrado_antes_de = registrado_antes_de
+
+    def _antigo_o_bastante(self, ponto: dict) -> bool:
+        if self.registrado_antes_de is None:
+            return True
+        data_registro = ponto.get('data_registro')
+        return data_registro is not None and date.fromisoformat(data_registro) < self.registrado_antes_de
+
+    def __call__(self, ponto: dict) -> dict:
+        if (ponto['status'] == self.status_atual
+                and ponto['criticidade'] < self.criticidade_abaixo_de
+                and self._antigo_o_bastante(ponto)):
+            return {**ponto, 'status': self.novo_status}
+        return ponto
@@ -0,0 +1,388 @@
+# src/persistente.py
+"""
+Estruturas de dados persistentes (imutáveis com compartilhamento estrutural).
+
+O `core.py` nunca modifica os dados: cada atualização devolve uma coleção
+nova. Com uma lista comum isso significa copiar a lista inteira a cada
+mudança. As estruturas deste arquivo são árvores largas (32 filhos por nó)
+em que uma "alteração" copia apenas o caminho da raiz até o item alterado,
+em O(log32 n), e todo o resto é compartilhado com a versão anterior.
+
+Como nenhuma versão é modificada depois de criada, guardar uma versão
+antiga (para desfazer ou auditar) custa O(1): basta manter a referência.
+"""
+
+_BITS = 5
+_LARGURA = 1 << _BITS     # 32 filhos por nó
+_MASCARA = _LARGURA - 1
+
+
+def _contar_bits(numero: int) -> int:
+    return bin(numero).count('1')
+
+
+# ---------------------------------------------------------------------------
+# Vetor persistente
+# ---------------------------------------------------------------------------
+
+def _folhas(no: tuple, nivel: int):
+    """Percorre a árvore do vetor devolvendo as folhas em ordem."""
+    if nivel == _BITS:
+        yield from no
+    else:
+        for filho in no:
+            yield from _folhas(filho, nivel - _BITS)
+
+
+def _caminho(nivel: int, folha: tuple) -> tuple:
+    """Cria uma "linha" de nós com a folha no fundo."""
+    no = folha
+    while nivel > 0:
+        no = (no,)
+        nivel -= _BITS
+    return no
+
+
+def _empurrar_folha(tamanho: int, nivel: int, pai: tuple, folha: tuple) -> tuple:
+    """Devolve uma cópia de `pai` com a `folha` pendurada na última posição."""
+    indice = ((tamanho - 1) >> nivel) & _MASCARA
+    if nivel == _BITS:
+        filho = folha
+    elif indice < len(pai):
+        filho = _empurrar_folha(tamanho, nivel - _BITS, pai[indice], folha)
+    else:
+        filho = _caminho(nivel - _BITS, folha)
+    return pai[:indice] + (filho,) + pai[indice + 1:]
+
+
+def _substituir_no(no: tuple, nivel: int, posicao: int, valor) -> tuple:
+    """Copia apenas o caminho até `posicao`, trocando o item no fundo."""
+    indice = (posicao >> nivel) & _MASCARA
+    if nivel == 0:
+        filho = valor
+    else:
+        filho = _substituir_no(no[indice], nivel - _BITS, posicao, valor)
+    return no[:indice] + (filho,) + no[indice + 1:]
+
+
+class VetorPersistente:
+    """
+    Sequência imutável com acesso, troca e inserção no fim em O(log32 n).
+
+    Os itens ficam em folhas de 32 posições penduradas em uma árvore de nós
+    também de 32 posições, e os últimos itens ficam em uma "cauda" separada,
+    o que deixa a inserção no fim praticamente O(1).
+    """
+
+    __slots__ = ('_tamanho', '_nivel', '_raiz', '_cauda')
+
+    def __init__(self, itens=()):
+        itens = list(itens)
+        tamanho = len(itens)
+        inicio_cauda = 0 if tamanho < _LARGURA else ((tamanho - 1) >> _BITS) << _BITS
+        nos = [tuple(itens[i:i + _LARGURA]) for i in range(0, inicio_cauda, _LARGURA)]
+        nivel = _BITS
+        while len(nos) > _LARGURA:
+            nos = [tuple(nos[i:i + _LARGURA]) for i in range(0, len(nos), _LARGURA)]
+            nivel += _BITS
+        self._tamanho = tamanho
+        self._nivel = nivel
+        self._raiz = tuple(nos)
+        self._cauda = tuple(itens[inicio_cauda:])
+
+    @classmethod
+    def _criar(cls, tamanho, nivel, raiz, cauda):
+        vetor = cls.__new__(cls)
+        vetor._tamanho, vetor._nivel, vetor._raiz, vetor._cauda = tamanho, nivel, raiz, cauda
+        return vetor
+
+    def _inicio_cauda(self) -> int:
+        return self._tamanho - len(self._cauda)
+
+    def __len__(self):
+        return self._tamanho
+
+    def __iter__(self):
+        for folha in _folhas(self._raiz, self._nivel):
+            yield from folha
+        yield from self._cauda
+
+    def __getitem__(self, posicao: int):
+        if posicao < 0:
+            posicao += self._tamanho
+        if not 0 <= posicao < self._tamanho:
+            raise IndexError("posição fora do vetor")
+        inicio_cauda = self._inicio_cauda()
+        if posicao >= inicio_cauda:
+            return self._cauda[posicao - inicio_cauda]
+        no = self._raiz
+        nivel = self._nivel
+        while nivel > 0:
+            no = no[(posicao >> nivel) & _MASCARA]
+            nivel -= _BITS
+        return no[posicao & _MASCARA]
+
+    def __repr__(self):
+        return f"VetorPersistente({list(self)!r})"
+
+    def anexar(self, valor) -> 'VetorPersistente':
+        """Devolve um vetor novo com `valor` no fim."""
+        if len(self._cauda) < _LARGURA:
+            return self._criar(self._tamanho + 1, self._nivel, self._raiz, self._cauda + (valor,))
+        # A cauda está cheia: ela vira uma folha da árvore e começamos outra.
+        if (self._tamanho >> _BITS) > (1 << self._nivel):
+            raiz = (self._raiz, _caminho(self._nivel, self._cauda))
+            nivel = self._nivel + _BITS
+        else:
+            raiz = _empurrar_folha(self._tamanho, self._nivel, self._raiz, self._cauda)
+            nivel = self._nivel
+        return self._criar(self._tamanho + 1, nivel, raiz, (valor,))
+
+    def substituir(self, posicao: int, valor) -> 'VetorPersistente':
+        """Devolve um vetor novo com `valor` na `posicao`."""
+        if posicao < 0:
+            posicao += self._tamanho
+        if not 0 <= posicao < self._tamanho:
+            raise IndexError("posição fora do vetor")
+        inicio_cauda = self._inicio_cauda()
+        if posicao >= inicio_cauda:
+            indice = posicao - inicio_cauda
+            cauda = self._cauda[:indice] + (valor,) + self._cauda[indice + 1:]
+            return self._criar(self._tamanho, self._nivel, self._raiz, cauda)
+        raiz = _substituir_no(self._raiz, self._nivel, posicao, valor)
+        return self._criar(self._tamanho, self._nivel, raiz, self._cauda)
+
+
+# ---------------------------------------------------------------------------
+# Mapa persistente (HAMT - Hash Array Mapped Trie)
+# ---------------------------------------------------------------------------
+
+class _NoBitmap:
+    """Nó do HAMT: o bitmap diz quais das 32 posições estão ocupadas."""
+
+    __slots__ = ('bitmap', 'itens')
+
+    def __init__(self, bitmap: int, itens: tuple):
+        self.bitmap = bitmap
+        self.itens = itens  # cada item é um par (chave, valor) ou um nó filho
+
+
+class _NoColisao:
+    """Guarda chaves diferentes que têm exatamente o mesmo hash."""
+
+    __slots__ = ('hash', 'itens')
+
+    def __init__(self, hash_chave: int, itens: tuple):
+        self.hash = hash_chave
+        self.itens = itens
+
+
+def _hash(chave) -> int:
+    return hash(chave) & 0xFFFFFFFF
+
+
+def _juntar(deslocamento, par1, hash1, par2, hash2):
+    """Cria o menor nó que separa dois pares que caíram na mesma posição."""
+    if hash1 == hash2:
+        return _NoColisao(hash1, (par1, par2))
+    indice1 = (hash1 >> deslocamento) & _MASCARA
+    indice2 = (hash2 >> deslocamento) & _MASCARA
+    if indice1 == indice2:
+        filho = _juntar(deslocamento + _BITS, par1, hash1, par2, hash2)
+        return _NoBitmap(1 << indice1, (filho,))
+    itens = (par1, par2) if indice1 < indice2 else (par2, par1)
+    return _NoBitmap((1 << indice1) | (1 << indice2), itens)
+
+
+def _associar(no, deslocamento, hash_chave, chave, valor):
+    """Devolve `(novo_no, adicionou)`, copiando só o caminho até a chave."""
+    if isinstance(no, _NoColisao):
+        if hash_chave != no.hash:
+            # Chegou uma chave com outro hash: o nó de colisão vira filho de um nó comum.
+            envolvido = _NoBitmap(1 << ((no.hash >> deslocamento) & _MASCARA), (no,))
+            return _associar(envolvido, deslocamento, hash_chave, chave, valor)
+        for posicao, (existente, _) in enumerate(no.itens):
+            if existente == chave:
+                itens = no.itens[:posicao] + ((chave, valor),) + no.itens[posicao + 1:]
+                return _NoColisao(no.hash, itens), False
+        return _NoColisao(no.hash, no.itens + ((chave, valor),)), True
+
+    bit = 1 << ((hash_chave >> deslocamento) & _MASCARA)
+    posicao = _contar_bits(no.bitmap & (bit - 1))
+    if not no.bitmap & bit:
+        itens = no.itens[:posicao] + ((chave, valor),) + no.itens[posicao:]
+        return _NoBitmap(no.bitmap | bit, itens), True
+
+    item = no.itens[posicao]
+    if isinstance(item, tuple):
+        if item[0] == chave:
+            novo_item, adicionou = (chave, valor), False
+        else:
+            novo_item = _juntar(deslocamento + _BITS, item, _hash(item[0]), (chave, valor), hash_chave)
+            adicionou = True
+    else:
+        novo_item, adicionou = _associar(item, deslocamento + _BITS, hash_chave, chave, valor)
+    itens = no.itens[:posicao] + (novo_item,) + no.itens[posicao + 1:]
+    return _NoBitmap(no.bitmap, itens), adicionou
+
+
+def _pares(no):
+    for item in no.itens:
+        if isinstance(item, tuple):
+            yield item
+        else:
+            yield from _pares(item)
+
+
+_VAZIO = object()
+
+
+class MapaPersistente:
+    """
+    Dicionário imutável em que `associar` devolve um mapa novo em O(log32 n).
+
+    Não guarda a ordem de inserção: para isso usamos o `VetorPersistente`.
+    """
+
+    __slots__ = ('_raiz', '_tamanho')
+
+    def __init__(self, pares=()):
+        self._raiz = _NoBitmap(0, ())
+        self._tamanho = 0
+        for chave, valor in (pares.items() if isinstance(pares, dict) else pares):
+            self._raiz, adicionou = _associar(self._raiz, 0, _hash(chave), chave, valor)
+            self._tamanho += adicionou
+
+    def __len__(self):
+        return self._tamanho
+
+    def __iter__(self):
+        return (chave for chave, _ in _pares(self._raiz))
+
+    def __contains__(self, chave):
+        return self.obter(chave, _VAZIO) is not _VAZIO
+
+    def __getitem__(self, chave):
+        valor = self.obter(chave, _VAZIO)
+        if valor is _VAZIO:
+            raise KeyError(chave)
+        return valor
+
+    def items(self):
+        return _pares(self._raiz)
+
+    def obter(self, chave, padrao=None):
+        hash_chave = _hash(chave)
+        no = self._raiz
+        deslocamento = 0
+        while True:
+            if isinstance(no, _NoColisao):
+                for existente, valor in no.itens:
+                    if existente == chave:
+                        return valor
+                return padrao
+            bit = 1 << ((hash_chave >> deslocamento) & _MASCARA)
+            if not no.bitmap & bit:
+                return padrao
+            item = no.itens[_contar_bits(no.bitmap & (bit - 1))]
+            if isinstance(item, tuple):
+                return item[1] if item[0] == chave else padrao
+            no = item
+            deslocamento += _BITS
+
+    def associar(self, chave, valor) -> 'MapaPersistente':
+        """Devolve um mapa novo em que `chave` aponta para `valor`."""
+        raiz, adicionou = _associar(self._raiz, 0, _hash(chave), chave, valor)
+        mapa = MapaPersistente.__new__(MapaPersistente)
+        mapa._raiz = raiz
+        mapa._tamanho = self._tamanho + adicionou
+        return mapa
+
+
+# ---------------------------------------------------------------------------
+# Coleção de pontos
+# ---------------------------------------------------------------------------
+
+class ColecaoPontos:
+    """
+    Coleção imutável de pontos de descarte, na ordem de inserção.
+
+    Junta um `VetorPersistente` com os pontos e um `MapaPersistente` que leva
+    o ID de cada ponto até a sua posição no vetor. Inserir e atualizar
+    devolvem uma coleção nova em O(log32 n), compartilhando quase toda a
+    estrutura com a anterior, então cada versão é um "snapshot" de graça:
+
+        versoes = [colecao]
+        versoes.append(atualizar_status_por_id(versoes[-1], 3, 'resolvido'))
+        colecao_anterior = versoes[-2]   # desfazer
+
+    Ela pode ser passada para qualquer função do `core.py`.
+    """
+
+    __slots__ = ('_pontos', '_posicoes', '_maior_id')
+
+    def __init__(self, pontos=()):
+        pontos = list(pontos)
+        posicoes = {}
+        for posicao, ponto in enumerate(pontos):
+            if ponto['id'] in posicoes:
+                raise ValueError(f"Já existe um ponto com ID {ponto['id']}.")
+            posicoes[ponto['id']] = posicao
+        self._pontos = VetorPersistente(pontos)
+        self._posicoes = MapaPersistente(posicoes)
+        self._maior_id = max(posicoes, default=0)
+
+    @classmethod
+    def _criar(cls, pontos, posicoes, maior_id):
+        colecao = cls.__new__(cls)
+        colecao._pontos, colecao._posicoes, colecao._maior_id = pontos, posicoes, maior_id
+        return colecao
+
+    def __len__(self):
+        return len(self._pontos)
+
+    def __iter__(self):
+        return iter(self._pontos)
+
+    def __repr__(self):
+        return f"ColecaoPontos({list(self)!r})"
+
+    def obter(self, id_ponto: int):
+        """Retorna o ponto com esse ID, ou `None` se ele não existir."""
+        posicao = self._posicoes.obter(id_ponto)
+        return None if posicao is None else self._pontos[posicao]
+
+    def proximo_id(self) -> int:
+        return self._maior_id + 1
+
+    def inserir(self, ponto: dict) -> 'ColecaoPontos':
+        """Devolve uma coleção nova com o ponto no fim."""
+        if ponto['id'] in self._posicoes:
+            raise ValueError(f"Já existe um ponto com ID {ponto['id']}.")
+        return self._criar(
+            self._pontos.anexar(ponto),
+            self._posicoes.associar(ponto['id'], len(self._pontos)),
+            max(self._maior_id, ponto['id']),
+        )
+
+    def atualizar(self, id_ponto: int, **campos) -> 'ColecaoPontos':
+        """Devolve uma coleção nova em que o ponto `id_ponto` tem os `campos` alterados."""
+        posicao = self._posicoes[id_ponto]
+        novo = {**self._pontos[posicao], **campos}
+        if novo['id'] != id_ponto:
+            raise ValueError("O ID de um ponto não pode ser alterado.")
+        return self._criar(self._pontos.substituir(posicao, novo), self._posicoes, self._maior_id)
+
+    def atualizar_status(self, novos_status: dict) -> 'ColecaoPontos':
+        """
+        Aplica um dicionário `{id: novo_status}` e devolve a coleção nova.
+
+        É o caminho usado por `atualizar_status_em_lote` no `core.py`. IDs
+        inexistentes são ignorados, como na versão de lista.
+        """
+        pontos = self._pontos
+        for id_ponto, status in novos_status.items():
+            posicao = self._posicoes.obter(id_ponto)
+            if posicao is not None:
+                pontos = pontos.substituir(posicao, {**pontos[posicao], 'status': status})
+        return self._criar(pontos, self._posicoes, self._maior_id)
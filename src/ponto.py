@@ -0,0 +1,108 @@
+# src/ponto.py
+"""
+Um tipo compacto para representar um ponto de descarte.
+
+Cada ponto em `PONTOS_DE_DESCARTE` é um dicionário com 4 chaves, e cada um
+guarda a sua própria cópia do nome do bairro e do status. Com milhões de
+pontos isso pesa. O `Ponto` guarda os mesmos dados de forma enxuta:
+
+- `__slots__`: sem o dicionário interno que todo objeto Python tem;
+- bairro "internado": pontos do mesmo bairro apontam para a mesma string;
+- status como um pequeno inteiro (`StatusPonto`), ligado a `STATUS_VALIDOS`.
+
+Continua sendo possível ler `ponto['bairro']`, `ponto['status']` etc., então
+as funções do `core.py` funcionam com listas de `Ponto` sem mudanças.
+"""
+import sys
+from collections.abc import Mapping
+from enum import IntEnum
+
+from core import STATUS_VALIDOS
+
+# Um código inteiro para cada status válido, na mesma ordem de STATUS_VALIDOS.
+StatusPonto = IntEnum('StatusPonto', {status.upper(): codigo for codigo, status in enumerate(STATUS_VALIDOS)})
+
+_CAMPOS = ('id', 'bairro', 'criticidade', 'status')
+
+
+def codificar_status(status: str) -> StatusPonto:
+    """Converte o texto do status no seu código; levanta `ValueError` se ele não for válido."""
+    if status not in STATUS_VALIDOS:
+        raise ValueError(f"Status inválido: {status!r}. Use um de: {', '.join(STATUS_VALIDOS)}.")
+    return StatusPonto(STATUS_VALIDOS.index(status))
+
+
+class Ponto(Mapping):
+    """
+    Ponto de descarte imutável e compacto, que se comporta como um dicionário
+    somente leitura com as chaves 'id', 'bairro', 'criticidade' e 'status'.
+
+    Para "alterar" um ponto, use `substituir`, que devolve um `Ponto` novo.
+    """
+
+    __slots__ = ('id', 'criticidade', '_bairro', '_status')
+
+    def __init__(self, id_ponto: int, bairro: str, criticidade: int, status: str = 'pendente'):
+        object.__setattr__(self, 'id', id_ponto)
+        object.__setattr__(self, 'criticidade', criticidade)
+        object.__setattr__(self, '_bairro', sys.intern(bairro))
+        object.__setattr__(self, '_status', codificar_status(status))
+
+    @classmethod
+    def de_dict(cls, ponto) -> 'Ponto':
+        return cls(ponto['id'], ponto['bairro'], ponto['criticidade'], ponto['status'])
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("Ponto é imutável; use substituir() para criar um ponto novo.")
+
+    @property
+    def bairro(self) -> str:
+        return self._bairro
+
+    @property
+    def status(self) -> str:
+        return STATUS_VALIDOS[self._status]
+
+    @property
+    def codigo_status(self) -> StatusPonto:
+        return self._status
+
+    def __getitem__(self, campo: str):
+        if campo == 'id':
+            return self.id
+        if campo == 'bairro':
+            return self._bairro
+        if campo == 'criticidade':
+            return self.criticidade
+        if campo == 'status':
+            return STATUS_VALIDOS[self._status]
+        raise KeyError(campo)
+
+    def __iter__(self):
+        return iter(_CAMPOS)
+
+    def __len__(self):
+        return len(_CAMPOS)
+
+    def __repr__(self):
+        return f"Ponto(id={self.id}, bairro={self._bairro!r}, criticidade={self.criticidade}, status={self.status!r})"
+
+    def __reduce__(self):
+        return (Ponto, (self.id, self._bairro, self.criticidade, self.status))
+
+    def substituir(self, **campos) -> 'Ponto':
+        """Devolve um `Ponto` novo com os `campos` alterados."""
+        return Ponto(
+            campos.get('id', self.id),
+            campos.get('bairro', self._bairro),
+            campos.get('criticidade', self.criticidade),
+            campos.get('status', self.status),
+        )
+
+    def para_dict(self) -> dict:
+        return {'id': self.id, 'bairro': self._bairro, 'criticidade': self.criticidade, 'status': self.status}
+
+
+def compactar_pontos(pontos) -> list[Ponto]:
+    """Converte uma coleção de dicionários em uma lista de `Ponto`."""
+    return [Ponto.de_dict(ponto) for ponto in pontos]
@@ -0,0 +1,248 @@
+# src/repositorio_sqlite.py
+"""
+Repositório de pontos guardado em um banco SQLite (módulo `sqlite3` do Python).
+
+Ele oferece os mesmos "ganchos" que o `PontoStore` (`buscar_por_bairro`,
+`relatorio_por_bairro`, `atualizar_status_no_lugar` ...), então as funções do
+`core.py` funcionam com ele sem mudanças, mas cada filtro e relatório vira
+uma consulta SQL que usa os índices do banco.
+
+Detalhes:
+- modo WAL, para que as leituras não esperem pelas escritas;
+- uma conexão de escrita (protegida por uma trava) e um pequeno "pool" de
+  conexões de leitura, para atender várias threads ao mesmo tempo;
+- inserções e atualizações em lote com `executemany`, numa única transação;
+- a comparação de bairros usa a collation `BAIRRO`, que segue exatamente a
+  regra de `normalizar_bairro` do `core.py` (a `NOCASE` do SQLite só ignora
+  maiúsculas em letras sem acento).
+
+O banco precisa ser um arquivo (não `:memory:`), já que cada conexão do
+pool abre o mesmo arquivo. O atributo `versao` (usado pelo `cache.py`) só
+conta as escritas feitas por este objeto, não as de outros programas que
+abram o mesmo banco.
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from core import agrupar_bairros, chave_ordem_bairro, normalizar_bairro, NIVEIS_CRITICIDADE
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pontos (
+    ordem INTEGER PRIMARY KEY,          -- ordem de inserção
+    id INTEGER NOT NULL UNIQUE,
+    bairro TEXT NOT NULL,
+    criticidade INTEGER NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pontos_bairro ON pontos (bairro COLLATE BAIRRO);
+CREATE INDEX IF NOT EXISTS idx_pontos_status ON pontos (status);
+CREATE INDEX IF NOT EXISTS idx_pontos_criticidade ON pontos (criticidade);
+"""
+
+_COLUNAS = "id, bairro, criticidade, status"
+
+# Versão da regra de `normalizar_bairro` usada para montar o índice de bairros
+# (guardada em `PRAGMA user_version`). Quando a regra muda, o índice precisa ser
+# refeito, senão o SQLite procuraria os bairros na ordem antiga.
+# 1: maiúsculas, acentos e espaços repetidos são ignorados.
+_VERSAO_COLLATION = 1
+
+
+def _comparar_bairros(bairro_a: str, bairro_b: str) -> int:
+    chave_a, chave_b = normalizar_bairro(bairro_a), normalizar_bairro(bairro_b)
+    return (chave_a > chave_b) - (chave_a < chave_b)
+
+
+def _para_ponto(linha) -> dict:
+    return {'id': linha[0], 'bairro': linha[1], 'criticidade': linha[2], 'status': linha[3]}
+
+
+class RepositorioSQLite:
+    """Coleção de pontos persistida em SQLite, com as consultas do `core.py` feitas em SQL."""
+
+    # Pode ser consultado por várias threads ao mesmo tempo (usado pelo `servidor.py`).
+    seguro_entre_threads = True
+
+    def __init__(self, caminho: str, leitores: int = 4):
+        if caminho == ':memory:':
+            raise ValueError("Use um arquivo: cada conexão do pool precisa enxergar o mesmo banco.")
+        self.caminho = caminho
+        self._escrita = self._conectar()
+        self._escrita.execute("PRAGMA journal_mode=WAL")
+        self._escrita.execute("PRAGMA synchronous=NORMAL")
+        self._escrita.executescript(_ESQUEMA)
+        if self._escrita.execute("PRAGMA user_version").fetchone()[0] < _VERSAO_COLLATION:
+            self._escrita.execute("REINDEX BAIRRO")
+            self._escrita.execute(f"PRAGMA user_version = {_VERSAO_COLLATION}")
+        self.versao = 0
+        self._trava_escrita = threading.Lock()
+        self._leitores = queue.Queue()
+        for _ in range(leitores):
+            self._leitores.put(self._conectar())
+
+    def _conectar(self) -> sqlite3.Connection:
+        conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+        conexao.create_collation('BAIRRO', _comparar_bairros)
+        return conexao
+
+    @contextmanager
+    def _leitura(self):
+        """Empresta uma conexão de leitura do pool (espera se todas estiverem em uso)."""
+        conexao = self._leitores.get()
+        try:
+            yield conexao
+        finally:
+            self._leitores.put(conexao)
+
+    def _consultar(self, sql: str, parametros=()) -> list:
+        with self._leitura() as conexao:
+            return conexao.execute(sql, parametros).fetchall()
+
+    def fechar(self):
+        while not self._leitores.empty():
+            self._leitores.get().close()
+        self._escrita.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    # --- Coleção ---
+
+    def __len__(self):
+        return self._consultar("SELECT COUNT(*) FROM pontos")[0][0]
+
+    def __iter__(self):
+        return iter([_para_ponto(linha) for linha in self._consultar(f"SELECT {_COLUNAS} FROM pontos ORDER BY ordem")])
+
+    def obter(self, id_ponto: int):
+        linhas = self._consultar(f"SELECT {_COLUNAS} FROM pontos WHERE id = ?", (id_ponto,))
+        return _para_ponto(linhas[0]) if linhas else None
+
+    def proximo_id(self) -> int:
+        # MAX(id) é respondido pelo índice único de id, sem percorrer a tabela.
+        return self._consultar("SELECT COALESCE(MAX(id), 0) + 1 FROM pontos")[0][0]
+
+    def listar_bairros(self) -> list[str]:
+        # Uma grafia por bairro, a mais antiga, como o `listar_bairros` do core.
+        linhas = self._consultar("SELECT bairro FROM pontos GROUP BY bairro ORDER BY MIN(ordem)")
+        return sorted(agrupar_bairros({bairro: 1 for bairro, in linhas}), key=chave_ordem_bairro)
+
+    # --- Escritas ---
+
+    def inserir_varios(self, pontos):
+        """Insere vários pontos em uma única transação."""
+        with self._trava_escrita:
+            try:
+                with self._escrita:
+                    self._escrita.executemany(
+                        "INSERT INTO pontos (id, bairro, criticidade, status) VALUES (?, ?, ?, ?)",
+                        ((ponto['id'], ponto['bairro'], ponto['criticidade'], ponto['status']) for ponto in pontos)
+                    )
+                self.versao += 1
+            except sqlite3.IntegrityError as erro:
+                raise ValueError(f"Ponto com ID repetido: {erro}") from erro
+
+    def inserir(self, ponto: dict) -> dict:
+        self.inserir_varios([ponto])
+        return ponto
+
+    def atualizar_status_no_lugar(self, novos_status: dict):
+        """
+        Aplica um dicionário `{id: novo_status}` no banco, em uma única transação.
+
+        É o caminho usado por `atualizar_status_em_lote` no `core.py`. IDs
+        inexistentes são ignorados. Como no `PontoStore`, o próprio
+        repositório é atualizado (não há uma coleção nova).
+        """
+        with self._trava_escrita:
+            with self._escrita:
+                self._escrita.executemany(
+                    "UPDATE pontos SET status = ? WHERE id = ?",
+                    ((status, id_ponto) for id_ponto, status in novos_status.items())
+                )
+            # Só depois do COMMIT: uma leitura que visse a versão nova antes disso
+            # poderia guardar no cache as linhas antigas com o número novo.
+            self.versao += 1
+
+    # --- Filtros (usados pelas funções do core.py) ---
+
+    def buscar_por_bairro(self, bairro: str) -> list[dict]:
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS} FROM pontos WHERE bairro = ? COLLATE BAIRRO ORDER BY ordem", (bairro,)
+        )
+        return [_para_ponto(linha) for linha in linhas]
+
+    def buscar_por_criticidade(self, nivel_min: int, nivel_max: int) -> list[dict]:
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS} FROM pontos WHERE criticidade BETWEEN ? AND ? ORDER BY ordem", (nivel_min, nivel_max)
+        )
+        return [_para_ponto(linha) for linha in linhas]
+
+    def buscar_por_status(self, status: str) -> list[dict]:
+        linhas = self._consultar(f"SELECT {_COLUNAS} FROM pontos WHERE status = ? ORDER BY ordem", (status,))
+        return [_para_ponto(linha) for linha in linhas]
+
+    def executar_consulta(self, consulta) -> list[dict]:
+        """
+        Executa uma `Consulta` do `core.py` inteira em SQL.
+
+        Todos os critérios vão para o mesmo `WHERE`, e o planejador do SQLite
+        escolhe o índice mais seletivo. Os empates da ordenação seguem a
+        ordem de inserção, como na versão em Python.
+        """
+        condicoes, parametros = [], []
+        if consulta.bairro is not None:
+            condicoes.append("bairro = ? COLLATE BAIRRO")
+            parametros.append(consulta.bairro)
+        if consulta.status is not None:
+            condicoes.append("status = ?")
+            parametros.append(consulta.status)
+        if consulta.criticidade is not None:
+            condicoes.append("criticidade BETWEEN ? AND ?")
+            parametros.extend(consulta.criticidade)
+        sql = f"SELECT {_COLUNAS} FROM pontos"
+        if condicoes:
+            sql += " WHERE " + " AND ".join(condicoes)
+        if consulta.ordenacao is not None:
+            # O campo já foi conferido por `Consulta.ordenar_por` (CAMPOS_ORDENAVEIS).
+            campo, decrescente = consulta.ordenacao
+            sql += f" ORDER BY {campo}{' DESC' if decrescente else ''}, ordem"
+        else:
+            sql += " ORDER BY ordem"
+        if consulta.limite is not None:
+            sql += " LIMIT ?"
+            parametros.append(consulta.limite)
+        return [_para_ponto(linha) for linha in self._consultar(sql, parametros)]
+
+    # --- Relatórios ---
+
+    def relatorio_por_bairro(self) -> dict:
+        # Contamos por grafia, na ordem da primeira aparição (como o `Counter` do core),
+        # e o `agrupar_bairros` junta as grafias do mesmo bairro em Python: são poucas linhas.
+        linhas = self._consultar("SELECT bairro, COUNT(*) FROM pontos GROUP BY bairro ORDER BY MIN(ordem)")
+        return agrupar_bairros(dict(linhas))
+
+    def _relatorio_cruzado(self, expressao: str, parametros=()) -> dict:
+        linhas = self._consultar(
+            f"SELECT bairro, {expressao} AS chave, COUNT(*), MIN(ordem) FROM pontos "
+            f"GROUP BY bairro, chave ORDER BY MIN(ordem)", parametros
+        )
+        # A primeira linha de cada bairro é a do seu grupo mais antigo, então os
+        # bairros entram no dicionário na ordem da sua primeira aparição.
+        relatorio = {}
+        for bairro, chave, quantidade, _ in linhas:
+            relatorio.setdefault(bairro, {})[chave] = quantidade
+        return agrupar_bairros(relatorio)
+
+    def relatorio_por_bairro_e_status(self) -> dict:
+        return self._relatorio_cruzado("status")
+
+    def relatorio_por_bairro_e_nivel(self) -> dict:
+        casos = " ".join("WHEN criticidade BETWEEN ? AND ? THEN ?" for _ in NIVEIS_CRITICIDADE)
+        parametros = [valor for nivel, faixa in NIVEIS_CRITICIDADE.items() for valor in (*faixa, nivel)]
+        return self._relatorio_cruzado(f"CASE {casos} END", parametros)
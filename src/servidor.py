@@ -0,0 +1,313 @@
+# src/servidor.py
+"""
+Servidor HTTP/JSON (só biblioteca padrão, com `asyncio`) com as opções 1 a 6
+do menu, para vários tablets de campo ao mesmo tempo.
+
+Rotas:
+
+    GET  /pontos?bairro=...&nivel=...&status=...&limite=...   opções 1, 2 e 6 (critérios combináveis)
+    GET  /pontos/{id}                                         um ponto
+    POST /pontos/{id}/status   {"status": "resolvido"}        opção 4
+    POST /pontos               {"bairro": ..., "criticidade": ...}   opção 5
+    GET  /relatorio                                           opção 3
+    GET  /bairros?prefixo=...                                 lista de bairros / autocompletar
+
+Detalhes:
+- conexões persistentes (keep-alive) e "pipelining": o cliente pode mandar
+  várias requisições seguidas sem esperar; as respostas voltam na mesma ordem;
+- um `asyncio.Semaphore` limita quantas requisições são atendidas ao mesmo tempo;
+- leituras acontecem em paralelo; escritas (status e cadastro) passam uma de
+  cada vez por um `asyncio.Lock`;
+- as leituras usam o `CacheConsultas`, invalidado a cada escrita, e leituras
+  iguais que chegam juntas esperam o mesmo cálculo (depois de uma escrita, dez
+  pedidos de relatório simultâneos calculam o relatório uma vez só);
+- coleções que podem ser usadas por várias threads (`seguro_entre_threads`,
+  como o `RepositorioSQLite`) são consultadas em threads, para que o acesso ao
+  disco não pare o servidor. As demais (o `PontoStore`) são usadas direto no
+  loop de eventos, onde nenhuma escrita acontece no meio de uma leitura;
+- com um `armazenamento` em disco (o `ArmazenamentoDuravel`), o `fsync` de
+  cada escrita roda numa thread, ainda dentro da trava de escrita: a
+  resposta só sai depois que a alteração está no disco, mas o loop de
+  eventos continua atendendo as leituras enquanto isso.
+
+Para subir: "python main.py --servidor [porta]" (veja o `main.py`).
+"""
+import asyncio
+import json
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from core import (
+    Consulta,
+    NIVEIS_CRITICIDADE,
+    STATUS_VALIDOS,
+    aplicar_consulta,
+    atualizar_status_por_id,
+    buscar_ponto_por_id,
+    gerar_proximo_id,
+    gerar_relatorio_por_bairro,
+    gerar_relatorio_por_bairro_e_status,
+    inserir_ponto,
+    listar_bairros,
+    pontos_para_dicts,
+    sugerir_bairros,
+    validar_ponto
+)
+from cache import CacheConsultas
+
+TAMANHO_MAXIMO_CORPO = 64 * 1024
+MAXIMO_CABECALHOS = 100
+
+
+class ErroHTTP(Exception):
+    """Erro que vira uma resposta com o código `status` e a `mensagem` no corpo JSON."""
+
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+class ServidorDescarte:
+    """
+    Atende as requisições sobre uma coleção de pontos (`PontoStore`, `RepositorioSQLite` ...).
+
+        servidor = ServidorDescarte(pontos)
+        await servidor.servir('127.0.0.1', 8080)
+
+    Se os pontos vêm de um `ArmazenamentoDuravel`, passe-o em `armazenamento`
+    (aberto com um `lote_fsync` grande): o servidor chama o `sincronizar` dele
+    depois de cada escrita.
+    """
+
+    def __init__(self, pontos, max_concorrencia: int = 64, cache: CacheConsultas = None, armazenamento=None):
+        self.pontos = pontos
+        self.armazenamento = armazenamento
+        self.cache = cache if cache is not None else CacheConsultas()
+        self._vagas = asyncio.Semaphore(max_concorrencia)
+        self._trava_escrita = asyncio.Lock()
+        self._em_threads = getattr(pontos, 'seguro_entre_threads', False)
+        self._em_andamento = {}  # leitura -> tarefa que está calculando o resultado
+
+    async def _executar(self, funcao, *argumentos):
+        if self._em_threads:
+            return await asyncio.to_thread(funcao, *argumentos)
+        return funcao(*argumentos)
+
+    async def _sincronizar(self):
+        """Leva as escritas ao disco numa thread (chamado com a trava de escrita)."""
+        # Na thread só o log do armazenamento é tocado, e nenhuma outra escrita
+        # acontece enquanto a trava está com a gente. O `RepositorioSQLite`
+        # grava a cada transação e não tem `sincronizar`.
+        sincronizar = getattr(self.armazenamento, 'sincronizar', None)
+        if sincronizar is not None:
+            await asyncio.to_thread(sincronizar)
+
+    async def _ler(self, funcao, *argumentos):
+        """Leitura `funcao(pontos, *argumentos)` pelo cache; pedidos iguais simultâneos compartilham o cálculo."""
+        # Como no `CacheConsultas`: a identidade da coleção entra na chave, porque
+        # uma coleção imutável nova pode ter a mesma `versao` (ou nenhuma).
+        chave = (id(self.pontos), getattr(self.pontos, 'versao', None), funcao, argumentos)
+        tarefa = self._em_andamento.get(chave)
+        if tarefa is None:
+            tarefa = asyncio.ensure_future(self._executar(self.cache.chamar, funcao, self.pontos, *argumentos))
+            self._em_andamento[chave] = tarefa
+            tarefa.add_done_callback(lambda _: self._em_andamento.pop(chave, None))
+        # `shield`: se um cliente desistir, o cálculo continua para os demais.
+        return await asyncio.shield(tarefa)
+
+    # --- Rotas ---
+
+    async def _listar_pontos(self, parametros: dict, corpo):
+        consulta = Consulta()
+        if 'bairro' in parametros:
+            consulta = consulta.do_bairro(parametros['bairro'])
+        if 'nivel' in parametros:
+            if parametros['nivel'] not in NIVEIS_CRITICIDADE:
+                raise ErroHTTP(400, f"Nível inválido. Use um de: {', '.join(NIVEIS_CRITICIDADE)}.")
+            consulta = consulta.com_criticidade(*NIVEIS_CRITICIDADE[parametros['nivel']])
+        if 'status' in parametros:
+            if parametros['status'] not in STATUS_VALIDOS:
+                raise ErroHTTP(400, f"Status inválido. Use um de: {', '.join(STATUS_VALIDOS)}.")
+            consulta = consulta.com_status(parametros['status'])
+        if 'limite' in parametros:
+            try:
+                consulta = consulta.limitar(int(parametros['limite']))
+            except ValueError:
+                raise ErroHTTP(400, "O limite deve ser um número inteiro não negativo.")
+        return 200, pontos_para_dicts(await self._ler(aplicar_consulta, consulta))
+
+    async def _obter_ponto(self, id_ponto: int, corpo):
+        ponto = await self._executar(buscar_ponto_por_id, self.pontos, id_ponto)
+        if ponto is None:
+            raise ErroHTTP(404, f"Ponto com ID {id_ponto} não foi encontrado.")
+        return 200, dict(ponto)
+
+    async def _atualizar_status(self, id_ponto: int, corpo):
+        novo_status = corpo.get('status')
+        if novo_status not in STATUS_VALIDOS:
+            raise ErroHTTP(400, f"Status inválido. Use um de: {', '.join(STATUS_VALIDOS)}.")
+        async with self._trava_escrita:
+            if await self._executar(buscar_ponto_por_id, self.pontos, id_ponto) is None:
+                raise ErroHTTP(404, f"Ponto com ID {id_ponto} não foi encontrado.")
+            self.pontos = await self._executar(atualizar_status_por_id, self.pontos, id_ponto, novo_status)
+            await self._sincronizar()
+            ponto = await self._executar(buscar_ponto_por_id, self.pontos, id_ponto)
+        return 200, dict(ponto)
+
+    async def _cadastrar_ponto(self, parametros: dict, corpo):
+        bairro = corpo.get('bairro')
+        async with self._trava_escrita:
+            # O ID é gerado dentro da trava, para que dois cadastros não peguem o mesmo.
+            novo_ponto = {
+                'id': await self._executar(gerar_proximo_id, self.pontos),
+                'bairro': bairro.strip() if isinstance(bairro, str) else bairro,
+                'criticidade': corpo.get('criticidade'),
+                'status': 'pendente',
+            }
+            erros = validar_ponto(novo_ponto)
+            if erros:
+                raise ErroHTTP(400, " ".join(erros))
+            self.pontos = await self._executar(inserir_ponto, self.pontos, novo_ponto)
+            await self._sincronizar()
+        return 201, novo_ponto
+
+    async def _relatorio(self, parametros: dict, corpo):
+        return 200, {
+            'por_bairro': await self._ler(gerar_relatorio_por_bairro),
+            'por_bairro_e_status': await self._ler(gerar_relatorio_por_bairro_e_status),
+        }
+
+    async def _bairros(self, parametros: dict, corpo):
+        if 'prefixo' in parametros:
+            return 200, await self._ler(sugerir_bairros, parametros['prefixo'], 10)
+        return 200, await self._ler(listar_bairros)
+
+    async def _despachar(self, metodo: str, caminho: str, parametros: dict, corpo):
+        """Escolhe a rota; `corpo` já vem convertido de JSON."""
+        partes = [unquote(parte) for parte in caminho.strip('/').split('/')]
+        rotas_fixas = {
+            ('GET', 'pontos'): self._listar_pontos,
+            ('POST', 'pontos'): self._cadastrar_ponto,
+            ('GET', 'relatorio'): self._relatorio,
+            ('GET', 'bairros'): self._bairros,
+        }
+        if len(partes) == 1 and partes[0] in ('pontos', 'relatorio', 'bairros'):
+            rota = rotas_fixas.get((metodo, partes[0]))
+            if rota is None:
+                raise ErroHTTP(405, f"Método {metodo} não é aceito em /{partes[0]}.")
+            return await rota(parametros, corpo)
+        if partes[0] == 'pontos' and len(partes) in (2, 3):
+            try:
+                id_ponto = int(partes[1])
+            except ValueError:
+                raise ErroHTTP(404, "Rota não encontrada.")
+            if len(partes) == 2 and metodo == 'GET':
+                return await self._obter_ponto(id_ponto, corpo)
+            if len(partes) == 3 and partes[2] == 'status' and metodo == 'POST':
+                return await self._atualizar_status(id_ponto, corpo)
+            if len(partes) == 2 or partes[2] == 'status':
+                raise ErroHTTP(405, f"Método {metodo} não é aceito em {caminho}.")
+        raise ErroHTTP(404, "Rota não encontrada.")
+
+    # --- HTTP ---
+
+    @staticmethod
+    async def _ler_requisicao(leitor: asyncio.StreamReader):
+        """Lê uma requisição; retorna `None` se o cliente fechou a conexão."""
+        linha = await leitor.readline()
+        if not linha.strip():
+            return None
+        try:
+            metodo, alvo, versao = linha.decode('latin-1').split()
+        except ValueError:
+            raise ErroHTTP(400, "Linha de requisição inválida.")
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b'\r\n', b'\n', b''):
+                break
+            if len(cabecalhos) >= MAXIMO_CABECALHOS:
+                raise ErroHTTP(431, "Cabeçalhos demais.")
+            nome, _, valor = linha.decode('latin-1').partition(':')
+            cabecalhos[nome.strip().lower()] = valor.strip()
+        try:
+            tamanho = int(cabecalhos.get('content-length', 0))
+        except ValueError:
+            raise ErroHTTP(400, "Content-Length inválido.")
+        if not 0 <= tamanho <= TAMANHO_MAXIMO_CORPO:
+            raise ErroHTTP(413, "Corpo da requisição grande demais.")
+        corpo = await leitor.readexactly(tamanho) if tamanho else b''
+        manter = cabecalhos.get('connection', '').lower()
+        manter_conexao = manter != 'close' if versao == 'HTTP/1.1' else manter == 'keep-alive'
+        return metodo.upper(), alvo, corpo, manter_conexao
+
+    async def _responder(self, metodo: str, alvo: str, corpo: bytes):
+        endereco = urlsplit(alvo)
+        parametros = {nome: valores[-1] for nome, valores in parse_qs(endereco.query).items()}
+        try:
+            dados = json.loads(corpo) if corpo else {}
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ErroHTTP(400, "O corpo deve ser um JSON válido.")
+        if not isinstance(dados, dict):
+            raise ErroHTTP(400, "O corpo deve ser um objeto JSON.")
+        async with self._vagas:
+            return await self._despachar(metodo, endereco.path, parametros, dados)
+
+    @staticmethod
+    def _montar_resposta(status: int, dados, manter_conexao: bool) -> bytes:
+        corpo = json.dumps(dados, ensure_ascii=False).encode('utf-8')
+        cabecalho = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corpo)}\r\n"
+            f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n\r\n"
+        )
+        return cabecalho.encode('latin-1') + corpo
+
+    async def _atender_conexao(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        Atende uma conexão até o cliente fechá-la.
+
+        As requisições de uma conexão são respondidas uma depois da outra, na
+        ordem em que chegaram (é o que o pipelining do HTTP/1.1 exige); a
+        concorrência vem das várias conexões.
+        """
+        try:
+            while True:
+                try:
+                    requisicao = await self._ler_requisicao(leitor)
+                except ErroHTTP as erro:
+                    # A requisição nem pôde ser lida: respondemos e fechamos a conexão.
+                    escritor.write(self._montar_resposta(erro.status, {'erro': erro.mensagem}, False))
+                    await escritor.drain()
+                    break
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+                    break  # conexão cortada ou linha grande demais
+                if requisicao is None:
+                    break
+                metodo, alvo, corpo, manter_conexao = requisicao
+                try:
+                    status, dados = await self._responder(metodo, alvo, corpo)
+                except ErroHTTP as erro:
+                    status, dados = erro.status, {'erro': erro.mensagem}
+                except Exception as erro:
+                    status, dados = 500, {'erro': f"Erro interno: {erro}"}
+                escritor.write(self._montar_resposta(status, dados, manter_conexao))
+                await escritor.drain()
+                if not manter_conexao:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host: str = '127.0.0.1', porta: int = 8080) -> asyncio.Server:
+        """Abre a porta e começa a aceitar conexões; retorna o `asyncio.Server`."""
+        return await asyncio.start_server(self._atender_conexao, host, porta)
+
+    async def servir(self, host: str = '127.0.0.1', porta: int = 8080):
+        """Atende até o programa ser interrompido."""
+        servidor = await self.iniciar(host, porta)
+        async with servidor:
+            await servidor.serve_forever()
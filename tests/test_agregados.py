@@ -0,0 +1,124 @@
+# tests/test_agregados.py
+"""
+Testes das contagens materializadas (`agregados.py`).
+
+Depois de várias inserções e mudanças de status, as contagens mantidas
+incrementalmente precisam bater com o cálculo do zero feito pelo `core.py`.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import random
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import gerar_relatorio_por_bairro, STATUS_VALIDOS
+from agregados import AgregadosPontos
+from indices import PontoStore
+
+
+class TestAgregadosPontos(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Pirambu', 'criticidade': 2, 'status': 'pendente'},
+        ]
+
+    def test_relatorios_iniciais(self):
+        """As contagens montadas a partir da lista batem com os relatórios do core."""
+        agregados = AgregadosPontos(self.pontos_teste)
+        self.assertEqual(agregados.relatorio_por_bairro(), {'Pirambu': 2, 'Centro': 1})
+        self.assertEqual(agregados.relatorio_por_bairro_e_status(),
+                         {'Pirambu': {'pendente': 2}, 'Centro': {'resolvido': 1}})
+        self.assertEqual(agregados.relatorio_por_bairro_e_nivel(),
+                         {'Pirambu': {'alto': 1, 'baixo': 1}, 'Centro': {'medio': 1}})
+        self.assertEqual(agregados.verificar_consistencia(self.pontos_teste), {})
+
+    def test_store_mantem_contagens_consistentes(self):
+        """Uma sequência aleatória de cadastros e atualizações no armazém não gera divergências."""
+        aleatorio = random.Random(3)
+        store = PontoStore(self.pontos_teste)
+        for novo_id in range(4, 300):
+            if aleatorio.random() < 0.5:
+                store.inserir({'id': novo_id, 'bairro': aleatorio.choice(['Centro', 'Pirambu', 'Messejana']),
+                               'criticidade': aleatorio.randint(1, 10), 'status': 'pendente'})
+            else:
+                id_ponto = aleatorio.choice([ponto['id'] for ponto in store])
+                store.atualizar(id_ponto, status=aleatorio.choice(STATUS_VALIDOS),
+                                criticidade=aleatorio.randint(1, 10))
+        self.assertEqual(store.agregados.verificar_consistencia(store), {})
+        self.assertEqual(gerar_relatorio_por_bairro(store), gerar_relatorio_por_bairro(list(store)))
+
+    def test_mudanca_de_status_mantem_a_ordem_dos_bairros(self):
+        """Mudar o status do único ponto de um bairro não o manda para o fim dos relatórios."""
+        store = PontoStore(self.pontos_teste + [{'id': 4, 'bairro': 'Messejana', 'criticidade': 1, 'status': 'pendente'}])
+        store.atualizar(2, status='pendente', criticidade=9)
+        pontos = list(store)
+        self.assertEqual(list(store.relatorio_por_bairro()), list(gerar_relatorio_por_bairro(pontos)))
+        self.assertEqual(list(store.relatorio_por_bairro_e_status()), ['Pirambu', 'Centro', 'Messejana'])
+        self.assertEqual(list(store.relatorio_por_bairro_e_nivel()), ['Pirambu', 'Centro', 'Messejana'])
+        self.assertEqual(store.relatorio_por_bairro_e_status()['Centro'], {'pendente': 1})
+        self.assertEqual(store.agregados.verificar_consistencia(store), {})
+
+    def test_grafias_do_mesmo_bairro(self):
+        """O armazém junta as grafias de um bairro nos relatórios, como a versão de lista."""
+        store = PontoStore(self.pontos_teste + [
+            {'id': 4, 'bairro': 'PIRAMBU', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 5, 'bairro': 'centro', 'criticidade': 9, 'status': 'pendente'},
+        ])
+        pontos = list(store)
+        self.assertEqual(store.relatorio_por_bairro(), {'Pirambu': 3, 'Centro': 2})
+        self.assertEqual(list(store.relatorio_por_bairro()), list(gerar_relatorio_por_bairro(pontos)))
+        self.assertEqual(store.relatorio_por_bairro_e_status()['Pirambu'], {'pendente': 2, 'resolvido': 1})
+        store.atualizar(5, status='resolvido')
+        self.assertEqual(store.agregados.verificar_consistencia(store), {})
+
+    def test_detecta_divergencia(self):
+        """Se as contagens ficarem desatualizadas, a verificação aponta o relatório."""
+        agregados = AgregadosPontos(self.pontos_teste)
+        pontos_alterados = self.pontos_teste + [
+            {'id': 4, 'bairro': 'Centro', 'criticidade': 9, 'status': 'pendente'}
+        ]
+        divergencias = agregados.verificar_consistencia(pontos_alterados)
+        self.assertEqual(set(divergencias), {'por_bairro', 'por_bairro_e_status', 'por_bairro_e_nivel'})
+        self.assertEqual(divergencias['por_bairro'][1], {'Pirambu': 2, 'Centro': 2})
+
+    def test_mudanca_de_bairro_mantem_a_ordem_da_lista(self):
+        """Um bairro que fica sem pontos e volta (ou um status que some e volta) fica na posição da lista."""
+        store = PontoStore([
+            {'id': 1, 'bairro': 'Centro', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'pirambu', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Centro', 'criticidade': 2, 'status': 'resolvido'},
+        ])
+        store.atualizar(1, bairro='Pirambu')
+        store.atualizar(1, bairro='Centro', status='resolvido')
+        store.atualizar(1, status='pendente')
+        pontos = list(store)
+        self.assertEqual(list(store.relatorio_por_bairro().items()), [('Centro', 2), ('pirambu', 1)])
+        self.assertEqual(list(store.relatorio_por_bairro().items()), list(gerar_relatorio_por_bairro(pontos).items()))
+        self.assertEqual(list(store.relatorio_por_bairro_e_status()['Centro']), ['pendente', 'resolvido'])
+        self.assertEqual(list(store.relatorio_por_bairro_e_nivel()['Centro']), ['alto', 'baixo'])
+        self.assertEqual(store.agregados.verificar_consistencia(store), {})
+
+    def test_verificacao_confere_a_ordem(self):
+        """Os mesmos números em outra ordem também contam como divergência."""
+        agregados = AgregadosPontos(self.pontos_teste)
+        divergencias = agregados.verificar_consistencia(self.pontos_teste[1:] + self.pontos_teste[:1])
+        self.assertEqual(set(divergencias), {'por_bairro', 'por_bairro_e_status', 'por_bairro_e_nivel'})
+
+    def test_mudancas_aleatorias_de_bairro_e_status(self):
+        """Cadastros e mudanças de bairro, status e criticidade mantêm os relatórios iguais aos da lista, na ordem."""
+        aleatorio = random.Random(11)
+        grafias = ['Centro', 'centro', 'Pirambu', 'PIRAMBU', 'Messejana']
+        store = PontoStore(self.pontos_teste)
+        for novo_id in range(4, 400):
+            if aleatorio.random() < 0.3:
+                store.inserir({'id': novo_id, 'bairro': aleatorio.choice(grafias),
+                               'criticidade': aleatorio.randint(1, 10), 'status': 'pendente'})
+            else:
+                store.atualizar(aleatorio.choice([ponto['id'] for ponto in store]), bairro=aleatorio.choice(grafias),
+                                status=aleatorio.choice(STATUS_VALIDOS), criticidade=aleatorio.randint(1, 10))
+            self.assertEqual(store.agregados.verificar_consistencia(store), {})
@@ -0,0 +1,143 @@
+# tests/test_armazenamento.py
+"""
+Testes da persistência em disco (`armazenamento.py`).
+
+Cada teste usa uma pasta temporária, apagada no final.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import os
+import tempfile
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from armazenamento import ArmazenamentoDuravel, SnapshotMapeado, gravar_snapshot
+
+
+class TestArmazenamentoDuravel(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.diretorio = self.pasta.name
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Vicente Pinzón', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Pirambu', 'criticidade': 2, 'status': 'pendente'},
+        ]
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_alteracoes_sobrevivem_ao_reinicio(self):
+        """Inserções e atualizações feitas antes de fechar aparecem ao carregar de novo."""
+        with ArmazenamentoDuravel(self.diretorio) as armazenamento:
+            pontos = armazenamento.carregar()
+            for ponto in self.pontos_teste:
+                pontos.inserir(ponto)
+            pontos.atualizar(3, status='resolvido')
+
+        with ArmazenamentoDuravel(self.diretorio) as armazenamento:
+            recarregados = armazenamento.carregar()
+        self.assertEqual(list(recarregados), [self.pontos_teste[0], self.pontos_teste[1],
+                                              {**self.pontos_teste[2], 'status': 'resolvido'}])
+        self.assertEqual(recarregados.proximo_id(), 4)
+
+    def test_compactacao(self):
+        """A compactação grava o snapshot, zera o log e o estado continua o mesmo."""
+        armazenamento = ArmazenamentoDuravel(self.diretorio)
+        pontos = armazenamento.carregar()
+        for ponto in self.pontos_teste:
+            pontos.inserir(ponto)
+        armazenamento.compactar(pontos)
+        self.assertEqual(os.path.getsize(armazenamento.caminho_log), 0)
+
+        pontos.atualizar(1, status='em_atendimento')  # fica só no log
+        armazenamento.fechar()
+
+        recarregados = ArmazenamentoDuravel(self.diretorio).carregar()
+        self.assertEqual(recarregados.obter(1)['status'], 'em_atendimento')
+        self.assertEqual(len(recarregados), 3)
+
+    def test_compactacao_automatica(self):
+        """Quando o log passa do limite, o próprio armazenamento compacta, mesmo sem ser fechado."""
+        armazenamento = ArmazenamentoDuravel(self.diretorio, lote_fsync=1, limite_log=5)
+        pontos = armazenamento.carregar()
+        for ponto in self.pontos_teste:
+            pontos.inserir(ponto)
+        pontos.atualizar(1, status='resolvido')
+        self.assertFalse(os.path.exists(armazenamento.caminho_snapshot))
+        pontos.atualizar(2, status='pendente')  # 5ª operação: compacta
+        self.assertTrue(os.path.exists(armazenamento.caminho_snapshot))
+        self.assertEqual(os.path.getsize(armazenamento.caminho_log), 0)
+        pontos.atualizar(3, criticidade=9)  # fica só no log
+
+        # Sem `fechar` (o processo foi interrompido): snapshot + o que sobrou do log.
+        recarregados = ArmazenamentoDuravel(self.diretorio).carregar()
+        self.assertEqual(list(recarregados), list(pontos))
+
+    def test_compactar_sem_alteracoes_nao_regrava_o_snapshot(self):
+        """Sem nada novo no log, compactar (como ao sair de um lote só de consultas) não mexe no snapshot."""
+        armazenamento = ArmazenamentoDuravel(self.diretorio)
+        pontos = armazenamento.carregar()
+        for ponto in self.pontos_teste:
+            pontos.inserir(ponto)
+        armazenamento.compactar(pontos)
+        armazenamento.fechar()
+
+        armazenamento = ArmazenamentoDuravel(self.diretorio)
+        pontos = armazenamento.carregar()
+        antes = os.stat(armazenamento.caminho_snapshot)
+        armazenamento.compactar(pontos)
+        armazenamento.fechar()
+        depois = os.stat(armazenamento.caminho_snapshot)
+        self.assertEqual((antes.st_ino, antes.st_mtime_ns), (depois.st_ino, depois.st_mtime_ns))
+
+    def test_log_repetido_e_linha_incompleta(self):
+        """Reaplicar operações já presentes no snapshot não duplica pontos, e uma linha cortada é ignorada."""
+        armazenamento = ArmazenamentoDuravel(self.diretorio)
+        pontos = armazenamento.carregar()
+        for ponto in self.pontos_teste:
+            pontos.inserir(ponto)
+        armazenamento.fechar()
+        # Simula uma queda: snapshot gravado, mas o log não foi zerado e a última escrita ficou pela metade.
+        gravar_snapshot(armazenamento.caminho_snapshot, pontos)
+        with open(armazenamento.caminho_log, 'a', encoding='utf-8') as log:
+            log.write('{"op": "atualizar", "id": 1, "cam')
+
+        recarregados = ArmazenamentoDuravel(self.diretorio).carregar()
+        self.assertEqual(list(recarregados), self.pontos_teste)
+
+    def test_escritas_depois_de_uma_linha_incompleta(self):
+        """A linha cortada é removida ao carregar, então as escritas seguintes não se perdem."""
+        with ArmazenamentoDuravel(self.diretorio) as armazenamento:
+            armazenamento.carregar().inserir(self.pontos_teste[0])
+        with open(os.path.join(self.diretorio, 'alteracoes.log'), 'a', encoding='utf-8') as log:
+            log.write('{"op": "ins')
+
+        with ArmazenamentoDuravel(self.diretorio) as armazenamento:
+            pontos = armazenamento.carregar()
+            pontos.inserir(self.pontos_teste[1])
+            pontos.inserir(self.pontos_teste[2])
+        with ArmazenamentoDuravel(self.diretorio) as armazenamento:
+            self.assertEqual(list(armazenamento.carregar()), self.pontos_teste)
+
+    def test_linha_corrompida_no_meio_do_log(self):
+        """Uma linha ruim que não é a última não é pulada em silêncio."""
+        with open(os.path.join(self.diretorio, 'alteracoes.log'), 'w', encoding='utf-8') as log:
+            log.write('{"op": "inserir", "ponto": {"id": 1, "bairro": "Centro", "criticidade": 3, "status": "pendente"}}\n'
+                      '{"op": "ins\n'
+                      '{"op": "atualizar", "id": 1, "campos": {"status": "resolvido"}}\n')
+        with self.assertRaises(ValueError):
+            ArmazenamentoDuravel(self.diretorio).carregar()
+
+    def test_snapshot_mapeado(self):
+        """O snapshot pode ser lido por posição sem carregar tudo."""
+        caminho = os.path.join(self.diretorio, 'pontos.snap')
+        gravar_snapshot(caminho, self.pontos_teste)
+        with SnapshotMapeado(caminho) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(snapshot[1], self.pontos_teste[1])
+            self.assertEqual(snapshot[-1], self.pontos_teste[2])
+            self.assertEqual(list(snapshot), self.pontos_teste)
@@ -0,0 +1,99 @@
+# tests/test_bairros.py
+"""
+Testes do índice de nomes de bairro (`bairros.py`).
+
+A lista ordenada e as sugestões mantidas pelo índice precisam ser iguais às
+calculadas do zero pelo `core.py` sobre uma lista comum.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import random
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import gerar_relatorio_por_bairro, listar_bairros, sugerir_bairros
+from indices import PontoStore
+from bairros import IndiceBairros
+
+
+class TestIndiceBairros(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Vicente Pinzón', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Álvaro Weyne', 'criticidade': 2, 'status': 'pendente'},
+            {'id': 4, 'bairro': 'Parangaba', 'criticidade': 7, 'status': 'em_atendimento'},
+            {'id': 5, 'bairro': 'Pirambu', 'criticidade': 9, 'status': 'pendente'},
+        ]
+        self.store = PontoStore(self.pontos_teste)
+
+    def test_lista_ordenada(self):
+        """Os nomes distintos saem em ordem alfabética, com 'Álvaro' no começo e não no fim."""
+        esperado = ['Álvaro Weyne', 'Parangaba', 'Pirambu', 'Vicente Pinzón']
+        self.assertEqual(listar_bairros(self.pontos_teste), esperado)
+        self.assertEqual(listar_bairros(self.store), esperado)
+
+    def test_sugestoes(self):
+        """O prefixo pode ser o começo do nome ou de qualquer palavra, sem acentos nem maiúsculas."""
+        for prefixo, esperado in [('p', ['Parangaba', 'Pirambu', 'Vicente Pinzón']), ('PINZ', ['Vicente Pinzón']),
+                                  ('alv', ['Álvaro Weyne']), ('vicente  p', ['Vicente Pinzón']), ('x', []), ('', [])]:
+            self.assertEqual(self.store.sugerir_bairros(prefixo), esperado)
+            self.assertEqual(sugerir_bairros(self.pontos_teste, prefixo), esperado)
+        self.assertEqual(sugerir_bairros(self.store, 'p', limite=2), ['Parangaba', 'Pirambu'])
+
+    def test_grafias_do_mesmo_bairro(self):
+        """Grafias diferentes do mesmo bairro viram um nome só, o da primeira cadastrada."""
+        self.store.inserir({'id': 6, 'bairro': 'VICENTE PINZON', 'criticidade': 1, 'status': 'pendente'})
+        self.store.inserir({'id': 7, 'bairro': 'pirambu', 'criticidade': 1, 'status': 'pendente'})
+        esperado = ['Álvaro Weyne', 'Parangaba', 'Pirambu', 'Vicente Pinzón']
+        self.assertEqual(listar_bairros(self.store), esperado)
+        self.assertEqual(listar_bairros(list(self.store)), esperado)
+        self.assertEqual(sugerir_bairros(self.store, 'pinz'), ['Vicente Pinzón'])
+        self.assertEqual(self.store.bairros.chave('VICENTE PINZON'), 'vicente pinzon')
+
+        # Quando a grafia exibida perde o último ponto, vale a próxima mais antiga, como na lista.
+        self.store.atualizar(2, bairro='Centro')
+        self.assertEqual(sugerir_bairros(self.store, 'pinz'), ['VICENTE PINZON'])
+        self.assertEqual(listar_bairros(self.store), listar_bairros(list(self.store)))
+        self.assertEqual(self.store.relatorio_por_bairro(), gerar_relatorio_por_bairro(list(self.store)))
+
+    def test_grafia_exibida_depois_de_mudancas_de_bairro(self):
+        """Um ponto que sai do bairro e volta recupera a sua posição: a grafia exibida é a do ponto mais antigo."""
+        store = PontoStore([
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'pirambu', 'criticidade': 2, 'status': 'pendente'},
+        ])
+        store.atualizar(1, bairro='Centro')
+        store.atualizar(1, bairro='Pirambu')
+        self.assertEqual(listar_bairros(store), ['Centro', 'Pirambu'])
+        self.assertEqual(store.relatorio_por_bairro(), gerar_relatorio_por_bairro(list(store)))
+        self.assertEqual(store.agregados.verificar_consistencia(store), {})
+
+        # Muitas mudanças (o bastante para os heaps serem compactados) continuam batendo com a lista.
+        sorteio = random.Random(7)
+        grafias = ['Pirambu', 'pirambu', 'PIRAMBU', 'Centro', 'centro', 'Vicente Pinzón', 'vicente pinzon']
+        for novo_id in range(4, 40):
+            store.inserir({'id': novo_id, 'bairro': sorteio.choice(grafias), 'criticidade': 1, 'status': 'pendente'})
+        for _ in range(500):
+            store.atualizar(sorteio.randint(1, 39), bairro=sorteio.choice(grafias))
+            self.assertEqual(listar_bairros(store), listar_bairros(list(store)))
+            self.assertEqual(sugerir_bairros(store, 'p'), sugerir_bairros(list(store), 'p'))
+            self.assertEqual(store.relatorio_por_bairro(), gerar_relatorio_por_bairro(list(store)))
+
+    def test_mudancas_mantem_o_indice(self):
+        """Um nome some da lista e da trie quando o último ponto dele muda de bairro."""
+        self.store.atualizar(2, bairro='Centro')
+        self.assertEqual(listar_bairros(self.store), listar_bairros(list(self.store)))
+        self.assertEqual(sugerir_bairros(self.store, 'pinz'), [])
+        self.store.atualizar(1, bairro='Centro')
+        self.assertIn('Pirambu', listar_bairros(self.store))
+
+        indice = IndiceBairros()
+        indice.adicionar('Vicente Pinzón')
+        indice.remover('Vicente Pinzón')
+        self.assertEqual(len(indice), 0)
+        self.assertEqual(indice._raiz.filhos, {})
@@ -0,0 +1,67 @@
+# tests/test_cache.py
+"""
+Testes do cache de consultas (`cache.py`).
+
+O principal é garantir que o cache nunca devolva um resultado antigo depois
+de uma inserção ou atualização.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    filtrar_pontos_por_bairro,
+    gerar_relatorio_por_bairro,
+    atualizar_status_por_id,
+    Consulta
+)
+from indices import PontoStore
+from cache import CacheConsultas
+
+
+class TestCacheConsultas(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Pirambu', 'criticidade': 2, 'status': 'pendente'},
+        ]
+        self.store = PontoStore(self.pontos_teste)
+        self.cache = CacheConsultas(tamanho_maximo=2)
+
+    def test_repeticao_usa_o_cache(self):
+        """A segunda chamada igual devolve o mesmo objeto, sem recalcular."""
+        primeiro = self.cache.chamar(filtrar_pontos_por_bairro, self.store, 'Pirambu')
+        segundo = self.cache.chamar(filtrar_pontos_por_bairro, self.store, 'Pirambu')
+        self.assertIs(primeiro, segundo)
+        self.assertEqual(self.cache.estatisticas()['acertos'], 1)
+        self.assertEqual(self.cache.estatisticas()['falhas'], 1)
+
+    def test_escrita_invalida_o_resultado(self):
+        """Depois de inserir ou atualizar, o resultado é recalculado."""
+        self.assertEqual(self.cache.chamar(gerar_relatorio_por_bairro, self.store), {'Pirambu': 2, 'Centro': 1})
+        self.store.inserir({'id': 4, 'bairro': 'Centro', 'criticidade': 3, 'status': 'pendente'})
+        self.assertEqual(self.cache.chamar(gerar_relatorio_por_bairro, self.store), {'Pirambu': 2, 'Centro': 2})
+
+        pendentes = Consulta(status='pendente')
+        self.assertEqual(len(self.cache.executar(pendentes, self.store)), 3)
+        atualizar_status_por_id(self.store, 1, 'resolvido')
+        self.assertEqual(len(self.cache.executar(pendentes, self.store)), 2)
+        self.assertEqual(self.cache.acertos, 0)
+
+    def test_lru_e_colecoes_sem_versao(self):
+        """O cache descarta o resultado usado há mais tempo e não guarda listas comuns."""
+        for bairro in ['Pirambu', 'Centro', 'Pirambu', 'Aldeota']:
+            self.cache.chamar(filtrar_pontos_por_bairro, self.store, bairro)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.descartes, 1)
+        self.cache.chamar(filtrar_pontos_por_bairro, self.store, 'Pirambu')
+        self.assertEqual(self.cache.acertos, 2)
+
+        self.cache.chamar(filtrar_pontos_por_bairro, self.pontos_teste, 'Pirambu')
+        self.assertEqual(self.cache.sem_cache, 1)
+        self.assertEqual(len(self.cache), 2)
@@ -0,0 +1,78 @@
+# tests/test_colunar.py
+"""
+Testes da representação colunar (`colunar.py`).
+
+Cada operação vetorizada é comparada com a versão de lista do `core.py`.
+Os testes são pulados quando o NumPy não está instalado, já que ele é opcional.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    filtrar_pontos_por_bairro,
+    filtrar_pontos_por_criticidade,
+    criar_filtro_por_status,
+    gerar_relatorio_por_bairro,
+    gerar_relatorio_por_bairro_e_status,
+    gerar_relatorio_por_bairro_e_nivel,
+    atualizar_status_em_lote,
+    atualizar_status_pontos,
+    buscar_ponto_por_id,
+    gerar_proximo_id
+)
+from colunar import np, PontosColunares
+
+
+@unittest.skipIf(np is None, "NumPy não está instalado")
+class TestPontosColunares(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 10, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 7, 'bairro': 'pirambu', 'criticidade': 2, 'status': 'pendente'},
+            {'id': 4, 'bairro': 'Centro', 'criticidade': 7, 'status': 'em_atendimento'},
+        ]
+        self.colunas = PontosColunares.de_pontos(self.pontos_teste)
+
+    def test_ida_e_volta(self):
+        """Converter para colunas e voltar devolve exatamente os mesmos dicionários."""
+        self.assertEqual(list(self.colunas), self.pontos_teste)
+        self.assertEqual(buscar_ponto_por_id(self.colunas, 7), self.pontos_teste[2])
+        self.assertIsNone(buscar_ponto_por_id(self.colunas, 99))
+        self.assertEqual(gerar_proximo_id(self.colunas), 11)
+
+    def test_filtros_e_relatorios_iguais_aos_da_lista(self):
+        """Os filtros e relatórios vetorizados dão o mesmo resultado que os do core."""
+        for bairro in ['Pirambu', 'CENTRO', 'Messejana']:
+            self.assertEqual(filtrar_pontos_por_bairro(self.colunas, bairro),
+                             filtrar_pontos_por_bairro(self.pontos_teste, bairro))
+        for faixa in [(1, 3), (4, 7), (8, 10)]:
+            self.assertEqual(filtrar_pontos_por_criticidade(self.colunas, *faixa),
+                             filtrar_pontos_por_criticidade(self.pontos_teste, *faixa))
+        for status in ['pendente', 'resolvido', 'verificado']:
+            filtro = criar_filtro_por_status(status)
+            self.assertEqual(filtro(self.colunas), filtro(self.pontos_teste))
+        for relatorio in [gerar_relatorio_por_bairro, gerar_relatorio_por_bairro_e_status,
+                          gerar_relatorio_por_bairro_e_nivel]:
+            self.assertEqual(relatorio(self.colunas), relatorio(self.pontos_teste))
+
+    def test_atualizacoes_vetorizadas(self):
+        """As atualizações devolvem uma coleção nova, igual à da versão de lista."""
+        nova = atualizar_status_em_lote(self.colunas, [(7, 'resolvido'), (4, 'verificado'), (99, 'x')])
+        esperado = atualizar_status_em_lote(self.pontos_teste, [(7, 'resolvido'), (4, 'verificado'), (99, 'x')])
+        self.assertEqual(list(nova), esperado)
+        self.assertEqual(list(self.colunas), self.pontos_teste)
+        # As colunas que não mudaram são compartilhadas.
+        self.assertIs(nova.ids, self.colunas.ids)
+
+        regra = self.colunas.atualizar_status_onde(self.colunas.mascara_criticidade(1, 5), 'resolvido')
+        esperado = atualizar_status_pontos(
+            self.pontos_teste,
+            lambda ponto: {**ponto, 'status': 'resolvido'} if ponto['criticidade'] <= 5 else ponto
+        )
+        self.assertEqual(list(regra), esperado)
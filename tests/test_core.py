@@ -27,9 +27,26 @@ from core import (
     filtrar_pontos_por_bairro,
     filtrar_pontos_por_criticidade,
     atualizar_status_pontos,
+    atualizar_status_em_lote,
+    atualizar_status_por_id,
+    buscar_ponto_por_id,
+    gerar_proximo_id,
+    inserir_ponto,
     gerar_relatorio_por_bairro,
-    criar_filtro_por_status
+    gerar_relatorio_por_bairro_e_status,
+    gerar_relatorio_por_bairro_e_nivel,
+    classificar_nivel_criticidade,
+    iterar_pontos_por_bairro,
+    iterar_pontos_por_criticidade,
+    iterar_pontos_por_status,
+    validar_ponto,
+    criar_filtro_por_status,
+    normalizar_bairro,
+    listar_bairros,
+    agrupar_bairros,
+    Consulta
 )
+from indices import PontoStore
 
 
 # Ao herdar de "unittest.TestCase", nossa classe "TestWasteManagement"
@@ -98,6 +115,56 @@ class TestWasteManagement(unittest.TestCase):
         relatorio_esperado = {'Pirambu': 2, 'Centro': 2}
         self.assertEqual(relatorio, relatorio_esperado)
 
+    def test_relatorios_detalhados(self):
+        """Verifica as contagens por bairro separadas por status e por nível de criticidade."""
+        self.assertEqual(gerar_relatorio_por_bairro_e_status(self.pontos_teste), {
+            'Pirambu': {'pendente': 2},
+            'Centro': {'resolvido': 1, 'em_atendimento': 1},
+        })
+        self.assertEqual(gerar_relatorio_por_bairro_e_nivel(self.pontos_teste), {
+            'Pirambu': {'alto': 1, 'baixo': 1},
+            'Centro': {'medio': 2},
+        })
+        self.assertEqual([classificar_nivel_criticidade(c) for c in (1, 4, 10, 11)],
+                         ['baixo', 'medio', 'alto', None])
+
+    def test_relatorios_detalhados_mantem_a_ordem_de_aparicao(self):
+        """Bairros, status e níveis saem na ordem em que aparecem (o `assertEqual` de dicionários não confere a ordem)."""
+        pontos = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 2, 'status': 'resolvido'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 9, 'status': 'pendente'},
+            {'id': 3, 'bairro': 'pirambu', 'criticidade': 9, 'status': 'pendente'},
+            {'id': 4, 'bairro': 'Barra do Ceará', 'criticidade': 5, 'status': 'em_atendimento'},
+            {'id': 5, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+        ]
+        por_status = gerar_relatorio_por_bairro_e_status(pontos)
+        self.assertEqual([(bairro, list(contagem.items())) for bairro, contagem in por_status.items()], [
+            ('Pirambu', [('resolvido', 1), ('pendente', 1)]),
+            ('Centro', [('pendente', 1), ('resolvido', 1)]),
+            ('Barra do Ceará', [('em_atendimento', 1)]),
+        ])
+        por_nivel = gerar_relatorio_por_bairro_e_nivel(pontos)
+        self.assertEqual([(bairro, list(contagem.items())) for bairro, contagem in por_nivel.items()], [
+            ('Pirambu', [('baixo', 1), ('alto', 1)]),
+            ('Centro', [('alto', 1), ('medio', 1)]),
+            ('Barra do Ceará', [('medio', 1)]),
+        ])
+
+    def test_filtros_preguicosos(self):
+        """Os geradores devolvem os mesmos pontos que os filtros com lista, mas sob demanda."""
+        gerador = iterar_pontos_por_bairro(self.pontos_teste, 'pirambu')
+        self.assertEqual(next(gerador)['id'], 1)
+        self.assertEqual([p['id'] for p in gerador], [3])
+        self.assertEqual(list(iterar_pontos_por_criticidade(self.pontos_teste, 4, 7)),
+                         filtrar_pontos_por_criticidade(self.pontos_teste, 4, 7))
+        self.assertEqual([p['id'] for p in iterar_pontos_por_status(self.pontos_teste, 'pendente')], [1, 3])
+
+    def test_validar_ponto(self):
+        """Verifica as regras de cadastro: bairro não vazio, criticidade de 1 a 10 e status válido."""
+        self.assertEqual(validar_ponto(self.pontos_teste[0]), [])
+        self.assertEqual(len(validar_ponto({'id': 9, 'bairro': ' ', 'criticidade': 0, 'status': 'x'})), 3)
+        self.assertEqual(len(validar_ponto({'id': '9', 'bairro': 'Centro', 'criticidade': '5', 'status': 'pendente'})), 2)
+
     def test_closure_filtro_por_status(self):
         """
         Testa a Closure, nossa "fábrica de filtros".
@@ -110,4 +177,95 @@ class TestWasteManagement(unittest.TestCase):
 
         # Passo 3: Verificamos se o filtro fez seu trabalho corretamente.
         # Nos nossos dados de teste, esperamos encontrar 2 pontos pendentes.
-        self.assertEqual(len(resultado), 2)
\ No newline at end of file
+        self.assertEqual(len(resultado), 2)
+
+    def test_atualizar_status_em_lote(self):
+        """
+        Testa a atualização direcionada: só os pontos indicados mudam
+        e os outros são reaproveitados, sem cópia.
+        """
+        pontos_atualizados = atualizar_status_em_lote(
+            self.pontos_teste,
+            [(1, 'resolvido'), (4, 'resolvido'), (99, 'resolvido')]
+        )
+        self.assertEqual([p['status'] for p in pontos_atualizados],
+                         ['resolvido', 'resolvido', 'pendente', 'resolvido'])
+        # A lista original não foi modificada...
+        self.assertEqual(self.pontos_teste[0]['status'], 'pendente')
+        # ...e os pontos que não mudaram são os mesmos objetos.
+        self.assertIs(pontos_atualizados[1], self.pontos_teste[1])
+        self.assertIs(pontos_atualizados[2], self.pontos_teste[2])
+
+        pontos_atualizados = atualizar_status_por_id(self.pontos_teste, 3, 'em_atendimento')
+        self.assertEqual(pontos_atualizados[2]['status'], 'em_atendimento')
+
+    def test_buscar_ponto_e_gerar_proximo_id(self):
+        """Verifica a busca por ID e a geração do próximo ID na lista comum."""
+        self.assertEqual(buscar_ponto_por_id(self.pontos_teste, 2)['bairro'], 'Centro')
+        self.assertIsNone(buscar_ponto_por_id(self.pontos_teste, 99))
+        self.assertEqual(gerar_proximo_id(self.pontos_teste), 5)
+        self.assertEqual(gerar_proximo_id([]), 1)
+
+    def test_inserir_ponto(self):
+        """O cadastro retorna a coleção com o ponto novo, seja ela nova (lista) ou a mesma (PontoStore)."""
+        novo = {'id': 5, 'bairro': 'Centro', 'criticidade': 4, 'status': 'pendente'}
+        pontos = inserir_ponto(self.pontos_teste, novo)
+        self.assertEqual([p['id'] for p in pontos], [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.pontos_teste), 4)  # a lista original não muda
+
+        store = PontoStore(self.pontos_teste)
+        self.assertIs(inserir_ponto(store, novo), store)
+        self.assertEqual(len(store), 5)
+
+    def test_consulta_composta(self):
+        """A consulta combina bairro, criticidade e status numa passada, com ordenação e limite opcionais."""
+        consulta = Consulta().do_bairro('pirambu').com_status('pendente')
+        self.assertEqual([p['id'] for p in consulta.executar(self.pontos_teste)], [1, 3])
+        self.assertEqual(consulta.com_criticidade(1, 5).executar(self.pontos_teste), [self.pontos_teste[2]])
+
+        por_criticidade = Consulta().ordenar_por('criticidade', decrescente=True)
+        self.assertEqual([p['id'] for p in por_criticidade.executar(self.pontos_teste)], [1, 4, 2, 3])
+        self.assertEqual([p['id'] for p in por_criticidade.limitar(2).executar(self.pontos_teste)], [1, 4])
+        self.assertEqual([p['id'] for p in Consulta().limitar(3).executar(self.pontos_teste)], [1, 2, 3])
+        # Empates na ordenação mantêm a ordem original.
+        self.assertEqual([p['id'] for p in Consulta().ordenar_por('bairro').executar(self.pontos_teste)], [2, 4, 1, 3])
+
+        # Montar uma consulta nova não muda a anterior, e consultas iguais têm a mesma chave.
+        self.assertIsNone(consulta.criticidade)
+        self.assertEqual(Consulta(bairro='PIRAMBU', status='pendente'), consulta)
+        with self.assertRaises(ValueError):
+            Consulta().ordenar_por('cor')
+
+    def test_consulta_preguicosa(self):
+        """Sem ordenação, `iterar` só lê os pontos necessários."""
+        lidos = []
+
+        def fonte():
+            for ponto in self.pontos_teste:
+                lidos.append(ponto['id'])
+                yield ponto
+
+        gerador = Consulta(status='pendente').limitar(1).iterar(fonte())
+        self.assertEqual(lidos, [])
+        self.assertEqual([p['id'] for p in gerador], [1])
+        self.assertEqual(lidos, [1])
+
+    def test_bairro_sem_acentos(self):
+        """'Vicente Pinzon' e 'Vicente Pinzón' são o mesmo bairro, assim como maiúsculas e espaços extras."""
+        self.assertEqual(normalizar_bairro('  VICENTE   Pinzón '), 'vicente pinzon')
+        self.assertEqual(normalizar_bairro('Barra do Ceará'), normalizar_bairro('barra do ceara'))
+        pontos = self.pontos_teste + [{'id': 5, 'bairro': 'Vicente Pinzón', 'criticidade': 3, 'status': 'pendente'}]
+        self.assertEqual([p['id'] for p in filtrar_pontos_por_bairro(pontos, 'vicente pinzon')], [5])
+
+    def test_relatorios_juntam_grafias_do_mesmo_bairro(self):
+        """Relatórios e a lista de bairros tratam 'Vicente Pinzón' e 'vicente pinzon' como um bairro só."""
+        pontos = self.pontos_teste + [
+            {'id': 5, 'bairro': 'Vicente Pinzón', 'criticidade': 3, 'status': 'pendente'},
+            {'id': 6, 'bairro': 'vicente pinzon', 'criticidade': 9, 'status': 'resolvido'},
+            {'id': 7, 'bairro': 'CENTRO', 'criticidade': 1, 'status': 'pendente'},
+        ]
+        self.assertEqual(gerar_relatorio_por_bairro(pontos), {'Pirambu': 2, 'Centro': 3, 'Vicente Pinzón': 2})
+        self.assertEqual(gerar_relatorio_por_bairro_e_status(pontos)['Vicente Pinzón'], {'pendente': 1, 'resolvido': 1})
+        self.assertEqual(gerar_relatorio_por_bairro_e_nivel(pontos)['Centro'], {'medio': 2, 'baixo': 1})
+        self.assertEqual(listar_bairros(pontos), ['Centro', 'Pirambu', 'Vicente Pinzón'])
+        self.assertEqual(agrupar_bairros({'Centro': 1, 'centro': 2, 'Pirambu': 1}), {'Centro': 3, 'Pirambu': 1})
@@ -0,0 +1,99 @@
+# tests/test_despacho.py
+"""
+Testes da fila de despacho (`despacho.py`).
+
+O resultado de `top_k` precisa ser igual ao de filtrar os pendentes e
+ordenar tudo por criticidade, que é como isso era feito antes.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import random
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import STATUS_VALIDOS, criar_filtro_por_status, filtrar_pontos_por_bairro, atualizar_status_por_id
+from indices import PontoStore
+from despacho import FilaDespacho
+
+
+def filtrar_e_ordenar(pontos, k, bairro=None):
+    """O jeito antigo: filtra os pendentes e ordena todos (o `sorted` mantém a ordem de chegada nos empates)."""
+    pendentes = criar_filtro_por_status('pendente')(pontos)
+    if bairro is not None:
+        pendentes = filtrar_pontos_por_bairro(pendentes, bairro)
+    return sorted(pendentes, key=lambda ponto: -ponto['criticidade'])[:k]
+
+
+class TestFilaDespacho(unittest.TestCase):
+
+    def setUp(self):
+        aleatorio = random.Random(7)
+        self.pontos_teste = [
+            {'id': i, 'bairro': aleatorio.choice(['Pirambu', 'Centro', 'Aldeota']),
+             'criticidade': aleatorio.randint(1, 10), 'status': aleatorio.choice(STATUS_VALIDOS)}
+            for i in range(1, 301)
+        ]
+        self.store = PontoStore(self.pontos_teste)
+        self.fila = self.store.observar(FilaDespacho(self.store))
+
+    def test_top_k_igual_a_ordenar_tudo(self):
+        """Os K mais críticos saem na mesma ordem que filtrando e ordenando tudo."""
+        for k in [0, 1, 5, 50, 1000]:
+            self.assertEqual(self.fila.top_k(k), filtrar_e_ordenar(self.pontos_teste, k))
+            self.assertEqual(self.fila.top_k(k, bairro='PIRAMBU'), filtrar_e_ordenar(self.pontos_teste, k, 'Pirambu'))
+        self.assertEqual(self.fila.top_k(3, bairro='Inexistente'), [])
+
+    def test_fila_acompanha_o_armazem(self):
+        """Cadastros e mudanças de status feitos no armazém entram e saem da fila."""
+        primeiro = self.fila.top_k(1)[0]
+        atualizar_status_por_id(self.store, primeiro['id'], 'resolvido')
+        self.assertNotIn(primeiro['id'], [ponto['id'] for ponto in self.fila.top_k(1000)])
+
+        self.store.inserir({'id': 999, 'bairro': 'Centro', 'criticidade': 10, 'status': 'pendente'})
+        self.store.atualizar(999, criticidade=11)
+        self.assertEqual(self.fila.top_k(1)[0], self.store.obter(999))
+        self.assertEqual(len(self.fila), len(criar_filtro_por_status('pendente')(self.store)))
+
+    def test_proximo(self):
+        """`proximo` não tira o ponto da fila; o ponto sai quando o status muda no armazém."""
+        esperado = self.fila.top_k(3)
+        despachados = []
+        for _ in range(3):
+            ponto = self.fila.proximo()
+            self.assertEqual(self.fila.proximo(), ponto)
+            atualizar_status_por_id(self.store, ponto['id'], 'em_atendimento')
+            despachados.append(ponto)
+        self.assertEqual(despachados, esperado)
+        do_centro = self.fila.proximo(bairro='centro')
+        self.assertEqual(do_centro['bairro'], 'Centro')
+        self.assertEqual(do_centro, self.fila.top_k(1, bairro='Centro')[0])
+
+        # A fila e o armazém concordam: uma fila montada de novo devolve o mesmo ponto.
+        self.assertEqual(FilaDespacho(self.store).proximo(), self.fila.proximo())
+        while (ponto := self.fila.proximo()) is not None:
+            atualizar_status_por_id(self.store, ponto['id'], 'resolvido')
+        self.assertEqual(len(self.fila), 0)
+        self.assertEqual(criar_filtro_por_status('pendente')(self.store), [])
+
+    def test_muitas_mudancas(self):
+        """Depois de muitas entradas inválidas, a fila é compactada e continua correta."""
+        pendentes = [ponto['id'] for ponto in criar_filtro_por_status('pendente')(self.store)]
+        for _ in range(3):
+            for id_ponto in pendentes:
+                atualizar_status_por_id(self.store, id_ponto, 'em_atendimento')
+            for id_ponto in pendentes:
+                atualizar_status_por_id(self.store, id_ponto, 'pendente')
+        self.assertLess(len(self.fila._heap), 2 * len(self.fila) + 65)
+        self.assertEqual(self.fila.top_k(1000), filtrar_e_ordenar(self.store, 1000))
+
+    def test_fila_so_esvaziada_tambem_e_compactada(self):
+        """Sem nenhum cadastro novo, despachar todos os pendentes não deixa as entradas inválidas para sempre."""
+        pendentes = [ponto['id'] for ponto in criar_filtro_por_status('pendente')(self.store)]
+        for id_ponto in pendentes:
+            atualizar_status_por_id(self.store, id_ponto, 'em_atendimento')
+        self.assertEqual(len(self.fila), 0)
+        self.assertLessEqual(len(self.fila._heap), 64)
+        self.assertLessEqual(sum(map(len, self.fila._por_bairro.values())), 64)
+        self.assertIsNone(self.fila.proximo('Centro'))
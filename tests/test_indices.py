@@ -0,0 +1,129 @@
+# tests/test_indices.py
+"""
+Testes do `PontoStore`, o armazém indexado de pontos.
+
+A ideia principal é conferir que as funções do `core.py` devolvem
+exatamente o mesmo resultado usando o armazém ou uma lista comum.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import random
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    filtrar_pontos_por_bairro,
+    filtrar_pontos_por_criticidade,
+    iterar_pontos_por_criticidade,
+    criar_filtro_por_status,
+    atualizar_status_em_lote,
+    gerar_proximo_id,
+    Consulta
+)
+from indices import PontoStore
+
+
+class TestPontoStore(unittest.TestCase):
+
+    def setUp(self):
+        """Prepara a mesma lista de pontos em formato de lista e de armazém."""
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'pirambu', 'criticidade': 2, 'status': 'pendente'},
+            {'id': 4, 'bairro': 'Centro', 'criticidade': 7, 'status': 'em_atendimento'},
+            {'id': 5, 'bairro': 'Barra do Ceará', 'criticidade': 5, 'status': 'pendente'},
+        ]
+        self.store = PontoStore(self.pontos_teste)
+
+    def test_mesmos_resultados_que_a_lista(self):
+        """Os filtros do core devem dar o mesmo resultado com lista e com armazém."""
+        for bairro in ['Pirambu', 'PIRAMBU', 'Centro', 'Inexistente']:
+            self.assertEqual(filtrar_pontos_por_bairro(self.store, bairro),
+                             filtrar_pontos_por_bairro(self.pontos_teste, bairro))
+        for faixa in [(1, 3), (4, 7), (8, 10), (1, 10), (6, 6), (9, 1)]:
+            self.assertEqual(filtrar_pontos_por_criticidade(self.store, *faixa),
+                             filtrar_pontos_por_criticidade(self.pontos_teste, *faixa))
+        for status in ['pendente', 'resolvido', 'em_atendimento', 'verificado']:
+            filtro = criar_filtro_por_status(status)
+            self.assertEqual(filtro(self.store), filtro(self.pontos_teste))
+
+    def test_atualizar_reindexa_e_mantem_ordem(self):
+        """Depois de uma atualização, o ponto muda de balde mas a ordem continua a de inserção."""
+        self.store.atualizar(4, status='pendente', criticidade=2)
+        self.store.atualizar(1, status='resolvido')
+
+        self.assertEqual([p['id'] for p in self.store.buscar_por_status('pendente')], [3, 4, 5])
+        self.assertEqual([p['id'] for p in self.store.buscar_por_status('resolvido')], [1, 2])
+        self.assertEqual([p['id'] for p in self.store.buscar_por_criticidade(1, 3)], [3, 4])
+        self.assertEqual(self.store.buscar_por_criticidade(7, 7), [])
+
+    def test_faixas_de_criticidade_depois_de_atualizacoes(self):
+        """Depois de várias mudanças de status e de criticidade, as faixas continuam iguais às da lista."""
+        sorteio = random.Random(42)
+        pontos = [{'id': i, 'bairro': sorteio.choice(['Pirambu', 'Centro', 'Messejana']),
+                   'criticidade': sorteio.randint(1, 10), 'status': 'pendente'} for i in range(1, 61)]
+        store = PontoStore(pontos)
+        for _ in range(200):
+            id_ponto = sorteio.randint(1, 60)
+            if sorteio.random() < 0.5:
+                campos = {'criticidade': sorteio.randint(1, 10)}
+                store.atualizar(id_ponto, **campos)
+                pontos = [{**p, **campos} if p['id'] == id_ponto else p for p in pontos]
+            else:
+                atualizacao = [(id_ponto, sorteio.choice(['pendente', 'em_atendimento', 'resolvido']))]
+                store = atualizar_status_em_lote(store, atualizacao)
+                pontos = atualizar_status_em_lote(pontos, atualizacao)
+
+        faixas = [(1, 3), (4, 7), (8, 10), (1, 10), (5, 5), (10, 1)]
+        for faixa in faixas:
+            self.assertEqual(filtrar_pontos_por_criticidade(store, *faixa),
+                             filtrar_pontos_por_criticidade(pontos, *faixa))
+            self.assertEqual(list(iterar_pontos_por_criticidade(store, *faixa)),
+                             list(iterar_pontos_por_criticidade(pontos, *faixa)))
+            for consulta in [Consulta(criticidade=faixa), Consulta(status='pendente', criticidade=faixa),
+                             Consulta(bairro='centro', criticidade=faixa)]:
+                self.assertEqual(consulta.executar(store), consulta.executar(pontos))
+
+    def test_atualizar_nao_modifica_o_dicionario_original(self):
+        """A atualização cria um dicionário novo, sem mexer no antigo."""
+        original = self.store.obter(1)
+        novo = self.store.atualizar(1, status='resolvido')
+        self.assertEqual(original['status'], 'pendente')
+        self.assertIs(self.store.obter(1), novo)
+
+    def test_atualizacao_em_lote_e_contador_de_ids(self):
+        """O armazém aplica o lote pelo ID e mantém o contador de IDs sem varrer a coleção."""
+        resultado = atualizar_status_em_lote(self.store, [(2, 'pendente'), (5, 'resolvido'), (99, 'resolvido')])
+        esperado = atualizar_status_em_lote(self.pontos_teste, [(2, 'pendente'), (5, 'resolvido'), (99, 'resolvido')])
+        self.assertIs(resultado, self.store)
+        self.assertEqual(list(resultado), esperado)
+
+        self.assertEqual(gerar_proximo_id(self.store), 6)
+        self.store.inserir({'id': 10, 'bairro': 'Centro', 'criticidade': 3, 'status': 'pendente'})
+        self.assertEqual(gerar_proximo_id(self.store), 11)
+
+    def test_erros(self):
+        """IDs repetidos ou inexistentes são recusados."""
+        with self.assertRaises(ValueError):
+            self.store.inserir({'id': 1, 'bairro': 'Centro', 'criticidade': 1, 'status': 'pendente'})
+        with self.assertRaises(KeyError):
+            self.store.atualizar(99, status='resolvido')
+        self.assertIsNone(self.store.obter(99))
+
+    def test_consulta_usa_o_indice_mais_seletivo(self):
+        """A consulta começa pelo menor balde e dá o mesmo resultado que na lista."""
+        self.assertEqual(self.store.contar_por_bairro('PIRAMBU'), 2)
+        self.assertEqual(self.store.contar_por_status('pendente'), 3)
+        self.assertEqual(self.store.contar_por_criticidade(4, 8), 4)
+        self.assertEqual(self.store.contar_por_bairro('Inexistente'), 0)
+
+        consulta = Consulta(bairro='Pirambu', status='pendente', criticidade=(4, 8))
+        self.assertEqual(consulta._planejar(self.store)[0], 'bairro')
+        self.assertEqual(Consulta(status='resolvido', criticidade=(1, 10))._planejar(self.store)[0], 'status')
+
+        for consulta in [consulta, Consulta(status='pendente').com_criticidade(5, 10).ordenar_por('id', True),
+                         Consulta(bairro='centro').limitar(1), Consulta(bairro='Inexistente', status='pendente')]:
+            self.assertEqual(consulta.executar(self.store), consulta.executar(self.pontos_teste))
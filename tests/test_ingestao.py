@@ -0,0 +1,94 @@
+# tests/test_ingestao.py
+"""
+Testes da leitura em fluxo (`ingestao.py`).
+
+Usamos `io.StringIO` para simular os arquivos, assim os testes não precisam
+criar nada no disco.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import io
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    gerar_relatorio_por_bairro,
+    iterar_pontos_por_bairro,
+    iterar_pontos_por_criticidade,
+    iterar_pontos_por_status
+)
+from ingestao import ler_pontos_csv, ler_pontos_jsonl
+
+
+CSV_VALIDO = """id,bairro,criticidade,status
+1,Pirambu,8,pendente
+2, Centro ,5,resolvido
+3,pirambu,2,
+4,Centro,9,PENDENTE
+"""
+
+CSV_COM_ERROS = """id,bairro,criticidade,status
+1,Pirambu,8,pendente
+2,,5,resolvido
+3,Centro,11,pendente
+4,Centro,alta,pendente
+5,Centro,4,verificado
+6,Centro,4,pendente
+"""
+
+
+class TestIngestao(unittest.TestCase):
+
+    def test_ler_csv(self):
+        """O CSV vira a lista de dicionários de sempre, já com os tipos convertidos."""
+        pontos = list(ler_pontos_csv(io.StringIO(CSV_VALIDO)))
+        self.assertEqual(pontos[1], {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'})
+        # Sem status, o ponto começa como 'pendente', igual ao cadastro do main.py.
+        self.assertEqual(pontos[2]['status'], 'pendente')
+        self.assertEqual(pontos[3]['status'], 'pendente')
+
+    def test_linhas_invalidas(self):
+        """Linhas inválidas levantam erro, ou são separadas se pedirmos a lista de inválidos."""
+        with self.assertRaises(ValueError) as contexto:
+            list(ler_pontos_csv(io.StringIO(CSV_COM_ERROS)))
+        self.assertIn("Linha 3", str(contexto.exception))
+
+        invalidos = []
+        pontos = list(ler_pontos_csv(io.StringIO(CSV_COM_ERROS), invalidos=invalidos))
+        self.assertEqual([p['id'] for p in pontos], [1, 6])
+        self.assertEqual([linha for linha, _ in invalidos], [3, 4, 5, 6])
+
+    def test_numero_da_linha_com_campo_em_varias_linhas(self):
+        """Um bairro entre aspas com quebra de linha não desloca a numeração das linhas seguintes."""
+        conteudo = 'id,bairro,criticidade,status\n1,"Barra\ndo Ceará",8,pendente\n2,Centro,11,pendente\n'
+        invalidos = []
+        pontos = list(ler_pontos_csv(io.StringIO(conteudo), invalidos=invalidos))
+        self.assertEqual([p['id'] for p in pontos], [1])
+        self.assertEqual([linha for linha, _ in invalidos], [4])
+
+    def test_ler_jsonl(self):
+        """Cada linha JSON vira um ponto; linhas em branco são puladas e JSON quebrado é recusado."""
+        conteudo = (
+            '{"id": 1, "bairro": "Pirambu", "criticidade": 8, "status": "pendente"}\n'
+            '\n'
+            '{"id": 2, "bairro": "Centro", "criticidade": 3}\n'
+            '{"id": 3, "bairro": \n'
+            '[1, 2]\n'
+        )
+        invalidos = []
+        pontos = list(ler_pontos_jsonl(io.StringIO(conteudo), invalidos=invalidos))
+        self.assertEqual([p['id'] for p in pontos], [1, 2])
+        self.assertEqual([linha for linha, _ in invalidos], [4, 5])
+
+    def test_encadeamento_preguicoso(self):
+        """Os filtros preguiçosos do core se encadeiam sobre a leitura sem montar listas."""
+        pontos = ler_pontos_csv(io.StringIO(CSV_VALIDO))
+        pendentes = iterar_pontos_por_status(pontos, 'pendente')
+        criticos = iterar_pontos_por_criticidade(pendentes, 8, 10)
+        self.assertEqual(gerar_relatorio_por_bairro(criticos), {'Pirambu': 1, 'Centro': 1})
+
+        pontos = ler_pontos_csv(io.StringIO(CSV_VALIDO))
+        primeiro = next(iterar_pontos_por_bairro(pontos, 'PIRAMBU'))
+        self.assertEqual(primeiro['id'], 1)
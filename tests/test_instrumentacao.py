@@ -0,0 +1,50 @@
+# tests/test_instrumentacao.py
+"""
+Testes da instrumentação opcional (`instrumentacao.py`).
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+import instrumentacao
+from instrumentacao import EstatisticaFuncao, RegistroInstrumentacao, instrumentar
+
+
+class TestInstrumentacao(unittest.TestCase):
+
+    def test_desligada_devolve_a_propria_funcao(self):
+        if instrumentacao.ATIVA:
+            self.skipTest("DESCARTE_INSTRUMENTAR está ligada neste ambiente.")
+
+        def dobro(numero):
+            return numero * 2
+        self.assertIs(instrumentar(dobro), dobro)
+
+    def test_conta_chamadas_e_excecoes(self):
+        registro = RegistroInstrumentacao()
+
+        def dividir(a, b):
+            return a / b
+        dividir_instrumentada = instrumentar(dividir, registro)
+        self.assertEqual(dividir_instrumentada.__name__, 'dividir')
+        self.assertEqual(dividir_instrumentada(6, b=3), 2)
+        with self.assertRaises(ZeroDivisionError):
+            dividir_instrumentada(1, 0)
+
+        (nome, dados), = registro.estatisticas().items()
+        self.assertTrue(nome.endswith('dividir'))
+        self.assertEqual(dados['chamadas'], 2)
+        self.assertEqual(sum(dados['histograma_ns'].values()), 2)
+        self.assertIn(nome, registro.relatorio())
+
+    def test_histograma_em_escala_log2(self):
+        estatistica = EstatisticaFuncao()
+        for duracao in [1, 600, 700, 1000, 5000]:
+            estatistica.registrar(duracao)
+        dados = estatistica.para_dict()
+        self.assertEqual(dados['histograma_ns'], {2: 1, 1024: 3, 8192: 1})
+        self.assertEqual(estatistica.percentil_ns(0.5), 1024)
+        self.assertEqual(estatistica.percentil_ns(0.99), 8192)
@@ -0,0 +1,141 @@
+# tests/test_lote.py
+"""
+Testes do modo em lote (`lote.py`).
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from armazenamento import ArmazenamentoDuravel
+from indices import PontoStore
+from persistente import ColecaoPontos
+from cache import CacheConsultas
+from lote import ExecutorLote, ErroComando, separar_comando
+
+
+class TestLote(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Barra do Ceará', 'criticidade': 9, 'status': 'pendente'},
+            {'id': 3, 'bairro': 'Centro', 'criticidade': 2, 'status': 'resolvido'},
+        ]
+
+    def executar(self, comandos: str, pontos=None, formato='jsonl'):
+        executor = ExecutorLote(PontoStore(self.pontos_teste) if pontos is None else pontos, cache=CacheConsultas())
+        saida = io.StringIO()
+        erros = executor.executar_linhas(io.StringIO(comandos), saida, formato)
+        return executor, erros, saida.getvalue()
+
+    def test_separar_comando(self):
+        self.assertEqual(separar_comando('status 3 resolvido\n'), ['status', '3', 'resolvido'])
+        self.assertEqual(separar_comando('bairro "Barra do Ceará"  # comentário'), ['bairro', 'Barra do Ceará'])
+        self.assertEqual(separar_comando('   # só comentário'), [])
+        with self.assertRaises(ErroComando):
+            separar_comando('bairro "Barra')
+
+    def test_comandos_do_menu(self):
+        """Cada comando faz o mesmo que a opção do menu, e as escritas aparecem nas leituras seguintes."""
+        executor, erros, saida = self.executar(
+            'bairro barra do ceara\n'
+            'criticidade alto\n'
+            '\n'
+            'status 1 resolvido\n'
+            'cadastrar Vicente Pinzón 7\n'
+            'filtrar pendente\n'
+            'relatorio\n'
+            'bairros\n'
+        )
+        registros = [json.loads(linha) for linha in saida.splitlines()]
+        self.assertEqual(erros, 0)
+        self.assertEqual([r['linha'] for r in registros], [1, 2, 4, 5, 6, 7, 8])
+        self.assertEqual(registros[0]['resultado'], [self.pontos_teste[1]])
+        self.assertEqual([p['id'] for p in registros[1]['resultado']], [1, 2])
+        self.assertEqual(registros[2]['resultado']['status'], 'resolvido')
+        self.assertEqual(registros[3]['resultado'], {'id': 4, 'bairro': 'Vicente Pinzón', 'criticidade': 7, 'status': 'pendente'})
+        self.assertEqual([p['id'] for p in registros[4]['resultado']], [2, 4])
+        self.assertEqual(registros[5]['resultado']['por_bairro_e_status']['Pirambu'], {'resolvido': 1})
+        self.assertEqual(registros[6]['resultado'], ['Barra do Ceará', 'Centro', 'Pirambu', 'Vicente Pinzón'])
+
+    def test_erros_nao_interrompem_o_lote(self):
+        executor, erros, saida = self.executar(
+            'status 99 resolvido\nstatus 1 perdido\ncadastrar Centro 11\nrelatorio extra\nvoar\nbairro Centro\n',
+            formato='texto'
+        )
+        self.assertEqual(erros, 5)
+        self.assertEqual(saida.count('ERRO (linha'), 5)
+        self.assertTrue(saida.endswith('# bairro Centro\n3\tCentro\t2\tresolvido\n'))
+
+    def test_lista_comum_e_trocada_na_mudanca_de_status(self):
+        executor, erros, _ = self.executar('status 3 pendente\n', pontos=list(self.pontos_teste))
+        self.assertEqual(executor.pontos[2]['status'], 'pendente')
+        self.assertEqual(self.pontos_teste[2]['status'], 'resolvido')
+
+    def test_cadastro_em_colecao_imutavel_e_em_lista(self):
+        """Cadastrar e importar trocam a coleção pela nova devolvida, como a mudança de status."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'novos.csv')
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write("id,bairro,criticidade,status\n10,Centro,4,\n")
+            for pontos in (ColecaoPontos(self.pontos_teste), list(self.pontos_teste)):
+                executor, erros, saida = self.executar(f'cadastrar Centro 5\nimportar "{caminho}"\nbairro Centro\n',
+                                                       pontos=pontos)
+                self.assertEqual(erros, 0)
+                self.assertEqual([p['id'] for p in json.loads(saida.splitlines()[-1])['resultado']], [3, 4, 10])
+        self.assertEqual(len(self.pontos_teste), 3)
+
+    def test_erro_inesperado_da_colecao_nao_interrompe_o_lote(self):
+        """Um erro que não é `ErroComando` (aqui, um `KeyError` da coleção) vira o erro daquela linha."""
+        class PontosComDefeito(list):
+            def obter(self, id_ponto):
+                raise KeyError(id_ponto)
+
+        executor, erros, saida = self.executar('status 1 resolvido\nbairro Centro\n',
+                                               pontos=PontosComDefeito(self.pontos_teste))
+        falha, busca = [json.loads(linha) for linha in saida.splitlines()]
+        self.assertEqual(erros, 1)
+        self.assertEqual(falha['erro'], 'Erro interno: 1')
+        self.assertEqual([p['id'] for p in busca['resultado']], [3])
+
+    def test_importar(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'novos.csv')
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write("id,bairro,criticidade,status\n10,Messejana,4,\n11,Aldeota,15,pendente\n")
+            executor, erros, saida = self.executar(f'importar "{caminho}"\nbairro messejana\n')
+        importacao, busca = [json.loads(linha) for linha in saida.splitlines()]
+        self.assertEqual(importacao['resultado']['importados'], 1)
+        self.assertEqual(importacao['resultado']['invalidos'][0][0], 3)
+        self.assertEqual([p['id'] for p in busca['resultado']], [10])
+
+    def test_importar_com_id_repetido_nao_importa_nada(self):
+        """Um ID repetido no meio do arquivo (ou já cadastrado) recusa a importação inteira, também no log em disco."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'novos.csv')
+            conteudos = {
+                'no arquivo': "id,bairro,criticidade,status\n10,Messejana,4,\n11,Aldeota,5,\n10,Centro,6,\n",
+                'já cadastrado': "id,bairro,criticidade,status\n10,Messejana,4,\n3,Centro,6,\n",
+            }
+            for caso, conteudo in conteudos.items():
+                with self.subTest(caso):
+                    with open(caminho, 'w', encoding='utf-8') as arquivo:
+                        arquivo.write(conteudo)
+                    armazenamento = ArmazenamentoDuravel(os.path.join(pasta, caso))
+                    pontos = armazenamento.carregar()
+                    for ponto in self.pontos_teste:
+                        pontos.inserir(ponto)
+                    armazenamento.compactar(pontos)
+                    executor, erros, saida = self.executar(f'importar "{caminho}"\n', pontos=pontos)
+                    armazenamento.fechar()
+                    self.assertEqual(erros, 1)
+                    self.assertIn('Nada foi importado', json.loads(saida)['erro'])
+                    self.assertEqual([p['id'] for p in executor.pontos], [1, 2, 3])
+                    self.assertEqual(os.path.getsize(armazenamento.caminho_log), 0)
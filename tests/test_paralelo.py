@@ -0,0 +1,72 @@
+# tests/test_paralelo.py
+"""
+Testes da execução em vários processos (`paralelo.py`).
+
+O resultado paralelo precisa ser idêntico ao das funções sequenciais do
+`core.py`, inclusive na ordem.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import sys
+sys.path.insert(0, './src')
+
+from core import atualizar_status_pontos, gerar_relatorio_por_bairro
+from paralelo import (
+    RegraReclassificacao,
+    atualizar_status_pontos_paralelo,
+    dividir_em_blocos,
+    gerar_relatorio_por_bairro_paralelo
+)
+
+
+class TestParalelo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Um único pool para todos os testes, já que abrir processos é caro.
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def setUp(self):
+        bairros = ['Pirambu', 'Centro', 'Messejana', 'Aldeota']
+        self.pontos_teste = [
+            {'id': i, 'bairro': bairros[(i * 7) % 4], 'criticidade': i % 10 + 1,
+             'status': 'pendente' if i % 3 else 'resolvido', 'data_registro': f'2024-01-{i % 28 + 1:02d}'}
+            for i in range(1, 501)
+        ]
+
+    def test_dividir_em_blocos(self):
+        """Os blocos têm no máximo o tamanho pedido e mantêm a ordem."""
+        blocos = list(dividir_em_blocos(range(10), 4))
+        self.assertEqual(blocos, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        with self.assertRaises(ValueError):
+            list(dividir_em_blocos(range(10), 0))
+
+    def test_atualizacao_paralela_igual_a_sequencial(self):
+        """A regra aplicada em paralelo dá o mesmo resultado, na mesma ordem, que a versão sequencial."""
+        regra = RegraReclassificacao('resolvido', criticidade_abaixo_de=3, registrado_antes_de=date(2024, 1, 15))
+        esperado = atualizar_status_pontos(self.pontos_teste, regra)
+        resultado = atualizar_status_pontos_paralelo(self.pontos_teste, regra, tamanho_bloco=37,
+                                                     executor=self.executor)
+        self.assertEqual(resultado, esperado)
+        self.assertNotEqual(resultado, self.pontos_teste)
+
+    def test_relatorio_paralelo_igual_ao_sequencial(self):
+        """Somar os relatórios parciais dá o relatório completo, com os bairros na mesma ordem."""
+        resultado = gerar_relatorio_por_bairro_paralelo(self.pontos_teste, tamanho_bloco=64, executor=self.executor)
+        esperado = gerar_relatorio_por_bairro(self.pontos_teste)
+        self.assertEqual(list(resultado.items()), list(esperado.items()))
+
+    def test_regra_sem_data(self):
+        """Sem data limite, a regra olha só o status e a criticidade; com data, ignora pontos sem `data_registro`."""
+        ponto = {'id': 1, 'bairro': 'Centro', 'criticidade': 2, 'status': 'pendente'}
+        self.assertEqual(RegraReclassificacao('resolvido', 3)(ponto)['status'], 'resolvido')
+        self.assertIs(RegraReclassificacao('resolvido', 2)(ponto), ponto)
+        self.assertIs(RegraReclassificacao('resolvido', 3, registrado_antes_de=date(2030, 1, 1))(ponto), ponto)
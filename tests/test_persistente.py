@@ -0,0 +1,112 @@
+# tests/test_persistente.py
+"""
+Testes das estruturas persistentes do `persistente.py`.
+
+Além de conferir que cada estrutura se comporta como a lista ou o dicionário
+equivalente, verificamos o principal: as versões antigas nunca mudam.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    filtrar_pontos_por_bairro,
+    gerar_relatorio_por_bairro,
+    atualizar_status_em_lote,
+    gerar_proximo_id
+)
+from persistente import VetorPersistente, MapaPersistente, ColecaoPontos
+
+
+class ChaveComHashFixo:
+    """Chave de teste em que todas as instâncias têm o mesmo hash (colisão forçada)."""
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, outra):
+        return isinstance(outra, ChaveComHashFixo) and self.nome == outra.nome
+
+
+class TestVetorPersistente(unittest.TestCase):
+
+    def test_anexar_e_acessar(self):
+        """Passa pelos tamanhos em que a árvore ganha níveis novos (32, 1056, ...)."""
+        vetor = VetorPersistente()
+        for numero in range(1200):
+            vetor = vetor.anexar(numero)
+        self.assertEqual(len(vetor), 1200)
+        self.assertEqual(list(vetor), list(range(1200)))
+        self.assertEqual([vetor[i] for i in (0, 31, 32, 1055, 1056, 1199, -1)],
+                         [0, 31, 32, 1055, 1056, 1199, 1199])
+        self.assertEqual(list(VetorPersistente(range(40000))), list(range(40000)))
+
+    def test_substituir_preserva_a_versao_antiga(self):
+        """Substituir devolve um vetor novo e a versão anterior continua igual."""
+        original = VetorPersistente(range(2000))
+        novo = original.substituir(5, 'x').substituir(1999, 'y')
+        self.assertEqual(original[5], 5)
+        self.assertEqual(original[1999], 1999)
+        self.assertEqual((novo[5], novo[1999], novo[6]), ('x', 'y', 6))
+        with self.assertRaises(IndexError):
+            original.substituir(2000, 'z')
+
+
+class TestMapaPersistente(unittest.TestCase):
+
+    def test_associar_e_obter(self):
+        """O mapa se comporta como um dicionário, mas sem modificar as versões antigas."""
+        mapa = MapaPersistente({numero: numero * 2 for numero in range(5000)})
+        novo = mapa.associar(10, 'dez').associar(5000, 'novo')
+        self.assertEqual((len(mapa), len(novo)), (5000, 5001))
+        self.assertEqual((mapa[10], novo[10], novo[5000]), (20, 'dez', 'novo'))
+        self.assertNotIn(5000, mapa)
+        self.assertIsNone(mapa.obter(-1))
+        self.assertEqual(dict(novo.items())[4999], 9998)
+
+    def test_colisoes_de_hash(self):
+        """Chaves diferentes com o mesmo hash continuam separadas."""
+        a, b, c = ChaveComHashFixo('a'), ChaveComHashFixo('b'), ChaveComHashFixo('c')
+        mapa = MapaPersistente([(a, 1), (b, 2)]).associar(c, 3).associar(b, 20).associar(42, 'int')
+        self.assertEqual((mapa[a], mapa[b], mapa[c], mapa[42]), (1, 20, 3, 'int'))
+        self.assertEqual(len(mapa), 4)
+
+
+class TestColecaoPontos(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Pirambu', 'criticidade': 2, 'status': 'pendente'},
+        ]
+        self.colecao = ColecaoPontos(self.pontos_teste)
+
+    def test_funcoes_do_core_aceitam_a_colecao(self):
+        """As funções puras funcionam com a coleção do mesmo jeito que com a lista."""
+        self.assertEqual(filtrar_pontos_por_bairro(self.colecao, 'pirambu'),
+                         filtrar_pontos_por_bairro(self.pontos_teste, 'pirambu'))
+        self.assertEqual(gerar_relatorio_por_bairro(self.colecao), {'Pirambu': 2, 'Centro': 1})
+        self.assertEqual(gerar_proximo_id(self.colecao), 4)
+
+    def test_atualizacao_devolve_nova_versao(self):
+        """Cada atualização gera uma versão nova; as anteriores servem como snapshot."""
+        versao_1 = atualizar_status_em_lote(self.colecao, [(1, 'resolvido'), (99, 'resolvido')])
+        versao_2 = versao_1.inserir({'id': 4, 'bairro': 'Centro', 'criticidade': 9, 'status': 'pendente'})
+
+        self.assertIsInstance(versao_1, ColecaoPontos)
+        self.assertEqual([p['status'] for p in self.colecao], ['pendente', 'resolvido', 'pendente'])
+        self.assertEqual([p['status'] for p in versao_1], ['resolvido', 'resolvido', 'pendente'])
+        self.assertEqual((len(versao_1), len(versao_2)), (3, 4))
+        self.assertEqual(versao_2.obter(4)['bairro'], 'Centro')
+        self.assertIsNone(versao_1.obter(4))
+        # Os pontos que não mudaram são compartilhados entre as versões.
+        self.assertIs(versao_2.obter(2), self.colecao.obter(2))
+        with self.assertRaises(ValueError):
+            versao_2.inserir({'id': 4, 'bairro': 'Centro', 'criticidade': 1, 'status': 'pendente'})
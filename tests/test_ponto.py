@@ -0,0 +1,65 @@
+# tests/test_ponto.py
+"""
+Testes do tipo compacto `Ponto` (`ponto.py`).
+
+O `Ponto` precisa se comportar como o dicionário de sempre para que as
+funções do `core.py` continuem funcionando com ele.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    filtrar_pontos_por_bairro,
+    filtrar_pontos_por_criticidade,
+    criar_filtro_por_status,
+    gerar_relatorio_por_bairro
+)
+from ponto import Ponto, StatusPonto, compactar_pontos
+
+
+class TestPonto(unittest.TestCase):
+
+    def setUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': ''.join(['Pira', 'mbu']), 'criticidade': 2, 'status': 'pendente'},
+        ]
+        self.compactos = compactar_pontos(self.pontos_teste)
+
+    def test_acesso_como_dicionario(self):
+        """`ponto['campo']`, `get` e a comparação com dicionários continuam funcionando."""
+        ponto = self.compactos[0]
+        self.assertEqual(ponto['bairro'], 'Pirambu')
+        self.assertEqual(ponto['status'], 'pendente')
+        self.assertEqual(ponto.codigo_status, StatusPonto.PENDENTE)
+        self.assertIsNone(ponto.get('inexistente'))
+        self.assertEqual(ponto, self.pontos_teste[0])
+        self.assertEqual({**ponto, 'status': 'resolvido'}['status'], 'resolvido')
+        self.assertEqual(ponto.para_dict(), self.pontos_teste[0])
+
+    def test_funcoes_do_core(self):
+        """As funções do core aceitam uma lista de `Ponto` e devolvem os mesmos resultados."""
+        self.assertEqual(filtrar_pontos_por_bairro(self.compactos, 'pirambu'),
+                         filtrar_pontos_por_bairro(self.pontos_teste, 'pirambu'))
+        self.assertEqual(filtrar_pontos_por_criticidade(self.compactos, 4, 10),
+                         filtrar_pontos_por_criticidade(self.pontos_teste, 4, 10))
+        self.assertEqual(criar_filtro_por_status('resolvido')(self.compactos), [self.pontos_teste[1]])
+        self.assertEqual(gerar_relatorio_por_bairro(self.compactos), {'Pirambu': 2, 'Centro': 1})
+
+    def test_bairro_compartilhado_e_imutabilidade(self):
+        """Pontos do mesmo bairro compartilham a string; o ponto não pode ser alterado."""
+        self.assertIs(self.compactos[0]['bairro'], self.compactos[2]['bairro'])
+        with self.assertRaises(AttributeError):
+            self.compactos[0].criticidade = 1
+        novo = self.compactos[0].substituir(status='resolvido')
+        self.assertEqual((novo['status'], self.compactos[0]['status']), ('resolvido', 'pendente'))
+
+    def test_status_invalido(self):
+        """Só são aceitos os status de STATUS_VALIDOS."""
+        with self.assertRaises(ValueError):
+            Ponto(9, 'Centro', 3, 'verificado')
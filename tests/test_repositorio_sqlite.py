@@ -0,0 +1,128 @@
+# tests/test_repositorio_sqlite.py
+"""
+Testes do repositório SQLite (`repositorio_sqlite.py`).
+
+Os resultados das consultas em SQL precisam ser iguais aos das funções do
+`core.py` sobre uma lista comum.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import os
+import tempfile
+import threading
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import (
+    filtrar_pontos_por_bairro,
+    filtrar_pontos_por_criticidade,
+    criar_filtro_por_status,
+    gerar_relatorio_por_bairro,
+    gerar_relatorio_por_bairro_e_status,
+    gerar_relatorio_por_bairro_e_nivel,
+    atualizar_status_em_lote,
+    buscar_ponto_por_id,
+    listar_bairros,
+    gerar_proximo_id,
+    Consulta
+)
+from repositorio_sqlite import RepositorioSQLite
+
+
+class TestRepositorioSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Vicente Pinzón', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'pirambu', 'criticidade': 2, 'status': 'pendente'},
+            {'id': 4, 'bairro': 'VICENTE PINZÓN', 'criticidade': 7, 'status': 'em_atendimento'},
+            {'id': 5, 'bairro': 'Centro', 'criticidade': 9, 'status': 'pendente'},
+        ]
+        self.repositorio = RepositorioSQLite(os.path.join(self.pasta.name, 'pontos.db'))
+        self.repositorio.inserir_varios(self.pontos_teste)
+
+    def tearDown(self):
+        self.repositorio.fechar()
+        self.pasta.cleanup()
+
+    def test_consultas_iguais_as_da_lista(self):
+        """Filtros e relatórios feitos em SQL dão o mesmo resultado que os do core."""
+        self.assertEqual(list(self.repositorio), self.pontos_teste)
+        for bairro in ['Pirambu', 'vicente pinzón', 'Vicente Pinzon', 'Messejana']:
+            self.assertEqual(filtrar_pontos_por_bairro(self.repositorio, bairro),
+                             filtrar_pontos_por_bairro(self.pontos_teste, bairro))
+        for faixa in [(1, 3), (4, 7), (8, 10)]:
+            self.assertEqual(filtrar_pontos_por_criticidade(self.repositorio, *faixa),
+                             filtrar_pontos_por_criticidade(self.pontos_teste, *faixa))
+        filtro = criar_filtro_por_status('pendente')
+        self.assertEqual(filtro(self.repositorio), filtro(self.pontos_teste))
+        self.assertEqual(listar_bairros(self.repositorio), listar_bairros(self.pontos_teste))
+        for relatorio in [gerar_relatorio_por_bairro, gerar_relatorio_por_bairro_e_status,
+                          gerar_relatorio_por_bairro_e_nivel]:
+            self.assertEqual(relatorio(self.repositorio), relatorio(self.pontos_teste))
+        self.assertEqual(list(gerar_relatorio_por_bairro(self.repositorio)),
+                         list(gerar_relatorio_por_bairro(self.pontos_teste)))
+
+    def test_consultas_usam_indices(self):
+        """O SQLite escolhe os índices de bairro, status e criticidade."""
+        with self.repositorio._leitura() as conexao:
+            for sql, indice in [
+                ("SELECT * FROM pontos WHERE bairro = 'x' COLLATE BAIRRO", 'idx_pontos_bairro'),
+                ("SELECT * FROM pontos WHERE status = 'pendente'", 'idx_pontos_status'),
+                ("SELECT * FROM pontos WHERE criticidade BETWEEN 1 AND 3", 'idx_pontos_criticidade'),
+            ]:
+                plano = ' '.join(linha[-1] for linha in conexao.execute("EXPLAIN QUERY PLAN " + sql))
+                self.assertIn(indice, plano)
+
+    def test_consulta_executada_em_sql(self):
+        """A `Consulta` inteira vira um único SELECT, com o mesmo resultado da lista."""
+        consultas = [
+            Consulta(bairro='PIRAMBU', status='pendente'),
+            Consulta(status='pendente', criticidade=(5, 10)).ordenar_por('criticidade', decrescente=True),
+            Consulta().ordenar_por('bairro').limitar(3),
+            Consulta(bairro='vicente pinzón').com_criticidade(1, 6),
+        ]
+        for consulta in consultas:
+            self.assertEqual(consulta.executar(self.repositorio), consulta.executar(self.pontos_teste))
+            self.assertEqual(list(consulta.iterar(self.repositorio)), consulta.executar(self.pontos_teste))
+
+    def test_escritas_em_lote(self):
+        """Atualizações em lote, geração de ID e IDs repetidos."""
+        resultado = atualizar_status_em_lote(self.repositorio, [(1, 'resolvido'), (3, 'resolvido'), (99, 'x')])
+        self.assertIs(resultado, self.repositorio)
+        self.assertEqual(buscar_ponto_por_id(self.repositorio, 3)['status'], 'resolvido')
+        self.assertIsNone(buscar_ponto_por_id(self.repositorio, 99))
+        self.assertEqual(gerar_proximo_id(self.repositorio), 6)
+        with self.assertRaises(ValueError):
+            self.repositorio.inserir({'id': 1, 'bairro': 'Centro', 'criticidade': 1, 'status': 'pendente'})
+        self.assertEqual(len(self.repositorio), 5)
+
+    def test_versao_muda_depois_do_commit(self):
+        """O cache só pode ver a versão nova quando as linhas novas já estão visíveis para os leitores."""
+        versoes = {}
+        self.repositorio._escrita.set_trace_callback(
+            lambda comando: versoes.setdefault(comando.split()[0].upper(), self.repositorio.versao))
+        versao_inicial = self.repositorio.versao
+        atualizar_status_em_lote(self.repositorio, [(1, 'resolvido')])
+        self.repositorio.inserir({'id': 6, 'bairro': 'Centro', 'criticidade': 1, 'status': 'pendente'})
+        self.assertEqual(versoes['COMMIT'], versao_inicial)
+        self.assertEqual(self.repositorio.versao, versao_inicial + 2)
+
+    def test_leituras_concorrentes(self):
+        """Várias threads podem consultar ao mesmo tempo usando o pool de conexões."""
+        resultados = []
+
+        def consultar():
+            for _ in range(20):
+                resultados.append(len(filtrar_pontos_por_bairro(self.repositorio, 'pirambu')))
+
+        threads = [threading.Thread(target=consultar) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(resultados, [2] * 160)
@@ -0,0 +1,134 @@
+# tests/test_servidor.py
+"""
+Testes do servidor HTTP/JSON (`servidor.py`).
+
+O servidor sobe numa porta livre e as requisições são feitas "na mão", com
+os bytes do HTTP, para testar também o keep-alive e o pipelining.
+"""
+# script para utilizar no terminal para realizar o teste "python -m unittest discover tests"
+
+import asyncio
+import json
+import threading
+import unittest
+
+import sys
+sys.path.insert(0, './src')
+
+from core import gerar_relatorio_por_bairro
+from indices import PontoStore
+from persistente import ColecaoPontos
+from servidor import ServidorDescarte
+
+
+def montar_requisicao(metodo: str, alvo: str, dados=None) -> bytes:
+    corpo = json.dumps(dados).encode('utf-8') if dados is not None else b''
+    return (f"{metodo} {alvo} HTTP/1.1\r\nHost: teste\r\nContent-Length: {len(corpo)}\r\n\r\n").encode() + corpo
+
+
+async def ler_resposta(leitor: asyncio.StreamReader):
+    """Retorna `(status, dados)` de uma resposta."""
+    status = int((await leitor.readline()).split()[1])
+    cabecalhos = {}
+    while (linha := await leitor.readline()) != b'\r\n':
+        nome, _, valor = linha.decode().partition(':')
+        cabecalhos[nome.lower()] = valor.strip()
+    return status, json.loads(await leitor.readexactly(int(cabecalhos['content-length'])))
+
+
+class TestServidorDescarte(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.pontos_teste = [
+            {'id': 1, 'bairro': 'Pirambu', 'criticidade': 8, 'status': 'pendente'},
+            {'id': 2, 'bairro': 'Centro', 'criticidade': 5, 'status': 'resolvido'},
+            {'id': 3, 'bairro': 'Vicente Pinzón', 'criticidade': 2, 'status': 'pendente'},
+        ]
+        self.servidor = ServidorDescarte(PontoStore(self.pontos_teste), max_concorrencia=4)
+        self.asyncio_servidor = await self.servidor.iniciar('127.0.0.1', 0)
+        self.porta = self.asyncio_servidor.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.asyncio_servidor.close()
+        await self.asyncio_servidor.wait_closed()
+
+    async def requisitar(self, metodo: str, alvo: str, dados=None):
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', self.porta)
+        escritor.write(montar_requisicao(metodo, alvo, dados))
+        resposta = await ler_resposta(leitor)
+        escritor.close()
+        return resposta
+
+    async def test_leituras(self):
+        """Filtros (combináveis), relatório e bairros respondem como as funções do core."""
+        self.assertEqual(await self.requisitar('GET', '/pontos?bairro=vicente%20pinzon'), (200, [self.pontos_teste[2]]))
+        status, pontos = await self.requisitar('GET', '/pontos?status=pendente&nivel=alto')
+        self.assertEqual([p['id'] for p in pontos], [1])
+        status, relatorio = await self.requisitar('GET', '/relatorio')
+        self.assertEqual(relatorio['por_bairro'], {'Pirambu': 1, 'Centro': 1, 'Vicente Pinzón': 1})
+        self.assertEqual(await self.requisitar('GET', '/bairros?prefixo=pinz'), (200, ['Vicente Pinzón']))
+        self.assertEqual((await self.requisitar('GET', '/pontos?nivel=altissimo'))[0], 400)
+        self.assertEqual((await self.requisitar('GET', '/pontos/99'))[0], 404)
+        self.assertEqual((await self.requisitar('DELETE', '/pontos'))[0], 405)
+
+    async def test_pipelining(self):
+        """Várias requisições enviadas de uma vez na mesma conexão voltam na ordem."""
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', self.porta)
+        escritor.write(b''.join(montar_requisicao('GET', f'/pontos/{id_ponto}') for id_ponto in [3, 1, 2, 1]))
+        respostas = [await ler_resposta(leitor) for _ in range(4)]
+        escritor.close()
+        self.assertEqual([dados['id'] for _, dados in respostas], [3, 1, 2, 1])
+
+    async def test_escritas(self):
+        """Cadastros simultâneos recebem IDs diferentes, e uma mudança de status aparece na leitura seguinte."""
+        self.assertEqual((await self.requisitar('GET', '/pontos?status=pendente'))[0], 200)
+        cadastros = await asyncio.gather(*[
+            self.requisitar('POST', '/pontos', {'bairro': 'Centro', 'criticidade': 3}) for _ in range(10)
+        ])
+        self.assertEqual(sorted(dados['id'] for _, dados in cadastros), list(range(4, 14)))
+        self.assertEqual({status for status, _ in cadastros}, {201})
+
+        self.assertEqual((await self.requisitar('POST', '/pontos/1/status', {'status': 'resolvido'}))[1]['status'],
+                         'resolvido')
+        status, pendentes = await self.requisitar('GET', '/pontos?status=pendente&bairro=pirambu')
+        self.assertEqual(pendentes, [])
+        self.assertEqual((await self.requisitar('POST', '/pontos/1/status', {'status': 'x'}))[0], 400)
+        self.assertEqual((await self.requisitar('POST', '/pontos', {'bairro': '', 'criticidade': 11}))[0], 400)
+
+    async def test_leituras_simultaneas_compartilham_calculo(self):
+        """Relatórios pedidos ao mesmo tempo são calculados uma vez só."""
+        respostas = await asyncio.gather(*[self.requisitar('GET', '/relatorio') for _ in range(8)])
+        self.assertEqual(len({json.dumps(dados) for _, dados in respostas}), 1)
+        self.assertEqual(self.servidor.cache.falhas, 2)  # um cálculo para cada relatório da resposta
+
+    async def test_cadastro_em_colecao_imutavel(self):
+        """Numa `ColecaoPontos`, o servidor passa a usar a coleção nova devolvida pelo cadastro."""
+        self.servidor.pontos = ColecaoPontos(self.pontos_teste)
+        status, ponto = await self.requisitar('POST', '/pontos', {'bairro': 'Centro', 'criticidade': 3})
+        self.assertEqual((status, ponto['id']), (201, 4))
+        status, pontos = await self.requisitar('GET', '/pontos?bairro=centro')
+        self.assertEqual([p['id'] for p in pontos], [2, 4])
+
+    async def test_leituras_de_colecoes_diferentes_nao_se_misturam(self):
+        """Uma leitura em andamento não é reaproveitada depois que a coleção foi trocada."""
+        lista = list(self.pontos_teste)
+        self.servidor.pontos = lista
+        primeira = asyncio.ensure_future(self.servidor._ler(gerar_relatorio_por_bairro))
+        await asyncio.sleep(0)
+        self.servidor.pontos = lista[:1]  # nenhuma das duas tem `versao`
+        self.assertEqual(await self.servidor._ler(gerar_relatorio_por_bairro), {'Pirambu': 1})
+        self.assertEqual(len(await primeira), 3)
+
+    async def test_sincronizacao_fora_do_loop(self):
+        """Com um armazenamento em disco, o `fsync` de cada escrita roda numa thread."""
+        threads = []
+
+        class Armazenamento:
+            def sincronizar(self):
+                threads.append(threading.current_thread())
+
+        self.servidor.armazenamento = Armazenamento()
+        await self.requisitar('POST', '/pontos', {'bairro': 'Centro', 'criticidade': 3})
+        await self.requisitar('POST', '/pontos/1/status', {'status': 'resolvido'})
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.main_thread(), threads)